@@ -0,0 +1,188 @@
+"""Local response cache for SAPI GET requests.
+
+Entries are keyed by endpoint + canonical query params and hold the parsed
+JSON body together with the ETag the server returned. Fresh entries skip the
+network entirely; stale entries are revalidated with a conditional GET.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Query params as a mapping or as (key, value) pairs; httpx accepts both.
+# Pairs let a caller keep a run's params as one tuple and append a cursor
+# without rebuilding a dict per request. Keys are expected to be unique.
+QueryParamsLike = Mapping[str, Any] | Sequence[tuple[str, Any]]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached SAPI response.
+
+    Attributes:
+        payload (dict): The parsed JSON body.
+        etag (str | None): ETag header returned with the body, if any.
+        stored_at (float): Epoch seconds when the body was (re)validated.
+    """
+
+    payload: dict
+    etag: str | None
+    stored_at: float
+
+
+class SapiResponseCache:
+    """Disk-backed cache of parsed SAPI responses.
+
+    Parsed payloads are also memoized in-process so repeated hits do not
+    re-read or re-parse the file. The memo keeps the most recently used
+    ``max_memo_entries`` entries; older ones are dropped (they stay on disk).
+
+    Attributes:
+        directory (Path): Where cache entries are written, one file per key.
+        expire_after (float): Seconds an entry is served without revalidation.
+        version (str): Mixed into every key; bump it to invalidate the cache.
+        max_memo_entries (int): Upper bound on in-process memoized entries.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        expire_after: float = 3600,
+        version: str = "v4",
+        max_memo_entries: int = 1024,
+    ):
+        """Initializes the cache and creates its directory if missing.
+
+        Args:
+            directory: Filesystem location for cache entries.
+            expire_after: Freshness window in seconds.
+            version: API version tag included in cache keys.
+            max_memo_entries: LRU bound on parsed entries kept in memory.
+        """
+
+        self.directory = Path(directory)
+        self.expire_after = expire_after
+        self.version = version
+        self.max_memo_entries = max(1, max_memo_entries)
+        self._memo: OrderedDict[str, CachedResponse] = OrderedDict()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, endpoint: str, query_params: QueryParamsLike) -> str:
+        """Builds the stable cache key for a request.
+
+        Args:
+            endpoint: The API path.
+            query_params: URL parameters, as a mapping or (key, value) pairs.
+
+        Returns:
+            str: Hex SHA-256 of version, endpoint and sorted params.
+        """
+
+        # dict() makes the mapping and pair forms of the same params share a key.
+        params = json.dumps(dict(query_params), sort_keys=True, default=str)
+        raw = f"{self.version}|/{endpoint.lstrip('/')}|{params}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, endpoint: str, query_params: QueryParamsLike) -> CachedResponse | None:
+        """Returns the cached entry for a request, fresh or stale.
+
+        Args:
+            endpoint: The API path.
+            query_params: URL parameters, as a mapping or (key, value) pairs.
+
+        Returns:
+            CachedResponse | None: The entry, or None on a miss.
+        """
+
+        key = self.key(endpoint, query_params)
+        entry = self._memo.get(key)
+        if entry is not None:
+            self._memo.move_to_end(key)
+            return entry
+
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                doc = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("SAPI_CACHE_READ_FAILED key=%s error=%s", key, str(e))
+            return None
+
+        entry = CachedResponse(
+            payload=doc["payload"], etag=doc.get("etag"), stored_at=doc["stored_at"]
+        )
+        self._remember(key, entry)
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Tells whether an entry can be served without revalidation."""
+
+        return (time.time() - entry.stored_at) < self.expire_after
+
+    def set(
+        self,
+        endpoint: str,
+        query_params: QueryParamsLike,
+        payload: dict,
+        etag: str | None = None,
+    ) -> CachedResponse:
+        """Stores (or refreshes) the entry for a request.
+
+        Args:
+            endpoint: The API path.
+            query_params: URL parameters, as a mapping or (key, value) pairs.
+            payload: The parsed JSON body.
+            etag: ETag header returned with the body, if any.
+
+        Returns:
+            CachedResponse: The stored entry.
+        """
+
+        key = self.key(endpoint, query_params)
+        entry = CachedResponse(payload=payload, etag=etag, stored_at=time.time())
+        self._remember(key, entry)
+        self._write(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        """Memoizes an entry as most recently used, evicting the oldest past the cap."""
+
+        self._memo[key] = entry
+        self._memo.move_to_end(key)
+        if len(self._memo) > self.max_memo_entries:
+            self._memo.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        """Writes an entry atomically so readers never see partial files."""
+
+        doc: dict[str, Any] = {
+            "payload": entry.payload,
+            "etag": entry.etag,
+            "stored_at": entry.stored_at,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(doc, f, separators=(",", ":"))
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            logger.warning("SAPI_CACHE_WRITE_FAILED key=%s error=%s", key, str(e))
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
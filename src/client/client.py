@@ -4,87 +4,540 @@ This module implements the adapter pattern to handle authentication,
 request building, and telemetry for SAPI endpoints.
 """
 
+import asyncio
 import logging
+import threading
 import time
-import requests
-from src.config import SAPI_RETRY_POLICY
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import httpx
+import ijson
+import orjson
+from src.client.cache import QueryParamsLike, SapiResponseCache
+from src.client.stats import REQUEST_STATS
+from src.config import async_retrying, sapi_retry
 
 logger = logging.getLogger(__name__)
 
+# Sized for bursts of SAPI calls against a single host. Over HTTP/2 one
+# connection already multiplexes concurrent requests, so this is an upper
+# bound, not a target. Retries are owned by the tenacity policy.
+POOL_MAXSIZE = 64
+
+
+@dataclass(frozen=True)
+class FetchedPage:
+    """A parsed SAPI response together with the body it was parsed from.
+
+    Attributes:
+        payload (dict): The parsed JSON response.
+        content (bytes | None): The raw response body, or None when the
+            payload was served from the response cache.
+    """
+
+    payload: dict
+    content: bytes | None
+
+
+@dataclass(frozen=True)
+class ConditionalFetch:
+    """Result of a conditional GET.
+
+    Attributes:
+        payload (dict | None): Parsed body, or None if the server replied 304.
+        etag (str | None): Validator to send next time as If-None-Match.
+        last_modified (str | None): Validator to send next time as
+            If-Modified-Since.
+        content (bytes | None): Raw body ``payload`` was parsed from, or
+            None for a 304.
+    """
+
+    payload: dict | None
+    etag: str | None
+    last_modified: str | None
+    content: bytes | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.payload is None
+
 
 class SapiClient:
     """Client for interacting with the Streaming Availability API.
 
     Attributes:
-        session (requests.Session): Persistent session for HTTP requests.
+        session (httpx.Client): Persistent HTTP/2 client for SAPI requests.
         base_url (str): The root URL for the SAPI service.
+        cache (SapiResponseCache | None): Optional local response cache.
     """
 
-    def __init__(self, api_key: str, api_host: str, base_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        api_host: str,
+        base_url: str,
+        cache: SapiResponseCache | None = None,
+        *,
+        transport: httpx.BaseTransport | None = None,
+    ):
         """Initializes the SapiClient with RapidAPI credentials.
 
         Args:
             api_key: The x-rapidapi-key secret.
             api_host: The x-rapidapi-host hostname.
             base_url: The base URL for the API.
+            cache: Optional response cache. When set, fresh entries are
+                served locally and stale ones are revalidated by ETag.
+            transport: Optional httpx transport override (used by tests).
         """
 
-        self.session = requests.Session()
         self.base_url = base_url.rstrip("/")
+        self.cache = cache
 
-        self.session.headers.update(
-            {"x-rapidapi-key": api_key, "x-rapidapi-host": api_host}
+        # HTTP/2 with keep-alive: one TLS session is reused across pages, and
+        # a prefetch can share the connection with an in-flight request.
+        self.session = httpx.Client(
+            headers={"x-rapidapi-key": api_key, "x-rapidapi-host": api_host},
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_MAXSIZE
+            ),
+            transport=transport,
         )
 
         logger.info("SapiClient initialized with base_url=%s", self.base_url)
 
-    @SAPI_RETRY_POLICY
-    def fetch_data(self, endpoint: str, query_params: dict) -> dict:
+    def __enter__(self) -> "SapiClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying connection pool."""
+
+        self.session.close()
+
+    def fetch_data(self, endpoint: str, query_params: QueryParamsLike) -> dict:
         """Fetches and parses JSON data from a specific SAPI endpoint.
 
-        This method is wrapped by a retry policy to handle transient
-        network and server-side errors automatically.
+        Retries and caching behave as in fetch_page.
 
         Args:
             endpoint: The API path (e.g., '/shows/search/filters').
-            query_params: Dictionary of URL parameters for the request.
+            query_params: URL parameters, as a mapping or (key, value) pairs.
 
         Returns:
             dict: The parsed JSON response from the server.
 
         Raises:
-            requests.exceptions.RequestException: If the request fails
-                after all retry attempts are exhausted.
+            httpx.HTTPError: If the request fails after all retry
+                attempts are exhausted.
+            orjson.JSONDecodeError: If the body is not valid JSON.
+        """
+
+        return self.fetch_page(endpoint, query_params).payload
+
+    @sapi_retry
+    def fetch_page(self, endpoint: str, query_params: QueryParamsLike) -> FetchedPage:
+        """Fetches a SAPI response and keeps the raw body alongside the parse.
+
+        This method is wrapped by a retry policy to handle transient
+        network and server-side errors automatically. With a cache
+        configured, a fresh entry is returned without a request, and a
+        stale one is revalidated via If-None-Match (a 304 returns it as-is).
+
+        Args:
+            endpoint: The API path (e.g., '/shows/search/filters').
+            query_params: URL parameters, as a mapping or (key, value) pairs.
+
+        Returns:
+            FetchedPage: The parsed JSON and, unless it came from the cache,
+                the body bytes exactly as received.
+
+        Raises:
+            httpx.HTTPError: If the request fails after all retry
+                attempts are exhausted.
+            orjson.JSONDecodeError: If the body is not valid JSON.
+        """
+
+        cached = (
+            self.cache.get(endpoint, query_params) if self.cache is not None else None
+        )
+        if cached is not None and self.cache.is_fresh(cached):
+            logger.debug("SAPI_CACHE_HIT endpoint=%s", endpoint)
+            return FetchedPage(payload=cached.payload, content=None)
+
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        response, payload = self._request(endpoint, query_params, headers)
+
+        if payload is None:
+            if cached is None:
+                raise httpx.HTTPStatusError(
+                    "304 Not Modified without a cached body",
+                    request=response.request,
+                    response=response,
+                )
+            logger.info("SAPI_CACHE_REVALIDATED endpoint=%s", endpoint)
+            self.cache.set(endpoint, query_params, cached.payload, cached.etag)
+            return FetchedPage(payload=cached.payload, content=None)
+
+        if self.cache is not None:
+            self.cache.set(endpoint, query_params, payload, response.headers.get("ETag"))
+
+        return FetchedPage(payload=payload, content=response.content)
+
+    @sapi_retry
+    def fetch_if_changed(
+        self,
+        endpoint: str,
+        query_params: QueryParamsLike,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> ConditionalFetch:
+        """Issues a conditional GET using validators from a previous fetch.
+
+        Sends If-None-Match / If-Modified-Since when given, so an unchanged
+        resource comes back as an empty 304 instead of a full body. The
+        response cache is not consulted; the caller owns the validators.
+
+        Args:
+            endpoint: The API path (e.g., '/shows/{id}').
+            query_params: URL parameters, as a mapping or (key, value) pairs.
+            etag: ETag returned by the previous fetch, if any.
+            last_modified: Last-Modified returned by the previous fetch, if any.
+
+        Returns:
+            ConditionalFetch: ``payload`` is None when the server replied 304.
+
+        Raises:
+            httpx.HTTPError: If the request fails after all retry
+                attempts are exhausted.
+        """
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response, payload = self._request(endpoint, query_params, headers)
+
+        if payload is None:
+            return ConditionalFetch(payload=None, etag=etag, last_modified=last_modified)
+
+        return ConditionalFetch(
+            payload=payload,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content=response.content,
+        )
+
+    def _request(
+        self, endpoint: str, query_params: QueryParamsLike, headers: dict
+    ) -> tuple[httpx.Response, dict | None]:
+        """Issues one GET with telemetry and parses the body.
+
+        Returns:
+            tuple: The response and its parsed JSON, or None for a 304.
         """
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        start_ts = time.perf_counter()
+        with REQUEST_STATS.measure(endpoint) as timer:
+            try:
+                logger.debug(
+                    "SAPI_REQUEST_START endpoint=%s params=%s", endpoint, query_params
+                )
+                response = self.session.get(url, params=query_params, headers=headers)
+
+                if response.status_code == 304:
+                    logger.debug("SAPI_REQUEST_NOT_MODIFIED endpoint=%s", endpoint)
+                    return response, None
 
+                response.raise_for_status()
+                logger.debug(
+                    "SAPI_REQUEST_SUCCESS endpoint=%s status=%s",
+                    endpoint,
+                    response.status_code,
+                )
+
+                # orjson parses straight from the body bytes, skipping the str decode.
+                return response, orjson.loads(response.content)
+
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                logger.error(
+                    "SAPI_REQUEST_FAILED endpoint=%s latency_ms=%.2f error=%s",
+                    endpoint,
+                    timer.elapsed_ms,
+                    str(e),
+                )
+
+                raise
+
+    def iter_shows(
+        self, endpoint: str, query_params: QueryParamsLike
+    ) -> Iterator[dict]:
+        """Streams the ``shows`` array of a SAPI list response one item at a time.
+
+        Unlike fetch_data, the page is never materialized: the body is parsed
+        incrementally, so peak memory is bounded by a single show. The retry
+        policy covers opening the stream (connect + status); once items start
+        flowing a mid-body failure propagates to the caller. The response
+        cache is not consulted.
+
+        Args:
+            endpoint: The API path (e.g., '/shows/search/filters').
+            query_params: URL parameters, as a mapping or (key, value) pairs.
+
+        Yields:
+            dict: One show item at a time.
+        """
+
+        response = self._open_stream(endpoint, query_params)
         try:
-            logger.debug(
-                "SAPI_REQUEST_START endpoint=%s params=%s", endpoint, query_params
-            )
-            response = self.session.get(url, params=query_params)
-            response.raise_for_status()
+            # Push parser: decoded body chunks go in, completed shows come out.
+            shows = ijson.sendable_list()
+            parser = ijson.items_coro(shows, "shows.item", use_float=True)
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                yield from shows
+                del shows[:]
+            parser.close()
+            yield from shows
+        finally:
+            response.close()
 
-            duration = (time.perf_counter() - start_ts) * 1000
-            logger.info(
-                "SAPI_REQUEST_SUCESS endpoint=%s status=%s latency_ms=%.2f",
-                endpoint,
-                response.status_code,
-                duration,
-            )
-
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            duration = (time.perf_counter() - start_ts) * 1000
-            logger.error(
-                "SAPI_REQUEST_FAILED endpoint=%s latency_ms=%.2f error=%s",
-                endpoint,
-                duration,
-                str(e),
-            )
+    @sapi_retry
+    def _open_stream(
+        self, endpoint: str, query_params: QueryParamsLike
+    ) -> httpx.Response:
+        """Opens a streamed GET and validates its status without reading the body."""
 
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        logger.debug(
+            "SAPI_STREAM_START endpoint=%s params=%s", endpoint, query_params
+        )
+        response = None
+        try:
+            request = self.session.build_request("GET", url, params=query_params)
+            response = self.session.send(request, stream=True)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            if response is not None:
+                response.close()
+            logger.error("SAPI_STREAM_FAILED endpoint=%s error=%s", endpoint, str(e))
             raise
+
+        return response
+
+
+_DEFAULT_CLIENT: SapiClient | None = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def get_client() -> SapiClient:
+    """Returns the process-wide SapiClient, creating it on first use.
+
+    The client is built once from SapiHttpSettings, so every caller in the
+    process shares one session and its pool of warm connections.
+
+    Returns:
+        SapiClient: The shared client.
+    """
+
+    global _DEFAULT_CLIENT
+
+    if _DEFAULT_CLIENT is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT is None:
+                # Imported here so pydantic-settings loads only when needed.
+                from src.config.sapi_settings import SapiHttpSettings
+
+                settings = SapiHttpSettings()
+                _DEFAULT_CLIENT = SapiClient(
+                    api_key=settings.rapidapi_key,
+                    api_host=settings.rapidapi_host,
+                    base_url=settings.sapi_base_url,
+                )
+
+    return _DEFAULT_CLIENT
+
+
+class AsyncSapiClient:
+    """Async client for issuing many SAPI requests concurrently.
+
+    SAPI calls are I/O-bound, so overlapping them on one event loop gives
+    near-linear speedup up to the server's concurrency limit. Only the
+    top-level entrypoint should call ``asyncio.run``; everything below it
+    awaits the coroutines.
+
+    Attributes:
+        base_url (str): The root URL for the SAPI service.
+        max_concurrency (int): Upper bound on in-flight requests in fetch_many.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_host: str,
+        base_url: str,
+        *,
+        max_concurrency: int = 50,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initializes the AsyncSapiClient with RapidAPI credentials.
+
+        Args:
+            api_key: The x-rapidapi-key secret.
+            api_host: The x-rapidapi-host hostname.
+            base_url: The base URL for the API.
+            max_concurrency: Max requests in flight at once in fetch_many.
+            transport: Optional httpx transport override (used by tests).
+        """
+
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+
+        # The client is bound to the event loop it is first used on, so it
+        # lives on the instance rather than at module level.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"x-rapidapi-key": api_key, "x-rapidapi-host": api_host},
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            transport=transport,
+        )
+
+        logger.info("AsyncSapiClient initialized with base_url=%s", self.base_url)
+
+    async def __aenter__(self) -> "AsyncSapiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the underlying connection pool."""
+
+        await self._client.aclose()
+
+    async def fetch_data(self, endpoint: str, query_params: dict) -> dict:
+        """Fetches and parses JSON data from a specific SAPI endpoint.
+
+        Retries follow the same policy as SapiClient.fetch_data, but the
+        waits between attempts are awaited instead of blocking.
+
+        Args:
+            endpoint: The API path (e.g., '/shows/search/filters').
+            query_params: Dictionary of URL parameters for the request.
+
+        Returns:
+            dict: The parsed JSON response from the server.
+
+        Raises:
+            httpx.HTTPError: If the request fails after all retry attempts
+                are exhausted.
+        """
+
+        async for attempt in async_retrying():
+            with attempt:
+                return await self._fetch_once(endpoint, query_params)
+
+    async def fetch_many(
+        self, jobs: Iterable[tuple[str, dict]]
+    ) -> list[dict | BaseException]:
+        """Fetches several (endpoint, query_params) jobs concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once.
+
+        Args:
+            jobs: Iterable of (endpoint, query_params) pairs.
+
+        Returns:
+            list: One entry per job, in input order. Each entry is either the
+                parsed JSON response or the exception that job raised.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(endpoint: str, query_params: dict) -> dict:
+            async with semaphore:
+                return await self.fetch_data(endpoint, query_params)
+
+        return await asyncio.gather(
+            *[_bounded(endpoint, params) for endpoint, params in jobs],
+            return_exceptions=True,
+        )
+
+    async def fetch_batch(self, endpoint: str, params_list: list[dict]) -> list[dict]:
+        """Fetches one endpoint for many parameter sets as a single batch.
+
+        SAPI has no multi-ID endpoint, so the batch is fanned out through
+        fetch_many and reported as one aggregated log line. Total latency is
+        bounded by the slowest sub-request rather than their sum.
+
+        Args:
+            endpoint: The API path shared by every sub-request.
+            params_list: One query-params dict per sub-request.
+
+        Returns:
+            list[dict]: Parsed responses aligned with ``params_list``.
+
+        Raises:
+            httpx.HTTPError: The first sub-request failure, after every
+                sub-request has finished.
+        """
+
+        start_ts = time.perf_counter()
+        results = await self.fetch_many([(endpoint, p) for p in params_list])
+        failures = [r for r in results if isinstance(r, BaseException)]
+
+        duration = (time.perf_counter() - start_ts) * 1000
+        logger.info(
+            "SAPI_BATCH_DONE endpoint=%s requests=%d failed=%d latency_ms=%.2f",
+            endpoint,
+            len(results),
+            len(failures),
+            duration,
+        )
+
+        if failures:
+            raise failures[0]
+
+        return results
+
+    async def _fetch_once(self, endpoint: str, query_params: dict) -> dict:
+        """Issues a single GET without retries."""
+
+        path = f"/{endpoint.lstrip('/')}"
+
+        with REQUEST_STATS.measure(endpoint) as timer:
+            try:
+                logger.debug(
+                    "SAPI_REQUEST_START endpoint=%s params=%s", endpoint, query_params
+                )
+                response = await self._client.get(path, params=query_params)
+                response.raise_for_status()
+                logger.debug(
+                    "SAPI_REQUEST_SUCCESS endpoint=%s status=%s",
+                    endpoint,
+                    response.status_code,
+                )
+
+                return orjson.loads(response.content)
+
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                logger.error(
+                    "SAPI_REQUEST_FAILED endpoint=%s latency_ms=%.2f error=%s",
+                    endpoint,
+                    timer.elapsed_ms,
+                    str(e),
+                )
+
+                raise
@@ -3,15 +3,31 @@
 # OfferIndexRecord
 # AssetIndexRecord
 # No persistence. No business logic. Pure mapping.
+#
+# The mapping below shapes every field itself; records are plain slotted
+# dataclasses, so there is no per-field validation cost on this hot path.
 
 import datetime
 from src.persistence.models import (
+    AssetKind,
+    Locale,
+    Subtitle,
     SapiTitleIndexRecord,
     SapiOfferIndexRecord,
     SapiAssetIndexRecord,
 )
 
 
+def _locale(raw: dict) -> Locale:
+    return Locale(language=raw["language"], region=raw.get("region"))
+
+
+def _subtitle(raw: dict) -> Subtitle:
+    return Subtitle(
+        closed_captions=raw["closedCaptions"], locale=_locale(raw["locale"])
+    )
+
+
 def _map_title(
     raw_json: dict, fetched_at: datetime, run_id: str
 ) -> SapiTitleIndexRecord:
@@ -64,8 +80,8 @@ def _map_offers(
                     title_page_link=offer["link"],
                     watch_link=offer.get("videoLink"),
                     quality=offer.get("quality"),
-                    audios=offer.get("audios", []),  # Maps to list[Locale]
-                    subtitles=offer.get("subtitles", []),  # Maps to list[Subtitle]
+                    audios=[_locale(a) for a in offer.get("audios", [])],
+                    subtitles=[_subtitle(s) for s in offer.get("subtitles", [])],
                     available_since=offer["availableSince"],
                     expires_soon=offer["expiresSoon"],
                     expires_on=offer.get("expiresOn"),
@@ -96,7 +112,7 @@ def _map_assets(
         records.append(
             SapiAssetIndexRecord(
                 sapi_id=sapi_id,
-                asset_kind=kind,  # e.g., "verticalPoster", "horizontalBackdrop"
+                asset_kind=AssetKind(kind),  # e.g., "verticalPoster", "horizontalBackdrop"
                 image_urls=urls,  # The dict of { "w240": "url...", "w360": "url..." }
                 fetched_at=fetched_at,
                 last_seen_run_id=run_id,
@@ -127,3 +143,38 @@ def extract_show(
         _map_offers(raw_json, fetched_at, run_id),
         _map_assets(raw_json, fetched_at, run_id),
     )
+
+
+def extract_shows_batch(
+    shows: list[dict], fetched_at: datetime, run_id: str
+) -> tuple[
+    list[SapiTitleIndexRecord], list[SapiOfferIndexRecord], list[SapiAssetIndexRecord]
+]:
+    """
+    Extract a whole page of shows in one pass, into three flat lists.
+
+    Same records as calling extract_show per show, without building a tuple
+    per show or flattening afterwards; the titles list is sized up front and
+    the mappers are bound to locals.
+
+    Args:
+        shows: The 'shows' list of a SAPI search response.
+        fetched_at: Timestamp of when the SAPI response was received.
+        run_id: Unique identifier for the current extraction pipeline run.
+
+    Returns:
+        A tuple of (TitleRecords, OfferRecords, AssetRecords).
+    """
+    titles: list = [None] * len(shows)
+    offers: list[SapiOfferIndexRecord] = []
+    assets: list[SapiAssetIndexRecord] = []
+
+    map_title, map_offers, map_assets = _map_title, _map_offers, _map_assets
+    extend_offers, extend_assets = offers.extend, assets.extend
+
+    for i, raw_json in enumerate(shows):
+        titles[i] = map_title(raw_json, fetched_at, run_id)
+        extend_offers(map_offers(raw_json, fetched_at, run_id))
+        extend_assets(map_assets(raw_json, fetched_at, run_id))
+
+    return titles, offers, assets
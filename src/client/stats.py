@@ -0,0 +1,146 @@
+"""Aggregated request telemetry for SAPI clients.
+
+Per-request INFO lines become a measurable cost (formatter, handler lock,
+stream write) on bursts of thousands of calls. Instead, requests are timed
+into a per-endpoint aggregate and summarized as one SAPI_REQUEST_STATS line
+per endpoint every ``interval_s`` seconds and at interpreter exit. Failures
+are still logged per call by the clients.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTimer:
+    """Elapsed-time handle yielded by StatsAggregator.measure."""
+
+    __slots__ = ("_start",)
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._start) * 1000
+
+
+class _EndpointStats:
+    __slots__ = ("ok", "failed", "total_ms", "max_ms", "recent_ms")
+
+    def __init__(self, window: int) -> None:
+        self.ok = 0
+        self.failed = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent_ms: deque[float] = deque(maxlen=window)
+
+
+class StatsAggregator:
+    """Thread-safe per-endpoint latency aggregate with periodic summaries.
+
+    Attributes:
+        interval_s (float): Minimum seconds between automatic summaries.
+        window (int): Latest successful latencies kept for percentiles.
+    """
+
+    def __init__(self, interval_s: float = 60.0, window: int = 1000):
+        """Initializes an empty aggregate.
+
+        Args:
+            interval_s: Minimum seconds between automatic summaries.
+            window: Latest successful latencies kept for percentiles.
+        """
+
+        self.interval_s = interval_s
+        self.window = window
+        self._lock = threading.Lock()
+        self._by_endpoint: dict[str, _EndpointStats] = {}
+        self._last_emit = time.monotonic()
+
+    @contextmanager
+    def measure(self, endpoint: str) -> Iterator[RequestTimer]:
+        """Times the enclosed request and records it on exit.
+
+        A block that raises is recorded as a failure (without latency) and
+        the exception propagates.
+
+        Args:
+            endpoint: The API path being requested.
+
+        Yields:
+            RequestTimer: Exposes ``elapsed_ms`` for per-call failure logs.
+        """
+
+        timer = RequestTimer()
+        try:
+            yield timer
+        except BaseException:
+            self.record(endpoint, None)
+            raise
+        self.record(endpoint, timer.elapsed_ms)
+
+    def record(self, endpoint: str, duration_ms: float | None) -> None:
+        """Adds one request to the aggregate.
+
+        Args:
+            endpoint: The API path requested.
+            duration_ms: Latency of a successful request, or None for a failure.
+        """
+
+        with self._lock:
+            stats = self._by_endpoint.get(endpoint)
+            if stats is None:
+                stats = self._by_endpoint[endpoint] = _EndpointStats(self.window)
+
+            if duration_ms is None:
+                stats.failed += 1
+            else:
+                stats.ok += 1
+                stats.total_ms += duration_ms
+                stats.max_ms = max(stats.max_ms, duration_ms)
+                stats.recent_ms.append(duration_ms)
+
+            due = time.monotonic() - self._last_emit >= self.interval_s
+
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Emits one SAPI_REQUEST_STATS line per endpoint and resets."""
+
+        with self._lock:
+            snapshot = self._by_endpoint
+            self._by_endpoint = {}
+            self._last_emit = time.monotonic()
+
+        for endpoint, stats in snapshot.items():
+            recent = sorted(stats.recent_ms)
+            logger.info(
+                "SAPI_REQUEST_STATS endpoint=%s ok=%d failed=%d mean_ms=%.2f "
+                "p50_ms=%.2f p95_ms=%.2f max_ms=%.2f",
+                endpoint,
+                stats.ok,
+                stats.failed,
+                stats.total_ms / stats.ok if stats.ok else 0.0,
+                _percentile(recent, 0.50),
+                _percentile(recent, 0.95),
+                stats.max_ms,
+            )
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+# Shared by all clients in the process; summarized once more at exit.
+REQUEST_STATS = StatsAggregator()
+atexit.register(REQUEST_STATS.flush)
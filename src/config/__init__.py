@@ -0,0 +1,14 @@
+from src.config.config import (
+    RETRIABLE_STATUS_CODES,
+    async_retrying,
+    get_retry_policy,
+    is_transient_error,
+    sapi_retry,
+)
+
+
+def __getattr__(name):
+    # SAPI_RETRY_POLICY is built lazily by src.config.config.
+    if name == "SAPI_RETRY_POLICY":
+        return get_retry_policy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,13 +2,15 @@
 
 This module defines which HTTP errors are considered transient and
 configures the global retry policy using the Tenacity library.
+
+Tenacity is imported on first use of the policy rather than at import time,
+so code paths that never talk to SAPI do not pay for it.
 """
 
-import requests
+import functools
+import httpx
 import logging
 
-from tenacity import retry, stop_after_attempt, wait_incrementing, retry_if_exception
-
 logger = logging.getLogger(__name__)
 
 RETRIABLE_STATUS_CODES = {429, 500, 502, 503, 504}
@@ -42,21 +44,83 @@ def is_transient_error(exception):
     """
 
     # 1. Handle Connection issues (always retry)
-    if isinstance(exception, requests.exceptions.ConnectionError):
+    if isinstance(exception, httpx.TransportError):
         return True
 
     # 2. Handle HTTPErrors (only retry 429 and 5xx)
-    if isinstance(exception, requests.exceptions.HTTPError):
+    if isinstance(exception, httpx.HTTPStatusError):
         status = exception.response.status_code
         return status == 429 or status >= 500
 
     return False
 
 
-SAPI_RETRY_POLICY = retry(
-    retry=retry_if_exception(is_transient_error),
-    wait=wait_incrementing(start=1, increment=1, max=5),
-    stop=stop_after_attempt(3),
-    reraise=True,
-    before_sleep=log_retry,  # This is the hook that handles the monitoring
-)
+def _retry_kwargs() -> dict:
+    """Builds the keyword arguments shared by the sync and async policies."""
+
+    from tenacity import retry_if_exception, stop_after_attempt, wait_incrementing
+
+    return dict(
+        retry=retry_if_exception(is_transient_error),
+        wait=wait_incrementing(start=1, increment=1, max=5),
+        stop=stop_after_attempt(3),
+        reraise=True,
+        before_sleep=log_retry,  # This is the hook that handles the monitoring
+    )
+
+
+@functools.cache
+def get_retry_policy():
+    """Returns the SAPI retry decorator, building it on first call.
+
+    Returns:
+        Callable: A tenacity ``retry`` decorator.
+    """
+
+    from tenacity import retry
+
+    return retry(**_retry_kwargs())
+
+
+def sapi_retry(fn):
+    """Decorates ``fn`` with the SAPI retry policy, resolved on first call.
+
+    Args:
+        fn: The function to retry on transient errors.
+
+    Returns:
+        Callable: A wrapper with the same signature as ``fn``.
+    """
+
+    wrapped = None
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        nonlocal wrapped
+        if wrapped is None:
+            wrapped = get_retry_policy()(fn)
+        return wrapped(*args, **kwargs)
+
+    return wrapper
+
+
+def async_retrying():
+    """Builds a fresh async retry controller with the SAPI retry policy.
+
+    Used by the async client, where sleeping between attempts must not
+    block the event loop.
+
+    Returns:
+        AsyncRetrying: An iterator yielding one attempt context per try.
+    """
+
+    from tenacity import AsyncRetrying
+
+    return AsyncRetrying(**_retry_kwargs())
+
+
+def __getattr__(name):
+    # Keeps `SAPI_RETRY_POLICY` importable without building it at import time.
+    if name == "SAPI_RETRY_POLICY":
+        return get_retry_policy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
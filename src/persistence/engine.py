@@ -1,20 +1,119 @@
-from sqlalchemy import create_engine
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import orjson
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
-from src.config.postgres_settings import PostgresSettings
 from contextlib import contextmanager
 
+if TYPE_CHECKING:
+    from src.config.postgres_settings import PostgresSettings
+
+
+logger = logging.getLogger(__name__)
+
+
+def default_pool_size() -> int:
+    """
+    Pool size from the (2 * CPU cores) + effective spindles rule.
+
+    Throughput comes from keeping the database's cores and disks busy, not
+    from more connections; past that point extra connections only queue on
+    locks and context switches. Spindles default to 2 (override with
+    SAPI_EFFECTIVE_SPINDLES; SSD-backed hosts count as 1-2).
+    """
+    spindles = int(os.environ.get("SAPI_EFFECTIVE_SPINDLES", "2"))
+    return 2 * (os.cpu_count() or 1) + spindles
+
+
+def _json_dumps(value) -> str:
+    """
+    JSON column serializer (orjson; SQLAlchemy expects str, not bytes).
+    """
+    return orjson.dumps(value).decode("utf-8")
+
 
 class DatabaseManager:
 
-    def __init__(self, config: PostgresSettings):
+    def __init__(
+        self,
+        config: PostgresSettings,
+        *,
+        pool_size: int | None = None,
+        max_overflow: int = 0,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+    ):
+        """
+        pool_size defaults to default_pool_size(). max_overflow is 0 so the pool
+        is a hard cap: under contention callers wait for a connection instead
+        of opening more than the database can serve in parallel.
+        """
 
-        self.engine = create_engine(config.url)
+        self.engine = create_engine(
+            config.url,
+            pool_size=pool_size if pool_size is not None else default_pool_size(),
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
+            # SQLAlchemy applies these for both psycopg2 and psycopg (3): binds
+            # are encoded once by orjson, and results are decoded by orjson via
+            # the driver's json typecaster, so no stdlib json on either path.
+            # The driver stays psycopg2: the COPY bulk paths use copy_expert.
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
+        )
         self.session_factory = sessionmaker(bind=self.engine)
 
+    def prewarm(self, connections: int = 1) -> None:
+        """
+        Open up to `connections` pooled connections (SELECT 1 on each) and
+        return them to the pool, so the first pages do not pay connect, TLS
+        and auth. Capped at the pool size.
+        """
+        pool_size = getattr(self.engine.pool, "size", None)
+        if callable(pool_size):
+            connections = min(connections, pool_size())
+
+        t0 = time.perf_counter()
+        with ExitStack() as stack:
+            for _ in range(connections):
+                stack.enter_context(self.engine.connect()).execute(text("SELECT 1"))
+        logger.info(
+            "SAPI_DB_POOL_PREWARM connections=%d ms=%.2f",
+            connections,
+            (time.perf_counter() - t0) * 1000.0,
+        )
+
+    @contextmanager
+    def get_session(self, *, pin_connection: bool = False):
+        """
+        Yield a Session; roll back on error and close on exit.
+
+        pin_connection=True binds the session to one pooled connection for the
+        whole block instead of checking one out (and pre-pinging it) per
+        transaction. Transactions still begin and commit per session.begin();
+        between them the connection is idle, not in a transaction.
+        """
+        if pin_connection:
+            with self.engine.connect() as connection:
+                with self._session_scope(self.session_factory(bind=connection)) as session:
+                    yield session
+            return
+
+        with self._session_scope(self.session_factory()) as session:
+            yield session
+
+    @staticmethod
     @contextmanager
-    def get_session(self):
+    def _session_scope(session):
 
-        session = self.session_factory()
         try:
             yield session
         except Exception as e:
@@ -22,3 +121,17 @@ class DatabaseManager:
             raise e
         finally:
             session.close()
+
+
+@lru_cache(maxsize=1)
+def get_database_manager() -> DatabaseManager:
+    """
+    Return the process-wide DatabaseManager for the SAPI source store.
+
+    Built once from SapiSettings so every task in the process shares one
+    engine and connection pool instead of warming up its own.
+    """
+    # Imported here so pydantic-settings loads only when a DB is configured.
+    from src.config.postgres_settings import SapiSettings
+
+    return DatabaseManager(SapiSettings())
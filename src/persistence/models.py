@@ -8,69 +8,68 @@ Design notes:
 - Meta (overview, genres, cast, etc.) stays in raw for v0.
 - Indices are upserted by stable keys and carry `last_seen_run_id` for "currentness".
 - Store *all* services returned in `streamingOptions`, not just the crawl-scope services.
+- Records are plain slotted dataclasses: they only shuttle already-shaped data
+  from extract.py to the indices store, so they carry no validation cost.
+  Field names match the ORM columns (SAPI's camelCase names are mapped in extract.py).
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field, ConfigDict, AnyUrl
-
 
 SapiCountry = str
 SapiShowType = Literal["movie", "series"]
 
 
-class SapiTitleIndexRecord(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SapiTitleIndexRecord:
     """
     Upsert key: sapi_id
     """
 
-    model_config = ConfigDict(extra="forbid",
-                              populate_by_name=True)
-
-    sapi_id: str = Field(alias="id")
+    sapi_id: str
 
     # Cross-source anchors (optional, not guaranteed to exist)
-    imdb_id: str | None = Field(default=None, alias="imdbId")
-    tmdb_id: str | None = Field(default=None, alias="tmdbId")
+    imdb_id: str | None = None
+    tmdb_id: str | None = None
 
     # Identity-ish fields (still sourced from SAPI; canonicalization comes later)
     title: str
-    original_title: str | None = Field(default=None, alias="originalTitle")
-    show_type: SapiShowType = Field(alias="showType")
+    original_title: str | None = None
+    show_type: SapiShowType
 
     # SAPI often uses "show" as a generic item label; keep flexible.
-    item_type: str | None = Field(default="show", alias="itemType")
+    item_type: str | None = "show"
 
-    release_year: str | None = Field(default=None, alias="releaseYear")
+    release_year: str | None = None
 
     fetched_at: datetime
     last_seen_run_id: str
 
 
-class Locale(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Locale:
     """
     SAPI locales are typically language + optional region.
-    Keep validation permissive to avoid ingestion brittleness.
+    Kept permissive to avoid ingestion brittleness.
     """
-    model_config = ConfigDict(extra="forbid")
-
-    language: str = Field(..., min_length=2, max_length=3)
-    region: str | None = Field(None, min_length=2, max_length=3)
 
+    language: str
+    region: str | None = None
 
-class Subtitle(BaseModel):
-    model_config = ConfigDict(extra="forbid",
-                              populate_by_name=True)
 
-    closed_captions: bool = Field(alias="closedCaptions")
+@dataclass(slots=True, kw_only=True)
+class Subtitle:
+    closed_captions: bool
     locale: Locale
 
 
-class SapiOfferIndexRecord(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SapiOfferIndexRecord:
     """
     Upsert key: (sapi_id, country, service_id, offer_type)
 
@@ -79,34 +78,29 @@ class SapiOfferIndexRecord(BaseModel):
     - available_since/expires_on are ints per SAPI docs (epoch seconds).
     """
 
-    model_config = ConfigDict(extra="forbid",
-                              populate_by_name=True)
-
-    sapi_id: str = Field(alias="id")
+    sapi_id: str
     country: SapiCountry
 
     # External enumeration: keep open (string) to avoid breaking when SAPI adds services.
     service_id: str
-    service_name: str | None = Field(
-        default=None, alias="name"
-    )  # optional display value if provided
+    service_name: str | None = None  # optional display value if provided
 
     # External enumeration: keep open to avoid brittle ingestion.
-    offer_type: str = Field(alias="type")  # expected: free/subscription/rent/buy/addon
+    offer_type: str  # expected: free/subscription/rent/buy/addon
 
     # Deep links (naming reflects intended meaning, regardless of SAPI field name)
-    title_page_link: str = Field(alias="link")
-    watch_link: str | None = Field(default=None, alias="videoLink")
+    title_page_link: str
+    watch_link: str | None = None
 
     # External enumeration; keep open.
     quality: str | None = None  # expected: sd/hd/qhd/uhd
 
-    audios: list[Locale] = Field(default_factory=list)
-    subtitles: list[Subtitle] = Field(default_factory=list)
+    audios: list[Locale] = field(default_factory=list)
+    subtitles: list[Subtitle] = field(default_factory=list)
 
-    available_since: int = Field(alias="availableSince")
-    expires_soon: bool = Field(alias="expiresSoon")
-    expires_on: int | None = Field(default=None, alias="expiresOn")
+    available_since: int
+    expires_soon: bool
+    expires_on: int | None = None
 
     fetched_at: datetime
     last_seen_run_id: str
@@ -123,21 +117,19 @@ class AssetKind(str, Enum):
     HORIZONTAL_BACKDROP = "horizontalBackdrop"
 
 
-class SapiAssetIndexRecord(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SapiAssetIndexRecord:
     """
     Upsert key: (sapi_id, asset_kind)
 
     Store image pointers only (no downloading here). Keep the width map open-ended.
     """
 
-    model_config = ConfigDict(extra="forbid",
-                              populate_by_name=True)
-
-    sapi_id: str = Field(alias="id")
+    sapi_id: str
     asset_kind: AssetKind
 
     # Example keys: w240, w360, w480, w720, w1080, w1440, ...
-    image_urls: dict[str, AnyUrl] = Field(default_factory=dict)
+    image_urls: dict[str, str] = field(default_factory=dict)
 
     fetched_at: datetime
     last_seen_run_id: str
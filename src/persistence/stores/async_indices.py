@@ -0,0 +1,225 @@
+"""
+Async SAPI indices store on asyncpg (PostgreSQL only).
+
+Same contract as `SapiIndicesStore` (upsert by stable keys, last_seen_run_id on
+every touched row, titles before offers/assets), but the hot write path skips
+SQLAlchemy: each table has one raw `INSERT ... ON CONFLICT DO UPDATE` statement,
+built once from the ORM table metadata, and batches go through
+`Connection.executemany`. asyncpg prepares each statement once per connection
+and reuses it from its statement cache.
+
+Non-responsibilities:
+- No HTTP calls.
+- No raw JSON extraction. That lives in extract.py.
+- No ledger logic. That belongs in the run ledger module.
+
+Monitoring:
+- Emits the same structured logs as the sync store (dialect=asyncpg):
+  - SAPI_DB_UPSERT_SUCCESS
+  - SAPI_DB_UPSERT_FAILED
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from enum import Enum
+from typing import Any, Iterable, Sequence
+
+import asyncpg
+import orjson
+from sqlalchemy import JSON, Table
+
+from src.persistence.models import (
+    SapiAssetIndexRecord,
+    SapiOfferIndexRecord,
+    SapiTitleIndexRecord,
+)
+from src.persistence.stores.indices import (
+    SapiIndicesStore,
+    UpsertCounts,
+    _dedupe_offers,
+    _row_changed_sql,
+)
+from src.persistence.tables import SapiAssetIndex, SapiOfferIndex, SapiTitleIndex
+
+logger = logging.getLogger(__name__)
+
+
+class _UpsertSpec:
+    """
+    Precomputed upsert statement and column order for one index table.
+    """
+
+    def __init__(self, table: Table, conflict_cols: tuple[str, ...]) -> None:
+        self.table_name = table.name
+        self.conflict_cols = conflict_cols
+        self.columns = [c.name for c in table.c]
+        self.json_cols = frozenset(
+            c.name for c in table.c if isinstance(c.type, JSON)
+        )
+
+        placeholders = ", ".join(f"${i}" for i in range(1, len(self.columns) + 1))
+        updates = ", ".join(
+            f"{c} = EXCLUDED.{c}" for c in self.columns if c not in conflict_cols
+        )
+        self.sql = (
+            f"INSERT INTO {table.name} ({', '.join(self.columns)}) "
+            f"VALUES ({placeholders}) "
+            f"ON CONFLICT ({', '.join(conflict_cols)}) DO UPDATE SET {updates} "
+            f"WHERE {_row_changed_sql(table, conflict_cols)}"
+        )
+
+    def to_args(self, row: dict[str, Any]) -> tuple[Any, ...]:
+        """
+        Convert a row dict into a positional argument tuple for asyncpg.
+
+        JSON columns are sent as encoded text; enums by name, matching how
+        SQLAlchemy's Enum type labels them.
+        """
+        args = []
+        for c in self.columns:
+            v = row.get(c)
+            if v is not None and c in self.json_cols:
+                v = orjson.dumps(v).decode("utf-8")
+            elif isinstance(v, Enum):
+                v = v.name
+            args.append(v)
+        return tuple(args)
+
+    def sort_key(self, row: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple(row[c] for c in self.conflict_cols)
+
+
+_TITLES = _UpsertSpec(SapiTitleIndex.__table__, ("sapi_id",))
+_OFFERS = _UpsertSpec(
+    SapiOfferIndex.__table__, ("sapi_id", "country", "service_id", "offer_type")
+)
+_ASSETS = _UpsertSpec(SapiAssetIndex.__table__, ("sapi_id", "asset_kind"))
+
+
+class AsyncSapiIndicesStore:
+    """
+    asyncpg-backed repository for persisting extracted SAPI index records.
+
+    Intended use:
+        store = await AsyncSapiIndicesStore.create(dsn)
+        counts = await store.upsert_batch([(title, offers, assets), ...])
+        await store.close()
+
+    Each public call runs in its own transaction on a pooled connection.
+    """
+
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        """
+        Args:
+            pool: asyncpg pool bound to the source-store database.
+        """
+        self._pool = pool
+
+    @classmethod
+    async def create(cls, dsn: str, **pool_kwargs: Any) -> AsyncSapiIndicesStore:
+        """
+        Create a store with its own asyncpg pool.
+
+        Args:
+            dsn: PostgreSQL DSN (e.g. PostgresSettings.url).
+            pool_kwargs: Passed through to asyncpg.create_pool.
+        """
+        return cls(await asyncpg.create_pool(dsn, **pool_kwargs))
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+    async def upsert_all(
+        self,
+        title: SapiTitleIndexRecord,
+        offers: Sequence[SapiOfferIndexRecord],
+        assets: Sequence[SapiAssetIndexRecord],
+    ) -> UpsertCounts:
+        """
+        Upsert a title plus its offers and assets in one transaction.
+        """
+        return await self.upsert_batch([(title, offers, assets)])
+
+    async def upsert_batch(
+        self,
+        shows: Iterable[
+            tuple[
+                SapiTitleIndexRecord,
+                Sequence[SapiOfferIndexRecord],
+                Sequence[SapiAssetIndexRecord],
+            ]
+        ],
+    ) -> UpsertCounts:
+        """
+        Upsert many shows' (title, offers, assets) tuples in one transaction.
+
+        Same flattening and dedupe rules as SapiIndicesStore.upsert_batch.
+        """
+        titles: list[SapiTitleIndexRecord] = []
+        offers: list[SapiOfferIndexRecord] = []
+        assets: list[SapiAssetIndexRecord] = []
+
+        for title, show_offers, show_assets in shows:
+            titles.append(title)
+            offers.extend(show_offers)
+            assets.extend(show_assets)
+
+        title_rows = [
+            SapiIndicesStore._row_title(r)
+            for r in {r.sapi_id: r for r in titles}.values()
+        ]
+        offer_rows = [SapiIndicesStore._row_offer(r) for r in _dedupe_offers(offers)]
+        asset_rows = [
+            SapiIndicesStore._row_asset(r)
+            for r in {(r.sapi_id, r.asset_kind): r for r in assets}.values()
+        ]
+
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                titles_n = await self._executemany(conn, _TITLES, title_rows)
+                offers_n = await self._executemany(conn, _OFFERS, offer_rows)
+                assets_n = await self._executemany(conn, _ASSETS, asset_rows)
+
+        return UpsertCounts(titles=titles_n, offers=offers_n, assets=assets_n)
+
+    async def _executemany(
+        self,
+        conn: asyncpg.Connection,
+        spec: _UpsertSpec,
+        rows: list[dict[str, Any]],
+    ) -> int:
+        """
+        Run the table's prepared upsert over all rows, in conflict-key order.
+        """
+        if not rows:
+            return 0
+
+        rows.sort(key=spec.sort_key)
+        run_id = rows[0].get("last_seen_run_id")
+
+        start = time.perf_counter()
+        try:
+            await conn.executemany(spec.sql, [spec.to_args(r) for r in rows])
+        except Exception:
+            latency_ms = (time.perf_counter() - start) * 1000.0
+            logger.exception(
+                "SAPI_DB_UPSERT_FAILED table=%s rows=%d latency_ms=%.2f dialect=asyncpg run_id=%s conflict_cols=%s",
+                spec.table_name,
+                len(rows),
+                latency_ms,
+                run_id,
+                spec.conflict_cols,
+            )
+            raise
+
+        latency_ms = (time.perf_counter() - start) * 1000.0
+        logger.info(
+            "SAPI_DB_UPSERT_SUCCESS table=%s rows=%d latency_ms=%.2f dialect=asyncpg run_id=%s",
+            spec.table_name,
+            len(rows),
+            latency_ms,
+            run_id,
+        )
+        return len(rows)
@@ -0,0 +1,94 @@
+"""
+Per-show conditional-GET validators for SAPI refreshes.
+
+Stores the ETag / Last-Modified returned by `/shows/{id}` so a later refresh
+can ask SAPI for the show only if it changed.
+
+Non-responsibilities:
+- No HTTP calls.
+- No index writes. Those belong in the indices store.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from src.persistence.tables import SapiFetchLedger
+
+logger = logging.getLogger(__name__)
+
+_INSERT_BY_DIALECT = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+class SapiFetchLedgerStore:
+    """
+    Repository for per-show HTTP validators.
+
+    Intended use:
+        prev = store.get(sapi_id)
+        # conditional GET with prev.etag / prev.last_modified ...
+        store.record_changed(...)       # on 200
+        store.record_not_modified(...)  # on 304
+    """
+
+    def __init__(self, session: Session) -> None:
+        """
+        Args:
+            session: SQLAlchemy Session bound to the source-store database.
+        """
+        self._session = session
+
+    def get(self, sapi_id: str) -> SapiFetchLedger | None:
+        """
+        Fetch the stored validators for a show, if any.
+        """
+        return self._session.get(SapiFetchLedger, sapi_id)
+
+    def record_changed(
+        self,
+        *,
+        sapi_id: str,
+        etag: str | None,
+        last_modified: str | None,
+        fetched_at: datetime,
+    ) -> None:
+        """
+        Upsert the validators returned with a full (200) response.
+        """
+        dialect = self._session.get_bind().dialect.name
+        if dialect not in _INSERT_BY_DIALECT:
+            raise NotImplementedError(f"fetch ledger not implemented for {dialect}")
+
+        values = {
+            "sapi_id": sapi_id,
+            "etag": etag,
+            "last_modified": last_modified,
+            "checked_at": fetched_at,
+            "changed_at": fetched_at,
+        }
+        stmt = _INSERT_BY_DIALECT[dialect](SapiFetchLedger.__table__).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SapiFetchLedger.__table__.c.sapi_id],
+            set_={k: v for k, v in values.items() if k != "sapi_id"},
+        )
+        self._session.execute(stmt)
+
+    def record_not_modified(self, *, sapi_id: str, checked_at: datetime) -> None:
+        """
+        Note that a show was checked and SAPI replied 304 Not Modified.
+        """
+        stmt = (
+            update(SapiFetchLedger)
+            .where(SapiFetchLedger.sapi_id == sapi_id)
+            .values(checked_at=checked_at)
+        )
+        self._session.execute(stmt)
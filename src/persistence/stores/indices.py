@@ -25,12 +25,18 @@ Monitoring:
 
 from __future__ import annotations
 
+import io
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from datetime import datetime
 from enum import Enum
 from typing import Any, Iterable, Sequence, Type
 
+import orjson
+from sqlalchemy import JSON, Table, Text, cast, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from src.persistence.tables import (
@@ -42,6 +48,7 @@ from src.persistence.tables import (
     SapiTitleIndex,
 )
 from src.persistence.models import (
+    Locale,
     SapiAssetIndexRecord,
     SapiOfferIndexRecord,
     SapiTitleIndexRecord,
@@ -49,6 +56,138 @@ from src.persistence.models import (
 
 logger = logging.getLogger(__name__)
 
+# Dialect-specific insert() constructs that support on_conflict_do_update().
+_INSERT_BY_DIALECT = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+# Left out of the DO UPDATE change check: fetched_at moves on every fetch, so
+# comparing it would rewrite every row. last_seen_run_id is compared, so a new
+# run still touches every row it sees; re-upserts within a run (resume,
+# overlapping pages) skip rows whose content is unchanged.
+_UNCOMPARED_COLS = frozenset({"fetched_at"})
+
+# Offer quality preference used when collapsing duplicate offer keys.
+_QUALITY_RANK = {"uhd": 3, "hd": 2, "sd": 1}
+
+
+def _dedupe_offers(records: list[SapiOfferIndexRecord]) -> list[SapiOfferIndexRecord]:
+    """
+    Collapse offers sharing an upsert key, keeping the most useful one.
+
+    Preference order: higher quality, then having a watch_link, then later
+    available_since; full ties keep the earliest record. One sort computes
+    each record's key once, then a linear walk takes the first of each group.
+    The result is ordered by upsert key.
+    """
+    ranked = sorted(
+        records,
+        key=lambda r: (
+            r.sapi_id,
+            r.country,
+            r.service_id,
+            r.offer_type,
+            -_QUALITY_RANK.get((r.quality or "").lower(), 0),
+            r.watch_link is None,
+            -(r.available_since or 0),
+        ),
+    )
+
+    deduped: list[SapiOfferIndexRecord] = []
+    last_key = None
+    for r in ranked:
+        key = (r.sapi_id, r.country, r.service_id, r.offer_type)
+        if key != last_key:
+            deduped.append(r)
+            last_key = key
+
+    return deduped
+
+
+def _compared_cols(table: Table, conflict_cols: tuple[str, ...]) -> list:
+    """
+    Columns whose change justifies rewriting an existing row.
+    """
+    return [
+        c
+        for c in table.c
+        if c.name not in conflict_cols and c.name not in _UNCOMPARED_COLS
+    ]
+
+
+def _row_changed(table: Table, excluded, conflict_cols: tuple[str, ...]):
+    """
+    WHERE guard for ON CONFLICT DO UPDATE: only rewrite when a compared column
+    IS DISTINCT FROM the incoming value. JSON is compared as text (PostgreSQL
+    json has no equality operator; both sides are orjson-encoded).
+    """
+
+    def comparable(col):
+        return cast(col, Text) if isinstance(col.type, JSON) else col
+
+    return or_(
+        *(
+            comparable(c).is_distinct_from(comparable(excluded[c.name]))
+            for c in _compared_cols(table, conflict_cols)
+        )
+    )
+
+
+def _row_changed_sql(table: Table, conflict_cols: tuple[str, ...], quote=str) -> str:
+    """
+    Raw PostgreSQL form of _row_changed, for the COPY merge and asyncpg paths.
+    """
+    target = quote(table.name)
+    checks = []
+    for c in _compared_cols(table, conflict_cols):
+        name = quote(c.name)
+        as_text = "::text" if isinstance(c.type, JSON) else ""
+        checks.append(
+            f"{target}.{name}{as_text} IS DISTINCT FROM EXCLUDED.{name}{as_text}"
+        )
+    return " OR ".join(checks)
+
+
+def _locale_json(loc: Locale) -> dict[str, Any]:
+    """
+    JSON shape of a Locale as stored in the audios/subtitles columns.
+    """
+    return {"language": loc.language, "region": loc.region}
+
+
+def _orm_asset_kind(ak: Any) -> OrmAssetKind:
+    """
+    Convert a record asset kind (enum or raw string) into the ORM enum.
+    """
+    if isinstance(ak, Enum):
+        ak = ak.value
+    return OrmAssetKind(ak)
+
+
+def _compile_row_fn(record_cls: type, overrides: dict[str, str]):
+    """
+    Generate a record -> DB row dict converter specialized for `record_cls`.
+
+    Emits one function whose body is a single dict literal over the dataclass
+    fields (`"f": r.f`), with `overrides` supplying the expression for fields
+    that need conversion. No per-call introspection, copying or branching.
+    """
+    name = f"_row_{record_cls.__name__}"
+    items = "".join(
+        f"        {f.name!r}: {overrides.get(f.name, f'r.{f.name}')},\n"
+        for f in fields(record_cls)
+    )
+    src = f"def {name}(r):\n    return {{\n{items}    }}\n"
+
+    namespace: dict[str, Any] = {
+        "SapiShowTypeEnum": SapiShowTypeEnum,
+        "_locale_json": _locale_json,
+        "_orm_asset_kind": _orm_asset_kind,
+    }
+    exec(compile(src, f"<codegen {name}>", "exec"), namespace)
+    return namespace[name]
+
 
 @dataclass(frozen=True)
 class UpsertCounts:
@@ -73,16 +212,29 @@ class SapiIndicesStore:
         with Session.begin() as session:
             store = SapiIndicesStore(session)
             counts = store.upsert_all(title, offers, assets)
+            # or, for a whole page of shows in one pass per table:
+            counts = store.upsert_batch([(title, offers, assets), ...])
     """
 
-    def __init__(self, session: Session, *, chunk_size: int = 1000) -> None:
+    def __init__(
+        self,
+        session: Session,
+        *,
+        chunk_size: int = 1000,
+        copy_threshold: int | None = 5000,
+    ) -> None:
         """
         Args:
             session: SQLAlchemy Session bound to the source-store database.
             chunk_size: Max rows per upsert statement to avoid parameter limits.
+            copy_threshold: On PostgreSQL, batches of at least this many rows are
+                loaded via COPY into a staging table and merged with a single
+                INSERT ... SELECT ... ON CONFLICT. None disables the COPY path.
         """
         self._session = session
         self._chunk_size = chunk_size
+        self._copy_threshold = copy_threshold
+        self._insert = None
 
     def upsert_all(
         self,
@@ -96,14 +248,62 @@ class SapiIndicesStore:
         Titles are upserted first to satisfy FK constraints.
         """
         titles_n = self.upsert_titles([title])
-        offers_n = self.upsert_offers(list(offers))
-        assets_n = self.upsert_assets(list(assets))
+        offers_n = self.upsert_offers(offers) if offers else 0
+        assets_n = self.upsert_assets(assets) if assets else 0
+        return UpsertCounts(titles=titles_n, offers=offers_n, assets=assets_n)
+
+    def upsert_batch(
+        self,
+        shows: Iterable[
+            tuple[
+                SapiTitleIndexRecord,
+                Sequence[SapiOfferIndexRecord],
+                Sequence[SapiAssetIndexRecord],
+            ]
+        ],
+    ) -> UpsertCounts:
+        """
+        Upsert many shows' (title, offers, assets) tuples in one pass per table.
+
+        Records are flattened across shows so each table gets one statement per
+        chunk_size rows instead of one per show, and offer dedupe sees the whole
+        batch (collapsing cross-show duplicates too). All titles go first to
+        satisfy FK constraints. Transaction scope stays with the caller.
+        """
+        titles: list[SapiTitleIndexRecord] = []
+        offers: list[SapiOfferIndexRecord] = []
+        assets: list[SapiAssetIndexRecord] = []
+
+        for title, show_offers, show_assets in shows:
+            titles.append(title)
+            offers.extend(show_offers)
+            assets.extend(show_assets)
+
+        return self.upsert_records(titles, offers, assets)
+
+    def upsert_records(
+        self,
+        titles: Sequence[SapiTitleIndexRecord],
+        offers: Sequence[SapiOfferIndexRecord],
+        assets: Sequence[SapiAssetIndexRecord],
+    ) -> UpsertCounts:
+        """
+        Upsert already-flattened records (e.g. from extract_shows_batch), one
+        pass per table with the same rules as upsert_batch.
+        """
+        titles_n = self.upsert_titles(titles)
+        offers_n = self.upsert_offers(offers)
+        assets_n = self.upsert_assets(assets)
         return UpsertCounts(titles=titles_n, offers=offers_n, assets=assets_n)
 
     def upsert_titles(self, records: Sequence[SapiTitleIndexRecord]) -> int:
         """
         Upsert title index records by (sapi_id).
+
+        Duplicate keys collapse to the last record: PostgreSQL rejects an
+        ON CONFLICT DO UPDATE that touches the same row twice in one statement.
         """
+        records = list({r.sapi_id: r for r in records}.values())
         rows = [self._row_title(r) for r in records]
         return self._bulk_upsert(
             model=SapiTitleIndex,
@@ -115,36 +315,8 @@ class SapiIndicesStore:
         """
         Upsert offer index records by (sapi_id, country, service_id, offer_type).
         """
-        rows = [self._row_offer(r) for r in records]
-
-        def _quality_rank(q: str | None) -> int:
-            return {"uhd": 3, "hd": 2, "sd": 1}.get((q or "").lower(), 0)
-
-        def _dedupe_offers(records: list[SapiOfferIndexRecord]) -> list[SapiOfferIndexRecord]:
-            best: dict[tuple[str, str, str, str], SapiOfferIndexRecord] = {}
-
-            for r in records:
-                key = (r.sapi_id, r.country, r.service_id, r.offer_type)
-                cur = best.get(key)
-                if cur is None:
-                    best[key] = r
-                    continue
-
-                # prefer higher quality
-                if _quality_rank(r.quality) > _quality_rank(cur.quality):
-                    best[key] = r
-                    continue
-
-                # if quality tie, prefer one with watch_link
-                if (r.watch_link is not None) and (cur.watch_link is None):
-                    best[key] = r
-                    continue
-
-                # if still tie, prefer later available_since (if present)
-                if (r.available_since or 0) > (cur.available_since or 0):
-                    best[key] = r
-
-            return list(best.values())
+        if not records:
+            return 0
 
         records = _dedupe_offers(records)
         rows = [self._row_offer(r) for r in records]
@@ -158,7 +330,10 @@ class SapiIndicesStore:
     def upsert_assets(self, records: Sequence[SapiAssetIndexRecord]) -> int:
         """
         Upsert asset index records by (sapi_id, asset_kind).
+
+        Duplicate keys collapse to the last record (see upsert_titles).
         """
+        records = list({(r.sapi_id, r.asset_kind): r for r in records}.values())
         rows = [self._row_asset(r) for r in records]
         return self._bulk_upsert(
             model=SapiAssetIndex,
@@ -167,53 +342,36 @@ class SapiIndicesStore:
         )
 
     # -------------------------------------------------------------------------
-    # Normalization: Pydantic record -> ORM insert/update row
+    # Normalization: index record -> ORM insert/update row
     # -------------------------------------------------------------------------
 
-    @staticmethod
-    def _row_title(r: SapiTitleIndexRecord) -> dict[str, Any]:
-        """
-        Convert a title index record into a DB row dict.
-
-        Uses model_dump() to keep native Python objects (notably datetime).
-        Converts show_type string literal into ORM enum type.
-        """
-        d = r.model_dump()
-        d["show_type"] = SapiShowTypeEnum(d["show_type"])
-        return d
-
-    @staticmethod
-    def _row_offer(r: SapiOfferIndexRecord) -> dict[str, Any]:
-        """
-        Convert an offer index record into a DB row dict.
-
-        Uses model_dump() to keep native Python objects (notably datetime).
-        Converts country string literal into ORM enum type.
-        """
-        d = r.model_dump()
-        return d
-
-    @staticmethod
-    def _row_asset(r: SapiAssetIndexRecord) -> dict[str, Any]:
-        """
-        Convert an asset index record into a DB row dict.
-
-        Uses model_dump() to keep native Python objects (notably datetime).
-
-        Note:
-            image_urls values are AnyUrl in Pydantic, but the DB JSON column is
-            dict[str, str], so URL values are coerced to strings.
-        """
-        d = r.model_dump()
-
-        ak = d["asset_kind"]
-        if isinstance(ak, Enum):
-            ak = ak.value
-        d["asset_kind"] = OrmAssetKind(ak)
-
-        # AnyUrl -> str for JSON persistence
-        d["image_urls"] = {k: str(v) for k, v in (d.get("image_urls") or {}).items()}
-        return d
+    # Generated at import time from the record dataclass fields (see
+    # _compile_row_fn): closed-form dict literals with the enum and nested
+    # JSON conversions inlined.
+    _row_title = staticmethod(
+        _compile_row_fn(
+            SapiTitleIndexRecord,
+            {"show_type": "SapiShowTypeEnum(r.show_type)"},
+        )
+    )
+    _row_offer = staticmethod(
+        _compile_row_fn(
+            SapiOfferIndexRecord,
+            {
+                "audios": "[_locale_json(a) for a in r.audios]",
+                "subtitles": (
+                    "[{'closed_captions': s.closed_captions, "
+                    "'locale': _locale_json(s.locale)} for s in r.subtitles]"
+                ),
+            },
+        )
+    )
+    _row_asset = staticmethod(
+        _compile_row_fn(
+            SapiAssetIndexRecord,
+            {"asset_kind": "_orm_asset_kind(r.asset_kind)"},
+        )
+    )
 
     # -------------------------------------------------------------------------
     # Upsert implementation (with monitoring logs)
@@ -222,19 +380,17 @@ class SapiIndicesStore:
     def _insert_fn(self):
         """
         Return a dialect-specific insert() that supports on_conflict_do_update().
-        """
-        dialect = self._session.get_bind().dialect.name
-        if dialect == "postgresql":
-            from sqlalchemy.dialects.postgresql import insert as ins
 
-            return ins
-        if dialect == "sqlite":
-            from sqlalchemy.dialects.sqlite import insert as ins
-
-            return ins
-        raise NotImplementedError(
-            f"Upsert is only implemented for PostgreSQL and SQLite. dialect={dialect}"
-        )
+        Resolved once per store; the session's bind does not change.
+        """
+        if self._insert is None:
+            dialect = self._session.get_bind().dialect.name
+            if dialect not in _INSERT_BY_DIALECT:
+                raise NotImplementedError(
+                    f"Upsert is only implemented for PostgreSQL and SQLite. dialect={dialect}"
+                )
+            self._insert = _INSERT_BY_DIALECT[dialect]
+        return self._insert
 
     def _bulk_upsert(
         self,
@@ -264,22 +420,35 @@ class SapiIndicesStore:
             else None
         )
 
-        chunks = list(_chunks(rows, self._chunk_size))
-        chunk_count = len(chunks)
-
-        logger.debug(
-            "SAPI_DB_UPSERT_START table=%s rows=%d chunks=%d chunk_size=%d dialect=%s run_id=%s",
-            table_name,
-            len(rows),
-            chunk_count,
-            self._chunk_size,
-            dialect,
-            run_id,
+        # Write in conflict-key order: concurrent writers then take row locks in
+        # the same order (no deadlocks), and B-tree inserts stay local.
+        rows = sorted(rows, key=lambda d: tuple(d[c] for c in conflict_cols))
+
+        use_copy = (
+            dialect == "postgresql"
+            and self._copy_threshold is not None
+            and len(rows) >= self._copy_threshold
         )
+        chunks = () if use_copy else _chunks(rows, self._chunk_size)
+        chunk_count = 1 if use_copy else -(-len(rows) // self._chunk_size)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "SAPI_DB_UPSERT_START table=%s rows=%d chunks=%d chunk_size=%d dialect=%s run_id=%s",
+                table_name,
+                len(rows),
+                chunk_count,
+                self._chunk_size,
+                dialect,
+                run_id,
+            )
 
         start = time.perf_counter()
         try:
             total = 0
+            if use_copy:
+                total = self._copy_upsert(table, rows, conflict_cols)
+
             for chunk in chunks:
                 stmt = insert(table).values(chunk)
 
@@ -296,6 +465,7 @@ class SapiIndicesStore:
                 stmt = stmt.on_conflict_do_update(
                     index_elements=conflict_elements,
                     set_=set_clause,
+                    where=_row_changed(table, excluded, conflict_cols),
                 )
 
                 self._session.execute(stmt)
@@ -327,6 +497,103 @@ class SapiIndicesStore:
             )
             raise
 
+    def _copy_upsert(
+        self, table, rows: list[dict[str, Any]], conflict_cols: tuple[str, ...]
+    ) -> int:
+        """
+        PostgreSQL bulk path: COPY rows into a temp staging table, then merge.
+
+        COPY skips per-row statement planning and parameter binding, which
+        dominates large first-time backfills. The merge is a single
+        INSERT ... SELECT ... ON CONFLICT DO UPDATE with the same semantics as
+        the chunked path. Runs on the session's connection, so it shares the
+        caller's transaction.
+        """
+        quote = self._session.get_bind().dialect.identifier_preparer.quote
+        columns = [c.name for c in table.c]
+        col_list = ", ".join(quote(c) for c in columns)
+        target = quote(table.name)
+        staging = quote(f"_stg_{table.name}")
+
+        update_cols = [c for c in columns if c not in conflict_cols]
+        merge_sql = (
+            f"INSERT INTO {target} ({col_list}) SELECT {col_list} FROM {staging} "
+            f"ORDER BY {', '.join(quote(c) for c in conflict_cols)} "
+            f"ON CONFLICT ({', '.join(quote(c) for c in conflict_cols)}) DO UPDATE SET "
+            + ", ".join(f"{quote(c)} = EXCLUDED.{quote(c)}" for c in update_cols)
+            + f" WHERE {_row_changed_sql(table, conflict_cols, quote)}"
+        )
+
+        buf = _copy_buffer(rows, columns)
+
+        dbapi_conn = self._session.connection().connection.dbapi_connection
+        with dbapi_conn.cursor() as cur:
+            cur.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+                f"(LIKE {target} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+            )
+            cur.execute(f"TRUNCATE {staging}")
+            cur.copy_expert(f"COPY {staging} ({col_list}) FROM STDIN", buf)
+            cur.execute(merge_sql)
+
+        return len(rows)
+
+
+def _copy_text(value: Any) -> str:
+    """
+    Encode one value for PostgreSQL COPY text format.
+
+    Enums are written by name (how SQLAlchemy's Enum type stores them), JSON
+    columns as compact JSON, and bytes in bytea hex form.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, Enum):
+        text = value.name
+    elif isinstance(value, bool):
+        text = "t" if value else "f"
+    elif isinstance(value, datetime):
+        text = value.isoformat(sep=" ")
+    elif isinstance(value, (dict, list)):
+        text = orjson.dumps(value).decode("utf-8")
+    elif isinstance(value, bytes):
+        text = "\\x" + value.hex()
+    else:
+        text = str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_buffer(rows: list[dict[str, Any]], columns: list[str]) -> io.StringIO:
+    """
+    Encode rows as a COPY text stream (missing keys are NULL).
+
+    Every record extracted from a page shares that page's fetched_at, so a
+    batch holds only a handful of distinct timestamps: each is formatted and
+    escaped once, then reused for the rest of its rows.
+    """
+    stamps: dict[datetime, str] = {}
+    buf = io.StringIO()
+    for row in rows:
+        fields = []
+        for c in columns:
+            value = row.get(c)
+            if type(value) is datetime:
+                encoded = stamps.get(value)
+                if encoded is None:
+                    encoded = stamps[value] = _copy_text(value)
+                fields.append(encoded)
+            else:
+                fields.append(_copy_text(value))
+        buf.write("\t".join(fields))
+        buf.write("\n")
+    buf.seek(0)
+    return buf
+
 
 def _chunks(items: list[dict[str, Any]], size: int) -> Iterable[list[dict[str, Any]]]:
     """
@@ -5,28 +5,57 @@ Monitoring:
 - SAPI_DB_RAW_APPEND_START
 - SAPI_DB_RAW_APPEND_SUCCESS
 - SAPI_DB_RAW_APPEND_FAILED
+- SAPI_DB_RAW_APPEND_BULK_SUCCESS
+- SAPI_DB_RAW_APPEND_BULK_FAILED
 
 Logs include run_id, cursor_used, items_count, has_more, next_cursor, payload_bytes,
-hash_ms, db_ms, and dialect.
+hash_ms, db_ms, and dialect (bulk logs: pages and inserted instead of per-page fields).
+
+response_hash is for drift detection (did the provider return different bytes?),
+not cryptographic integrity; idempotency is the (run_id, cursor_used) unique key.
+Only a sampled fraction of pages is hashed (SAPI_HASH_SAMPLE_RATE, default 0);
+unsampled rows have response_hash and hash_algo NULL. Sampled rows hold a 32-byte
+BLAKE3 digest with hash_algo "blake3"; older rows with a hash but no hash_algo
+hold SHA-256.
 """
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
+import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from datetime import datetime
-from typing import Any
+from typing import Any, Sequence
 
+import blake3
+import orjson
+from sqlalchemy import String, bindparam, cast, select, type_coerce
 from sqlalchemy.orm import Session
 
+from src.persistence.stores.indices import _INSERT_BY_DIALECT, _chunks, _copy_buffer
 from src.persistence.tables import (
     SapiRawPage,
 )
 
 logger = logging.getLogger(__name__)
 
+# orjson's sorted output matches the json.dumps form below byte-for-byte for
+# ASCII string/int payloads, but writes non-ASCII as raw UTF-8 instead of
+# \uXXXX escapes, so those pages hash differently. Set SAPI_USE_ORJSON=0 to keep
+# the legacy bytes while comparing hashes across a migration window.
+_USE_ORJSON = os.environ.get("SAPI_USE_ORJSON", "1") != "0"
+
+# Stored alongside each response_hash so the algorithm can change again later.
+HASH_ALGO = "blake3"
+
+# Fraction of pages whose response_hash is computed (0 = never, 1 = always).
+_HASH_SAMPLE_RATE = float(os.environ.get("SAPI_HASH_SAMPLE_RATE", "0"))
+
 
 def _normalize_cursor_used(cursor_used: str | None) -> str:
     """
@@ -43,17 +72,220 @@ def _stable_json_bytes(payload: dict[str, Any]) -> bytes:
     """
     Serialize JSON deterministically for hashing and monitoring.
 
-    sort_keys=True makes the representation stable across runs.
-    separators minimize size.
+    Sorted keys make the representation stable across runs; the output is
+    compact (no whitespace).
     """
+    if _USE_ORJSON:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
     return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
-def _hash_bytes(blob: bytes) -> str:
+def _hash_bytes(blob: bytes) -> bytes:
+    """
+    BLAKE3 digest (32 raw bytes) of a bytes blob.
+
+    Several times faster than SHA-256 on 10-200 KB pages (SIMD tree hashing);
+    collision resistance beyond uniformity is not needed for drift detection.
+    """
+    return blake3.blake3(blob).digest()
+
+
+def _sample_hash() -> bool:
     """
-    SHA-256 hash of a bytes blob.
+    Whether to hash this page (see SAPI_HASH_SAMPLE_RATE).
     """
-    return hashlib.sha256(blob).hexdigest()
+    rate = _HASH_SAMPLE_RATE
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+# blake3 releases the GIL while hashing large buffers, so independent
+# pages hash in parallel on separate cores. Below this much total input the
+# thread hand-off costs more than it saves.
+_PARALLEL_HASH_MIN_BYTES = 256 * 1024
+_HASH_WORKERS = min(8, os.cpu_count() or 1)
+_hash_pool: ThreadPoolExecutor | None = None
+_hash_pool_lock = threading.Lock()
+
+
+def _hash_many(blobs: list[bytes]) -> list[bytes]:
+    """
+    Digests (see _hash_bytes) of many blobs, in input order.
+
+    Large batches are spread over a shared thread pool; small ones (or
+    single-core hosts) are hashed inline.
+    """
+    global _hash_pool
+
+    if (
+        _HASH_WORKERS < 2
+        or len(blobs) < 2
+        or sum(len(b) for b in blobs) < _PARALLEL_HASH_MIN_BYTES
+    ):
+        return [_hash_bytes(b) for b in blobs]
+
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ThreadPoolExecutor(
+                    max_workers=_HASH_WORKERS, thread_name_prefix="sapi-hash"
+                )
+    return list(_hash_pool.map(_hash_bytes, blobs))
+
+
+def _ns_to_ms(ns: int | None) -> float:
+    """
+    Nanoseconds to milliseconds for logs; nan when the span was not timed.
+    """
+    return ns / 1e6 if ns is not None else float("nan")
+
+
+def _json_column_value(payload_text: str, dialect: str) -> Any:
+    """
+    Bind already-serialized JSON for the response_json column.
+
+    Binding the dict would make the JSON type serialize the page a second time.
+    Instead the hashed bytes are sent as text (as decoded by _page_row):
+    Postgres casts them to json (which keeps the text as-is), SQLite stores
+    JSON as text anyway.
+    """
+    text = type_coerce(payload_text, String)
+    if dialect == "postgresql":
+        return cast(text, SapiRawPage.__table__.c.response_json.type)
+    return text
+
+
+def _insert_fn(dialect: str):
+    """
+    Return the dialect-specific insert() that supports ON CONFLICT.
+    """
+    try:
+        return _INSERT_BY_DIALECT[dialect]
+    except KeyError:
+        raise NotImplementedError(f"raw append not implemented for {dialect}") from None
+
+
+_APPEND_COLUMNS = (
+    "run_id",
+    "cursor_used",
+    "fetched_at",
+    "has_more",
+    "next_cursor",
+    "items_count",
+    "response_json",
+    "response_hash",
+    "hash_algo",
+)
+
+
+def _page_meta(response_json: dict[str, Any]) -> tuple[int, bool | None, str | None]:
+    """
+    (items_count, has_more, next_cursor) of a page, read once per append.
+
+    Top-level lookups only; the shows list is measured, not copied.
+    """
+    shows = response_json.get("shows")
+    return (
+        len(shows) if shows else 0,
+        response_json.get("hasMore"),
+        response_json.get("nextCursor"),
+    )
+
+
+def _emit_start(
+    run_id: str,
+    cursor_norm: str,
+    meta: tuple[int, bool | None, str | None],
+    dialect: str,
+) -> None:
+    """
+    SAPI_DB_RAW_APPEND_START log. Callers check isEnabledFor(DEBUG) first so the
+    disabled path builds no argument tuple.
+    """
+    items_count, has_more, next_cursor = meta
+    logger.debug(
+        "SAPI_DB_RAW_APPEND_START run_id=%s cursor_used=%s items_count=%d has_more=%s next_cursor=%s dialect=%s",
+        run_id,
+        cursor_norm,
+        items_count,
+        has_more,
+        next_cursor,
+        dialect,
+    )
+
+
+def _page_row(
+    *,
+    run_id: str,
+    cursor_norm: str,
+    fetched_at: datetime,
+    meta: tuple[int, bool | None, str | None],
+    payload_bytes: bytes,
+    response_hash: bytes | None,
+) -> dict[str, Any]:
+    """
+    Bound parameters of _append_stmt for one page (`meta` from _page_meta).
+    hash_algo is set only when response_hash is.
+    """
+    items_count, has_more, next_cursor = meta
+    return {
+        "run_id": run_id,
+        "cursor_used": cursor_norm,
+        "fetched_at": fetched_at,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        "items_count": items_count,
+        "response_json": payload_bytes.decode("utf-8"),
+        "response_hash": response_hash,
+        "hash_algo": HASH_ALGO if response_hash is not None else None,
+    }
+
+
+def _page_params(
+    *,
+    run_id: str,
+    cursor_used: str | None,
+    fetched_at: datetime,
+    response_json: dict[str, Any],
+    response_bytes: bytes | None = None,
+) -> dict[str, Any]:
+    """
+    Serialize, sample-hash and build _append_stmt parameters for one page (same rules
+    as SapiRawPagesStore.append_page), for callers that embed the statement.
+    """
+    payload_bytes = (
+        response_bytes if response_bytes is not None else _stable_json_bytes(response_json)
+    )
+    return _page_row(
+        run_id=run_id,
+        cursor_norm=_normalize_cursor_used(cursor_used),
+        fetched_at=fetched_at,
+        meta=_page_meta(response_json),
+        payload_bytes=payload_bytes,
+        response_hash=_hash_bytes(payload_bytes) if _sample_hash() else None,
+    )
+
+
+@cache
+def _append_stmt(dialect: str):
+    """
+    Single-page INSERT ... ON CONFLICT DO NOTHING with one bound parameter per
+    column, built once per dialect and executed with a row dict. Reusing the
+    same statement object also keeps SQLAlchemy's compiled-cache lookup cheap.
+
+    response_json is bound as already-serialized text (see _json_column_value).
+    """
+    values = {c: bindparam(c) for c in _APPEND_COLUMNS}
+    json_param = bindparam("response_json", type_=String)
+    values["response_json"] = (
+        cast(json_param, SapiRawPage.__table__.c.response_json.type)
+        if dialect == "postgresql"
+        else json_param
+    )
+    return (
+        _insert_fn(dialect)(SapiRawPage.__table__)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=["run_id", "cursor_used"])
+    )
 
 
 class SapiRawPagesStore:
@@ -63,8 +295,42 @@ class SapiRawPagesStore:
     Stores the entire provider response as a JSON blob.
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        *,
+        chunk_size: int = 100,
+        copy_threshold: int | None = 1000,
+    ) -> None:
+        """
+        Args:
+            session: SQLAlchemy session (transaction scope stays with the caller).
+            chunk_size: Pages per multi-row INSERT in append_pages_bulk. Raw pages
+                are 10-200 KB each, so this is much smaller than the indices store's.
+            copy_threshold: On PostgreSQL, append_pages_bulk batches of at least
+                this many pages go through COPY instead. None disables COPY.
+        """
         self._session = session
+        self._chunk_size = chunk_size
+        self._copy_threshold = copy_threshold
+        self._dialect = session.get_bind().dialect.name
+        self._insert = _insert_fn(self._dialect)
+        self._append_stmt = _append_stmt(self._dialect)
+
+    def get_page(
+        self, *, run_id: str, cursor_used: str | None
+    ) -> tuple[datetime, dict[str, Any]] | None:
+        """
+        Return (fetched_at, response_json) of the stored page for
+        (run_id, cursor_used), or None. One lookup on the unique key.
+        """
+        row = self._session.execute(
+            select(SapiRawPage.fetched_at, SapiRawPage.response_json).where(
+                SapiRawPage.run_id == run_id,
+                SapiRawPage.cursor_used == _normalize_cursor_used(cursor_used),
+            )
+        ).first()
+        return None if row is None else (row.fetched_at, row.response_json)
 
     def append_page(
         self,
@@ -73,6 +339,7 @@ class SapiRawPagesStore:
         cursor_used: str | None,
         fetched_at: datetime,
         response_json: dict[str, Any],
+        response_bytes: bytes | None = None,
     ) -> bool:
         """
         Append a raw page blob.
@@ -80,76 +347,177 @@ class SapiRawPagesStore:
         Idempotent by (run_id, cursor_used_norm).
         If the page already exists, the insert is ignored.
 
+        The stored text is `response_bytes` (the body as received) when given,
+        skipping re-serialization; otherwise _stable_json_bytes of
+        `response_json`. For sampled pages (SAPI_HASH_SAMPLE_RATE) response_hash
+        is taken over those bytes; the two forms hash differently for the same
+        page, but idempotency keys on (run_id, cursor), so the hash is
+        informational only.
+
         Returns:
             True if inserted, False if skipped due to conflict.
         """
         cursor_norm = _normalize_cursor_used(cursor_used)
-        dialect = self._session.get_bind().dialect.name
-
-        items_count = len(response_json.get("shows") or [])
-        has_more = response_json.get("hasMore")
-        next_cursor = response_json.get("nextCursor")
-
-        logger.debug(
-            "SAPI_DB_RAW_APPEND_START run_id=%s cursor_used=%s items_count=%d has_more=%s next_cursor=%s dialect=%s",
-            run_id,
-            cursor_norm,
-            items_count,
-            has_more,
-            next_cursor,
-            dialect,
-        )
+        dialect = self._dialect
 
-        # Hash + payload size timing (do once, reuse)
-        t0 = time.perf_counter()
-        payload_bytes = _stable_json_bytes(response_json)
-        response_hash = _hash_bytes(payload_bytes)
-        hash_ms = (time.perf_counter() - t0) * 1000.0
+        meta = _page_meta(response_json)
+        items_count, has_more, next_cursor = meta
+
+        if logger.isEnabledFor(logging.DEBUG):
+            _emit_start(run_id, cursor_norm, meta, dialect)
 
-        row = {
-            "run_id": run_id,
-            "cursor_used": cursor_norm,
-            "fetched_at": fetched_at,
-            "has_more": has_more,
-            "next_cursor": next_cursor,
-            "items_count": items_count,
-            "response_json": response_json,
-            "response_hash": response_hash,
-        }
-
-        if dialect == "postgresql":
-            from sqlalchemy.dialects.postgresql import insert
-        elif dialect == "sqlite":
-            from sqlalchemy.dialects.sqlite import insert
-        else:
-            raise NotImplementedError(f"raw append not implemented for {dialect}")
-
-        stmt = (
-            insert(SapiRawPage.__table__)
-            .values(row)
-            .on_conflict_do_nothing(index_elements=["run_id", "cursor_used"])
+        # Timings only feed the SUCCESS log; skip the clock reads when INFO is
+        # off (a FAILED log then reports them as nan).
+        timed = logger.isEnabledFor(logging.INFO)
+        hash_ns = db_ns = None
+
+        if timed:
+            t0 = time.perf_counter_ns()
+        payload_bytes = (
+            response_bytes
+            if response_bytes is not None
+            else _stable_json_bytes(response_json)
+        )
+        response_hash = _hash_bytes(payload_bytes) if _sample_hash() else None
+        if timed:
+            hash_ns = time.perf_counter_ns() - t0
+        payload_len = len(payload_bytes)
+
+        row = _page_row(
+            run_id=run_id,
+            cursor_norm=cursor_norm,
+            fetched_at=fetched_at,
+            meta=meta,
+            payload_bytes=payload_bytes,
+            response_hash=response_hash,
         )
 
-        t1 = time.perf_counter()
+        if timed:
+            t1 = time.perf_counter_ns()
         try:
-            result = self._session.execute(stmt)
-            db_ms = (time.perf_counter() - t1) * 1000.0
+            result = self._session.execute(self._append_stmt, row)
 
             # rowcount is 1 if inserted, 0 if conflict-do-nothing
             inserted = bool(getattr(result, "rowcount", 0))
 
-            logger.info(
-                "SAPI_DB_RAW_APPEND_SUCCESS run_id=%s cursor_used=%s inserted=%s items_count=%d has_more=%s next_cursor=%s "
+            if timed:
+                db_ns = time.perf_counter_ns() - t1
+                logger.info(
+                    "SAPI_DB_RAW_APPEND_SUCCESS run_id=%s cursor_used=%s inserted=%s items_count=%d has_more=%s next_cursor=%s "
+                    "payload_bytes=%d hash_ms=%.2f db_ms=%.2f dialect=%s",
+                    run_id,
+                    cursor_norm,
+                    inserted,
+                    items_count,
+                    has_more,
+                    next_cursor,
+                    payload_len,
+                    hash_ns / 1e6,
+                    db_ns / 1e6,
+                    dialect,
+                )
+            return inserted
+
+        except Exception:
+            if timed:
+                db_ns = time.perf_counter_ns() - t1
+            logger.exception(
+                "SAPI_DB_RAW_APPEND_FAILED run_id=%s cursor_used=%s items_count=%d has_more=%s next_cursor=%s "
                 "payload_bytes=%d hash_ms=%.2f db_ms=%.2f dialect=%s",
                 run_id,
                 cursor_norm,
-                inserted,
                 items_count,
                 has_more,
                 next_cursor,
-                len(payload_bytes),
+                payload_len,
+                _ns_to_ms(hash_ns),
+                _ns_to_ms(db_ns),
+                dialect,
+            )
+            raise
+
+    def append_pages_bulk(self, pages: Sequence[dict[str, Any]]) -> int:
+        """
+        Append many raw page blobs in as few round-trips as possible.
+
+        Each page is a dict with append_page's keyword arguments (run_id,
+        cursor_used, fetched_at, response_json, optional response_bytes), with
+        the same idempotency and hash-sampling rules. All pages are serialized
+        and (if sampled) hashed up front, then written as chunk_size-row
+        INSERT ... ON CONFLICT DO NOTHING statements, or on PostgreSQL with at
+        least copy_threshold pages, COPY'd into a staging table and merged.
+
+        Returns:
+            Number of pages inserted (conflicting pages are skipped).
+        """
+        if not pages:
+            return 0
+
+        dialect = self._dialect
+        insert = self._insert
+        run_id = pages[0]["run_id"]
+
+        t0 = time.perf_counter()
+        payloads = [
+            p["response_bytes"]
+            if p.get("response_bytes") is not None
+            else _stable_json_bytes(p["response_json"])
+            for p in pages
+        ]
+        sampled = [i for i in range(len(payloads)) if _sample_hash()]
+        hashes: list[bytes | None] = [None] * len(payloads)
+        for i, digest in zip(sampled, _hash_many([payloads[i] for i in sampled])):
+            hashes[i] = digest
+        hash_ms = (time.perf_counter() - t0) * 1000.0
+
+        use_copy = (
+            dialect == "postgresql"
+            and self._copy_threshold is not None
+            and len(pages) >= self._copy_threshold
+        )
+
+        rows = []
+        for page, payload_bytes, response_hash in zip(pages, payloads, hashes):
+            row = _page_row(
+                run_id=page["run_id"],
+                cursor_norm=_normalize_cursor_used(page.get("cursor_used")),
+                fetched_at=page["fetched_at"],
+                meta=_page_meta(page["response_json"]),
+                payload_bytes=payload_bytes,
+                response_hash=response_hash,
+            )
+            # COPY takes the text as is; a multi-row INSERT binds it per dialect.
+            if not use_copy:
+                row["response_json"] = _json_column_value(row["response_json"], dialect)
+            rows.append(row)
+
+        payload_total = sum(len(b) for b in payloads)
+
+        t1 = time.perf_counter()
+        try:
+            if use_copy:
+                inserted = self._copy_append(rows)
+            else:
+                inserted = 0
+                for chunk in _chunks(rows, self._chunk_size):
+                    stmt = (
+                        insert(SapiRawPage.__table__)
+                        .values(chunk)
+                        .on_conflict_do_nothing(index_elements=["run_id", "cursor_used"])
+                    )
+                    inserted += self._session.execute(stmt).rowcount or 0
+            db_ms = (time.perf_counter() - t1) * 1000.0
+
+            logger.info(
+                "SAPI_DB_RAW_APPEND_BULK_SUCCESS run_id=%s pages=%d inserted=%d payload_bytes=%d "
+                "hash_ms=%.2f db_ms=%.2f copy=%s dialect=%s",
+                run_id,
+                len(rows),
+                inserted,
+                payload_total,
                 hash_ms,
                 db_ms,
+                use_copy,
                 dialect,
             )
             return inserted
@@ -157,16 +525,44 @@ class SapiRawPagesStore:
         except Exception:
             db_ms = (time.perf_counter() - t1) * 1000.0
             logger.exception(
-                "SAPI_DB_RAW_APPEND_FAILED run_id=%s cursor_used=%s items_count=%d has_more=%s next_cursor=%s "
-                "payload_bytes=%d hash_ms=%.2f db_ms=%.2f dialect=%s",
+                "SAPI_DB_RAW_APPEND_BULK_FAILED run_id=%s pages=%d payload_bytes=%d "
+                "hash_ms=%.2f db_ms=%.2f copy=%s dialect=%s",
                 run_id,
-                cursor_norm,
-                items_count,
-                has_more,
-                next_cursor,
-                len(payload_bytes),
+                len(rows),
+                payload_total,
                 hash_ms,
                 db_ms,
+                use_copy,
                 dialect,
             )
             raise
+
+    def _copy_append(self, rows: list[dict[str, Any]]) -> int:
+        """
+        PostgreSQL bulk path: COPY pages into a temp staging table, then
+        INSERT ... SELECT ... ON CONFLICT DO NOTHING (same as SapiIndicesStore).
+        """
+        table = SapiRawPage.__table__
+        quote = self._session.get_bind().dialect.identifier_preparer.quote
+        columns = list(rows[0])
+        col_list = ", ".join(quote(c) for c in columns)
+        target = quote(table.name)
+        staging = quote(f"_stg_{table.name}")
+
+        buf = _copy_buffer(rows, columns)
+
+        dbapi_conn = self._session.connection().connection.dbapi_connection
+        with dbapi_conn.cursor() as cur:
+            # Only the copied columns (no id): the target's serial default is not
+            # carried over, so staging rows don't burn sequence values.
+            cur.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DELETE ROWS "
+                f"AS SELECT {col_list} FROM {target} WITH NO DATA"
+            )
+            cur.execute(f"TRUNCATE {staging}")
+            cur.copy_expert(f"COPY {staging} ({col_list}) FROM STDIN", buf)
+            cur.execute(
+                f"INSERT INTO {target} ({col_list}) SELECT {col_list} FROM {staging} "
+                f"ON CONFLICT (run_id, cursor_used) DO NOTHING"
+            )
+            return cur.rowcount
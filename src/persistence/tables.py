@@ -25,7 +25,9 @@ from sqlalchemy import (
     Index,
     Integer,
     JSON,
+    LargeBinary,
     String,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -63,6 +65,21 @@ class AssetKind(str, Enum):
     HORIZONTAL_BACKDROP = "horizontalBackdrop"
 
 
+class SapiRunStatus(str, Enum):
+    """
+    Lifecycle state of an ingestion run: started -> running -> completed | failed.
+
+    Stored by value (lowercase), unlike the other enums here, so existing
+    string rows convert in place and literal predicates like
+    `status = 'completed'` keep working.
+    """
+
+    STARTED = "started"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class SapiRawPage(Base):
     """
     Append-only storage for raw SAPI page responses.
@@ -88,7 +105,13 @@ class SapiRawPage(Base):
     items_count: Mapped[int | None] = mapped_column(nullable=True)
 
     response_json: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
-    response_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Raw 32-byte digest (bytea / BLOB), half the size of hex text.
+    # Existing Postgres tables: ALTER TABLE sapi_raw_pages ALTER COLUMN response_hash
+    #   TYPE bytea USING decode(response_hash, 'hex');
+    response_hash: Mapped[bytes | None] = mapped_column(LargeBinary(32), nullable=True)
+    # Digest algorithm of response_hash ("blake3"); NULL on older rows means SHA-256.
+    # Existing tables: ALTER TABLE sapi_raw_pages ADD COLUMN hash_algo varchar;
+    hash_algo: Mapped[str | None] = mapped_column(String, nullable=True)
 
     __table_args__ = (
         UniqueConstraint("run_id", "cursor_used", name="uq_sapi_raw_pages_run_cursor"),
@@ -296,11 +319,15 @@ class SapiRunLedger(Base):
         doc="Stable hash of request parameters that define membership/order for this run.",
     )
 
-    status: Mapped[str] = mapped_column(
-        String,
+    status: Mapped[SapiRunStatus] = mapped_column(
+        SAEnum(
+            SapiRunStatus,
+            name="sapi_run_status",
+            values_callable=lambda e: [m.value for m in e],
+        ),
         nullable=False,
-        default="started",
-        doc="Run status string: started | running | completed | failed.",
+        default=SapiRunStatus.STARTED,
+        doc="Run status: started | running | completed | failed.",
     )
     started_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -337,13 +364,87 @@ class SapiRunLedger(Base):
     )
 
     __table_args__ = (
+        # latest_completed_run_id: partial on completed runs, keyed in ORDER BY
+        # order and covering run_id, so Postgres answers it with an index-only
+        # scan of one scope's completed runs.
         Index(
-            "ix_sapi_run_ledger_scope_status_ended",
+            "ix_sapi_run_ledger_latest_completed",
             "country",
             "catalogs_bundle",
             "params_fingerprint",
-            "status",
             "ended_at",
+            "started_at",
+            postgresql_include=["run_id"],
+            postgresql_where=text("status = 'completed'"),
+            sqlite_where=text("status = 'completed'"),
         ),
         Index("ix_sapi_run_ledger_status_started", "status", "started_at"),
     )
+
+
+class SapiRunCheckpoint(Base):
+    """
+    Append-only checkpoint log for a run (optional ledger mode).
+
+    Purpose
+    - One INSERT per checkpoint instead of an UPDATE of the ledger row.
+    - The newest row (highest `seq`) for a run_id holds the resume cursor.
+    - Compaction folds a run's rows into its `SapiRunLedger` row (counters,
+      cursor, status) and deletes them.
+    """
+
+    __tablename__ = "sapi_run_checkpoints"
+
+    seq: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    run_id: Mapped[str] = mapped_column(String, nullable=False)
+    cursor_next: Mapped[str | None] = mapped_column(String, nullable=True)
+    has_more: Mapped[bool | None] = mapped_column(nullable=True)
+    pages: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        doc="Pages persisted since the previous checkpoint.",
+    )
+    items: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        doc="Show items persisted since the previous checkpoint.",
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    __table_args__ = (
+        # Resume: newest checkpoint of a run is one backward index probe.
+        Index("ix_sapi_run_checkpoints_run_seq", "run_id", "seq"),
+    )
+
+
+class SapiFetchLedger(Base):
+    """
+    Per-show HTTP validators for conditional refreshes of `/shows/{id}`.
+
+    Purpose:
+    - Remember the `ETag` / `Last-Modified` SAPI returned for a show so the next
+      refresh can send `If-None-Match` / `If-Modified-Since` and receive an
+      empty 304 when nothing changed.
+
+    Primary key:
+    - `sapi_id`
+    """
+
+    __tablename__ = "sapi_fetch_ledger"
+
+    sapi_id: Mapped[str] = mapped_column(String, primary_key=True)
+
+    etag: Mapped[str | None] = mapped_column(String, nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    checked_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        doc="UTC timestamp of the last request for this show (200 or 304).",
+    )
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        doc="UTC timestamp of the last 200 response (body actually re-downloaded).",
+    )
@@ -14,6 +14,13 @@ What it does:
 What it does not do:
 - No locking or concurrency coordination (v0).
 
+Checkpoint log mode (checkpoint_log=True):
+- Checkpoints are INSERTed into `sapi_run_checkpoints` instead of UPDATEing the
+  run row; the resume cursor is the newest log row.
+- compact() folds the log into the run row (counters, cursor, status) and
+  deletes it. It runs on completion, in mark_failed/mark_completed, and can be
+  called from a periodic job.
+
 Important invariant:
 - Update `cursor_next` only after raw page persistence + index upserts succeed,
   and do it in the same DB transaction (worker responsibility).
@@ -22,25 +29,31 @@ Important invariant:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Iterable
+from datetime import datetime, timedelta
+from functools import cache
+from typing import Any, Iterable
 
 import logging
-from sqlalchemy import Select, select, update
-from sqlalchemy.exc import IntegrityError
+import time
+from sqlalchemy import Integer, Select, bindparam, delete, func, insert, select, update
 from sqlalchemy.orm import Session
 
+from src.persistence.stores.indices import _INSERT_BY_DIALECT
+from src.persistence.stores.raw import SapiRawPagesStore, _append_stmt, _page_params
 from src.persistence.tables import (
+    SapiRawPage,
+    SapiRunCheckpoint,
     SapiRunLedger,
+    SapiRunStatus,
 )
 
 logger = logging.getLogger(__name__)
 
 
-STATUS_STARTED = "started"
-STATUS_RUNNING = "running"
-STATUS_COMPLETED = "completed"
-STATUS_FAILED = "failed"
+STATUS_STARTED = SapiRunStatus.STARTED
+STATUS_RUNNING = SapiRunStatus.RUNNING
+STATUS_COMPLETED = SapiRunStatus.COMPLETED
+STATUS_FAILED = SapiRunStatus.FAILED
 
 
 @dataclass(frozen=True)
@@ -69,6 +82,9 @@ def canonical_catalogs_bundle(catalogs: Iterable[str]) -> str:
     return ",".join(sorted({c.strip() for c in catalogs if c and c.strip()}))
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
 def _utcnow_naive() -> datetime:
     """
     Return a naive UTC timestamp.
@@ -76,8 +92,68 @@ def _utcnow_naive() -> datetime:
     Note:
         The models currently use `DateTime` without timezone info, so we keep
         naive UTC consistently.
+
+    Built as epoch + time.time() rather than datetime.now(timezone.utc) without
+    tzinfo: no aware intermediate and no tz conversion (about 1.7x faster), and
+    unlike datetime.utcfromtimestamp it is not deprecated on Python 3.12+.
+    """
+    return _EPOCH + timedelta(seconds=time.time())
+
+
+@dataclass(frozen=True)
+class CheckpointCounts:
+    """
+    Run counters as written by a checkpoint (read back via RETURNING).
     """
-    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    pages_processed: int
+    items_processed: int
+
+
+@dataclass(frozen=True)
+class RunResume:
+    """
+    Handshake result: the cursor to request next and the run's status as found.
+    """
+
+    cursor_next: str | None
+    status: SapiRunStatus
+
+
+@cache
+def _append_and_checkpoint_stmt():
+    """
+    PostgreSQL: raw-page insert and ledger checkpoint as one statement.
+
+        WITH ins AS (INSERT INTO sapi_raw_pages ... ON CONFLICT DO NOTHING RETURNING id),
+             upd AS (UPDATE sapi_run_ledger SET ... WHERE run_id = :run_id
+                     RETURNING pages_processed, items_processed)
+        SELECT (SELECT count(*) FROM ins), upd.pages_processed, upd.items_processed
+        FROM upd
+
+    Both CTEs share :run_id; ledger values are bound as ledger_* parameters.
+    """
+    ins = _append_stmt("postgresql").returning(SapiRawPage.id).cte("ins")
+    upd = (
+        update(SapiRunLedger)
+        .where(SapiRunLedger.run_id == bindparam("run_id"))
+        .values(
+            status=bindparam("ledger_status", type_=SapiRunLedger.__table__.c.status.type),
+            ended_at=bindparam("ledger_ended_at"),
+            last_error=None,
+            cursor_next=bindparam("ledger_cursor_next"),
+            pages_processed=SapiRunLedger.pages_processed + 1,
+            items_processed=SapiRunLedger.items_processed
+            + bindparam("ledger_items", type_=Integer),
+        )
+        .returning(SapiRunLedger.pages_processed, SapiRunLedger.items_processed)
+        .cte("upd")
+    )
+    return select(
+        select(func.count()).select_from(ins).scalar_subquery().label("inserted"),
+        upd.c.pages_processed,
+        upd.c.items_processed,
+    )
 
 
 class SapiRunLedgerStore:
@@ -101,12 +177,22 @@ class SapiRunLedgerStore:
             )
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, *, checkpoint_log: bool = False) -> None:
         """
         Args:
             session: SQLAlchemy Session bound to the source-store database.
+            checkpoint_log: Append checkpoints to sapi_run_checkpoints instead of
+                updating the run row (see module docstring).
         """
         self._session = session
+        self._checkpoint_log = checkpoint_log
+
+        # checkpoint_many() buffer, written by flush_checkpoint().
+        self._pending_run_id: str | None = None
+        self._pending_pages = 0
+        self._pending_items = 0
+        self._pending_cursor: str | None = None
+        self._pending_has_more: bool | None = None
 
     # ---------------------------------------------------------------------
     # Run creation / lookup
@@ -129,45 +215,67 @@ class SapiRunLedgerStore:
         Create the run row if missing; otherwise return the existing row.
 
         The row starts in STATUS_STARTED.
-        """
-        row = self._session.get(SapiRunLedger, run_id)
-        if row is not None:
-            return row
 
-        row = SapiRunLedger(
-            run_id=run_id,
-            country=scope.country,
-            catalogs_bundle=scope.catalogs_bundle,
-            params_fingerprint=scope.params_fingerprint,
-            status=STATUS_STARTED,
-            started_at=started_at or _utcnow_naive(),
-            ended_at=None,
-            last_error=None,
-            cursor_next=None,
-            pages_processed=0,
-            items_processed=0,
-        )
+        One round-trip either way: INSERT ... ON CONFLICT (run_id) DO UPDATE
+        RETURNING. On conflict (resume, or a concurrent insert won) the update
+        assigns status to itself, which changes nothing but makes RETURNING
+        hand back the existing row.
 
-        self._session.add(row)
-        try:
-            # Flush so the caller sees integrity errors early if run_id clashes.
-            self._session.flush()
-        except IntegrityError:
-            # Another transaction inserted it first. Load and return.
-            self._session.rollback()
-            existing = self._session.get(SapiRunLedger, run_id)
-            if existing is None:
-                raise
-            return existing
+        That no-op update is still a write: on Postgres every resume leaves a
+        dead tuple behind (HOT-pruned or vacuumed later) and takes the row lock
+        until the transaction ends, so a second run on the same run_id waits
+        for the first handshake to commit.
+
+        Logs sapi_ledger_run_resumed when the row already made progress
+        (pages_processed > 0 or status past STARTED), else sapi_ledger_run_started.
+        """
+        stmt = (
+            _INSERT_BY_DIALECT[self._session.get_bind().dialect.name](SapiRunLedger)
+            .values(
+                run_id=run_id,
+                country=scope.country,
+                catalogs_bundle=scope.catalogs_bundle,
+                params_fingerprint=scope.params_fingerprint,
+                status=STATUS_STARTED,
+                started_at=started_at or _utcnow_naive(),
+                ended_at=None,
+                last_error=None,
+                cursor_next=None,
+                pages_processed=0,
+                items_processed=0,
+            )
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["run_id"],
+            set_={"status": SapiRunLedger.__table__.c.status},
+        ).returning(SapiRunLedger)
+        row = self._session.execute(stmt).scalar_one()
 
+        resumed = row.pages_processed > 0 or row.status is not STATUS_STARTED
         logger.info(
-            "sapi_ledger_run_started run_id=%s country=%s catalogs=%s",
+            "%s run_id=%s country=%s catalogs=%s status=%s pages=%d",
+            "sapi_ledger_run_resumed" if resumed else "sapi_ledger_run_started",
             run_id,
             scope.country,
             scope.catalogs_bundle,
+            row.status.value,
+            row.pages_processed,
         )
         return row
 
+    def start_or_resume(self, *, run_id: str, scope: SapiRunScope) -> RunResume:
+        """
+        Run handshake: ensure the row exists and return the cursor to request
+        next (None for the first page) together with the run's status.
+
+        Both come back with ensure_started's RETURNING, so this is one
+        round-trip. In checkpoint_log mode a newer cursor may sit in the log,
+        which costs one more read (see get_cursor_next).
+        """
+        row = self.ensure_started(run_id=run_id, scope=scope)
+        cursor_next = self.get_cursor_next(run_id) if self._checkpoint_log else row.cursor_next
+        return RunResume(cursor_next=cursor_next, status=row.status)
+
     # ---------------------------------------------------------------------
     # Cursor checkpointing
     # ---------------------------------------------------------------------
@@ -176,12 +284,27 @@ class SapiRunLedgerStore:
         """
         Return the cursor to use for the next request.
 
-        None means "first page" (omit cursor param in the API call).
+        None means "first page" (omit cursor param in the API call), and is
+        also returned for an unknown run_id.
+
+        Selects only the cursor_next column: no full-row load, ORM hydration
+        or identity-map entry. The value always comes from the database, so
+        use get() instead if you need to modify the row.
+
+        In checkpoint_log mode the newest uncompacted log row wins.
         """
-        row = self._session.get(SapiRunLedger, run_id)
-        if row is None:
-            return None
-        return row.cursor_next
+        if self._checkpoint_log:
+            logged = self._session.execute(
+                select(SapiRunCheckpoint.cursor_next)
+                .where(SapiRunCheckpoint.run_id == run_id)
+                .order_by(SapiRunCheckpoint.seq.desc())
+                .limit(1)
+            ).first()
+            if logged is not None:
+                return logged.cursor_next
+
+        stmt = select(SapiRunLedger.cursor_next).where(SapiRunLedger.run_id == run_id)
+        return self._session.execute(stmt).scalar_one_or_none()
 
     def set_running(self, run_id: str) -> None:
         """
@@ -203,7 +326,7 @@ class SapiRunLedgerStore:
         next_cursor: str | None,
         has_more: bool | None,
         items_count: int,
-    ) -> None:
+    ) -> CheckpointCounts | None:
         """
         Advance the run checkpoint after a page was durably persisted.
 
@@ -217,9 +340,112 @@ class SapiRunLedgerStore:
             has_more: Value from provider response (response.hasMore). If False,
                 run is marked completed with ended_at set.
             items_count: Number of show items in this page (used for counters).
+
+        Returns:
+            The updated counters (via RETURNING, no second SELECT), or None if
+            run_id has no ledger row. Always None in checkpoint_log mode, where
+            the counters are only totalled by compact().
+        """
+        return self._advance(
+            run_id=run_id,
+            delta_pages=1,
+            delta_items=int(items_count),
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    def checkpoint_many(
+        self,
+        *,
+        run_id: str,
+        delta_pages: int,
+        delta_items: int,
+        next_cursor: str | None,
+        has_more: bool | None,
+    ) -> None:
+        """
+        Buffer a checkpoint in memory; flush_checkpoint() writes it.
+
+        Deltas for the same run sum; next_cursor and has_more keep the latest
+        value. Buffering a different run_id first flushes the pending one.
+
+        Same invariant as checkpoint_after_page: call only after the pages'
+        raw blobs and indices are persisted, and flush_checkpoint() inside the
+        same transaction before it commits, so the cursor still advances
+        atomically with the data.
+        """
+        if self._pending_run_id is not None and self._pending_run_id != run_id:
+            self.flush_checkpoint()
+
+        self._pending_run_id = run_id
+        self._pending_pages += int(delta_pages)
+        self._pending_items += int(delta_items)
+        self._pending_cursor = next_cursor
+        self._pending_has_more = has_more
+
+    def flush_checkpoint(self) -> CheckpointCounts | None:
+        """
+        Write the checkpoint_many() buffer as a single UPDATE.
+
+        Returns:
+            The updated counters, or None if nothing was pending or run_id has
+            no ledger row.
         """
+        run_id = self._pending_run_id
+        if run_id is None:
+            return None
+
+        delta_pages, delta_items = self._pending_pages, self._pending_items
+        next_cursor, has_more = self._pending_cursor, self._pending_has_more
+        self._pending_run_id = None
+        self._pending_pages = self._pending_items = 0
+        self._pending_cursor = self._pending_has_more = None
+
+        return self._advance(
+            run_id=run_id,
+            delta_pages=delta_pages,
+            delta_items=delta_items,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    def _advance(
+        self,
+        *,
+        run_id: str,
+        delta_pages: int,
+        delta_items: int,
+        next_cursor: str | None,
+        has_more: bool | None,
+    ) -> CheckpointCounts | None:
+        """
+        UPDATE the counters by the given deltas and set the cursor/status
+        (or, in checkpoint_log mode, append them to the log).
+        """
+        if self._checkpoint_log:
+            self._session.execute(
+                insert(SapiRunCheckpoint).values(
+                    run_id=run_id,
+                    cursor_next=next_cursor,
+                    has_more=has_more,
+                    pages=delta_pages,
+                    items=delta_items,
+                    created_at=_utcnow_naive(),
+                )
+            )
+            logger.info(
+                "sapi_ledger_checkpoint run_id=%s pages+=%d items+=%d has_more=%s logged=1",
+                run_id,
+                delta_pages,
+                delta_items,
+                has_more,
+            )
+            if has_more is False:
+                self.compact(run_id)
+            return None
+
         ended_at: datetime | None = None
-        status: str = STATUS_RUNNING
+        status: SapiRunStatus = STATUS_RUNNING
 
         if has_more is False:
             status = STATUS_COMPLETED
@@ -233,18 +459,164 @@ class SapiRunLedgerStore:
                 ended_at=ended_at,
                 last_error=None,
                 cursor_next=next_cursor,
-                pages_processed=SapiRunLedger.pages_processed + 1,
-                items_processed=SapiRunLedger.items_processed + int(items_count),
+                pages_processed=SapiRunLedger.pages_processed + delta_pages,
+                items_processed=SapiRunLedger.items_processed + delta_items,
             )
+            .returning(SapiRunLedger.pages_processed, SapiRunLedger.items_processed)
         )
-        self._session.execute(stmt)
+        row = self._session.execute(stmt).one_or_none()
+        counts = (
+            CheckpointCounts(
+                pages_processed=row.pages_processed,
+                items_processed=row.items_processed,
+            )
+            if row is not None
+            else None
+        )
+
+        logger.info(
+            "sapi_ledger_checkpoint run_id=%s pages=%s items=%s pages+=%d items+=%d status=%s has_more=%s",
+            run_id,
+            counts.pages_processed if counts is not None else None,
+            counts.items_processed if counts is not None else None,
+            delta_pages,
+            delta_items,
+            status.value,
+            has_more,
+        )
+        return counts
+
+    def append_page_and_checkpoint(
+        self,
+        *,
+        run_id: str,
+        cursor_used: str | None,
+        fetched_at: datetime,
+        response_json: dict[str, Any],
+        response_bytes: bytes | None = None,
+        next_cursor: str | None,
+        has_more: bool | None,
+        items_count: int,
+    ) -> bool:
+        """
+        Append the raw page and advance the checkpoint in one round-trip.
+
+        Same semantics as SapiRawPagesStore.append_page followed by
+        checkpoint_after_page; the caller must already have upserted the page's
+        indices in the same transaction. On PostgreSQL both writes go out as a
+        single statement with two data-modifying CTEs; other dialects (SQLite
+        has no writable CTEs) and checkpoint_log mode fall back to the two calls.
+
+        Returns:
+            True if the raw page was inserted, False if it already existed.
+        """
+        if self._checkpoint_log or self._session.get_bind().dialect.name != "postgresql":
+            inserted = SapiRawPagesStore(self._session).append_page(
+                run_id=run_id,
+                cursor_used=cursor_used,
+                fetched_at=fetched_at,
+                response_json=response_json,
+                response_bytes=response_bytes,
+            )
+            self.checkpoint_after_page(
+                run_id=run_id,
+                next_cursor=next_cursor,
+                has_more=has_more,
+                items_count=items_count,
+            )
+            return inserted
+
+        status = STATUS_COMPLETED if has_more is False else STATUS_RUNNING
+        params = _page_params(
+            run_id=run_id,
+            cursor_used=cursor_used,
+            fetched_at=fetched_at,
+            response_json=response_json,
+            response_bytes=response_bytes,
+        )
+        params.update(
+            ledger_status=status,
+            ledger_ended_at=_utcnow_naive() if has_more is False else None,
+            ledger_cursor_next=next_cursor,
+            ledger_items=int(items_count),
+        )
+
+        # No row when run_id is unknown: the UPDATE matched nothing, and with it
+        # the SELECT; the raw insert still ran (same as the two-call path).
+        row = self._session.execute(_append_and_checkpoint_stmt(), params).one_or_none()
+        inserted = bool(row.inserted) if row is not None else False
 
         logger.info(
-            "sapi_ledger_checkpoint run_id=%s pages+=1 items+=%d status=%s has_more=%s",
+            "sapi_ledger_checkpoint run_id=%s pages=%s items=%s items+=%d status=%s has_more=%s raw_inserted=%s fused=1",
             run_id,
+            row.pages_processed if row is not None else None,
+            row.items_processed if row is not None else None,
             int(items_count),
-            status,
+            status.value,
             has_more,
+            inserted,
+        )
+        return inserted
+
+    def compact(self, run_id: str) -> CheckpointCounts | None:
+        """
+        Fold the run's checkpoint log into its ledger row and delete the log.
+
+        Counters grow by the logged deltas; cursor_next and status come from
+        the newest log row (completed with ended_at if it had has_more=False,
+        else running). Runs in the caller's transaction.
+
+        Returns:
+            The updated counters, or None if nothing was logged (or run_id has
+            no ledger row).
+        """
+        log = SapiRunCheckpoint
+        max_seq, pages, items, rows = self._session.execute(
+            select(
+                func.max(log.seq),
+                func.coalesce(func.sum(log.pages), 0),
+                func.coalesce(func.sum(log.items), 0),
+                func.count(),
+            ).where(log.run_id == run_id)
+        ).one()
+        if max_seq is None:
+            return None
+
+        newest = self._session.execute(
+            select(log.cursor_next, log.has_more).where(log.seq == max_seq)
+        ).one()
+        completed = newest.has_more is False
+
+        row = self._session.execute(
+            update(SapiRunLedger)
+            .where(SapiRunLedger.run_id == run_id)
+            .values(
+                status=STATUS_COMPLETED if completed else STATUS_RUNNING,
+                ended_at=_utcnow_naive() if completed else None,
+                last_error=None,
+                cursor_next=newest.cursor_next,
+                pages_processed=SapiRunLedger.pages_processed + pages,
+                items_processed=SapiRunLedger.items_processed + items,
+            )
+            .returning(SapiRunLedger.pages_processed, SapiRunLedger.items_processed)
+        ).one_or_none()
+        self._session.execute(
+            delete(log).where(log.run_id == run_id).where(log.seq <= max_seq)
+        )
+
+        logger.info(
+            "sapi_ledger_compacted run_id=%s log_rows=%d pages+=%d items+=%d completed=%s",
+            run_id,
+            rows,
+            pages,
+            items,
+            completed,
+        )
+        if row is None:
+            return None
+        return CheckpointCounts(
+            pages_processed=row.pages_processed,
+            items_processed=row.items_processed,
         )
 
     # ---------------------------------------------------------------------
@@ -257,6 +629,8 @@ class SapiRunLedgerStore:
         """
         Mark the run as failed and store a human-readable error summary.
         """
+        if self._checkpoint_log:
+            self.compact(run_id)
         stmt = (
             update(SapiRunLedger)
             .where(SapiRunLedger.run_id == run_id)
@@ -274,6 +648,8 @@ class SapiRunLedgerStore:
         """
         Mark the run as completed (independent of checkpointing).
         """
+        if self._checkpoint_log:
+            self.compact(run_id)
         stmt = (
             update(SapiRunLedger)
             .where(SapiRunLedger.run_id == run_id)
@@ -0,0 +1,142 @@
+"""
+SAPI single-show refresher (conditional GET).
+
+Purpose
+- Re-fetch individual shows via `/shows/{id}` and re-extract their indices.
+- Send the ETag / Last-Modified stored from the previous fetch, so unchanged
+  shows come back as an empty 304: no body on the wire, no JSON parse, and
+  `extract_show` is skipped.
+
+Per show, on 200 (one DB transaction):
+  1) raw response blob (append-only; cursor_used is the endpoint path)
+  2) extracted indices (upserts)
+  3) new validators in the fetch ledger
+
+Hard invariants
+- Never keep a DB transaction open during HTTP.
+
+Notes
+- A 304 does not touch the indices, so those rows keep their previous
+  `last_seen_run_id`. Refresh runs are not ledger scopes and do not take part
+  in `latest_completed_run_id` currentness checks.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from src.client.client import SapiClient
+from src.client.extract import extract_show
+from src.persistence.engine import DatabaseManager
+from src.persistence.stores.fetch_ledger import SapiFetchLedgerStore
+from src.persistence.stores.indices import SapiIndicesStore
+from src.persistence.stores.raw import SapiRawPagesStore
+from src.pipeline.ledger import _utcnow_naive
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RefreshCounts:
+    """
+    Outcome of a refresh pass.
+
+    changed:
+        Shows re-downloaded (200) and re-extracted.
+    not_modified:
+        Shows SAPI reported unchanged (304); nothing was re-extracted.
+    """
+
+    changed: int
+    not_modified: int
+
+
+class SapiShowRefresher:
+    """
+    Conditional refresher for individual SAPI shows.
+    """
+
+    def __init__(self, *, db_manager: DatabaseManager, sapi_client: SapiClient) -> None:
+        """
+        Args:
+            db_manager: Provides SQLAlchemy Session context manager.
+            sapi_client: Thin HTTP client for SAPI.
+        """
+        self._db = db_manager
+        self._client = sapi_client
+
+    def refresh_shows(
+        self,
+        *,
+        sapi_ids: Iterable[str],
+        query_params: dict[str, Any] | None = None,
+        run_id: str | None = None,
+    ) -> RefreshCounts:
+        """
+        Refresh each show, skipping extraction for unchanged ones.
+
+        Args:
+            sapi_ids: Shows to refresh.
+            query_params: Extra params for `/shows/{id}` (e.g. country).
+            run_id: Written as last_seen_run_id / raw run_id. Generated if omitted.
+
+        Returns:
+            RefreshCounts for this pass.
+        """
+        run_id = run_id or str(uuid.uuid4())
+        params = dict(query_params or {})
+        changed = 0
+        not_modified = 0
+
+        for sapi_id in sapi_ids:
+            endpoint = f"/shows/{sapi_id}"
+
+            with self._db.get_session() as session:
+                prev = SapiFetchLedgerStore(session).get(sapi_id)
+                etag = prev.etag if prev is not None else None
+                last_modified = prev.last_modified if prev is not None else None
+
+            fetched_at = _utcnow_naive()
+            result = self._client.fetch_if_changed(
+                endpoint, params, etag=etag, last_modified=last_modified
+            )
+
+            with self._db.get_session() as session:
+                with session.begin():
+                    fetch_ledger = SapiFetchLedgerStore(session)
+
+                    if result.not_modified:
+                        fetch_ledger.record_not_modified(
+                            sapi_id=sapi_id, checked_at=fetched_at
+                        )
+                        not_modified += 1
+                        continue
+
+                    SapiRawPagesStore(session).append_page(
+                        run_id=run_id,
+                        cursor_used=endpoint,
+                        fetched_at=fetched_at,
+                        response_json=result.payload,
+                        response_bytes=result.content,
+                    )
+                    SapiIndicesStore(session).upsert_all(
+                        *extract_show(result.payload, fetched_at=fetched_at, run_id=run_id)
+                    )
+                    fetch_ledger.record_changed(
+                        sapi_id=sapi_id,
+                        etag=result.etag,
+                        last_modified=result.last_modified,
+                        fetched_at=fetched_at,
+                    )
+                    changed += 1
+
+        logger.info(
+            "SAPI_REFRESH_DONE run_id=%s changed=%d not_modified=%d",
+            run_id,
+            changed,
+            not_modified,
+        )
+        return RefreshCounts(changed=changed, not_modified=not_modified)
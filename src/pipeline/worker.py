@@ -4,17 +4,24 @@ SAPI backfill worker.
 Purpose
 - Run a cursor-based crawl for one SAPI scope (country + catalogs bundle + params fingerprint).
 - Fetch pages from SAPI.
-- Persist, atomically per page:
-  1) raw page blob (append-only)
-  2) extracted indices (upserts)
-  3) ledger checkpoint (cursor_next + counters)
+- Persist, atomically per batch of up to raw_batch_size pages:
+  1) extracted indices (upserts)
+  2) raw page blobs (append-only, one multi-row INSERT)
+  3) ledger checkpoint (cursor_next + counters, one UPDATE)
+  (single-page batches write 2 and 3 as one statement on Postgres; see
+  append_page_and_checkpoint)
 
 Hard invariants
 - Never keep a DB transaction open during HTTP.
 - Advance cursor_next only after raw + indices are persisted successfully
-  (same DB transaction as those writes).
+  (same DB transaction as those writes). Fetched but unflushed pages are not
+  checkpointed; after a crash they are fetched again.
 
 Operational behavior
+- Prefetches: once a page's nextCursor is known, the next GET runs on a
+  background thread while this page persists, so a page costs about
+  max(fetch, persist) instead of their sum. The fetching thread never holds a
+  DB transaction. A failed prefetch is retried synchronously.
 - Supports resumable runs via run_id reuse. If run_id is provided and exists,
   the worker continues from the stored cursor_next.
 - Supports chunked runs via max_pages. If max_pages is reached, the worker stops
@@ -27,37 +34,70 @@ Non-responsibilities
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import cache
+from datetime import datetime
 from typing import Any, Iterable
 
-from src.persistence.engine import DatabaseManager
+from src.persistence.engine import DatabaseManager, default_pool_size
 from src.pipeline.ledger import (
+    STATUS_COMPLETED,
     SapiRunLedgerStore,
     SapiRunScope,
-)
-from src.persistence.stores.raw import (
-    SapiRawPagesStore,
+    _utcnow_naive,
 )
 from src.persistence.stores.indices import (
     SapiIndicesStore,
 )
-from src.client.client import SapiClient
-from src.client.extract import extract_show
+from src.persistence.stores.raw import SapiRawPagesStore
+from src.client.client import FetchedPage, SapiClient
+from src.client.extract import extract_shows_batch
 
 logger = logging.getLogger(__name__)
 
+SEARCH_ENDPOINT = "/shows/search/filters"
+
 
-def _utcnow_naive() -> datetime:
+def _prefetch_workers() -> int:
     """
-    Return naive UTC datetime.
+    Prefetch pool size: SAPI_PREFETCH if set, else default_pool_size().
 
-    Your ORM uses DateTime without timezone, so this keeps consistency.
+    Each run pins one pooled DB connection and keeps at most one prefetch in
+    flight, so the DB pool size bounds how many runs can prefetch at once.
+    Invalid values fall back to the default; the floor is 1.
     """
-    return datetime.now(timezone.utc).replace(tzinfo=None)
+    raw = os.environ.get("SAPI_PREFETCH")
+    if raw is not None:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            logger.warning("SAPI_PREFETCH_INVALID value=%r", raw)
+    return default_pool_size()
+
+
+@cache
+def _prefetch_pool() -> ThreadPoolExecutor:
+    """
+    One prefetch pool per process, built on first use and shared by every run:
+    repeated or concurrent runs reuse a bounded set of threads (started on
+    demand) instead of starting their own.
+
+    Sharing means that once more runs prefetch concurrently than the pool has
+    threads, a run's prefetch queues behind other runs' fetches (a slow fetch
+    then delays them). Size SAPI_PREFETCH to the number of concurrent runs.
+    """
+    pool = ThreadPoolExecutor(
+        max_workers=_prefetch_workers(),
+        thread_name_prefix="sapi-prefetch",
+    )
+    atexit.register(pool.shutdown, wait=False, cancel_futures=True)
+    return pool
 
 
 def _normalize_catalogs_param(catalogs: Any) -> str:
@@ -67,16 +107,66 @@ def _normalize_catalogs_param(catalogs: Any) -> str:
     Accepts:
     - "netflix,prime,disney" (str)
     - ["netflix", "prime", "disney"] (iterable)
+
+    A list or tuple of already-clean str names (non-empty, no whitespace) is
+    the hot path: joined and checked with C-level string ops, skipping the
+    per-element str()/strip() of the general case. Anything else falls
+    through to it unchanged.
     """
     if catalogs is None:
         return ""
     if isinstance(catalogs, str):
         return catalogs
+    if type(catalogs) in (list, tuple):
+        try:
+            joined = ",".join(catalogs)
+        except TypeError:  # non-str elements
+            joined = ""
+        if (
+            joined
+            and len(joined.split()) == 1
+            and ",," not in joined
+            and joined[0] != ","
+            and joined[-1] != ","
+        ):
+            return joined
     if isinstance(catalogs, Iterable):
         return ",".join([str(x).strip() for x in catalogs if str(x).strip()])
     return str(catalogs)
 
 
+def _run_query_params(
+    base_query_params: dict[str, Any], scope: SapiRunScope
+) -> tuple[tuple[str, Any], ...]:
+    """
+    Query params shared by every page of a run: the caller's params with
+    country and catalogs set consistently with the scope, and no cursor.
+
+    Built once per run as (key, value) pairs, so a page's params are one
+    tuple concatenation (see _with_cursor) rather than a new dict.
+    """
+    query_params = dict(base_query_params)
+    query_params["country"] = scope.country
+
+    # Prefer explicit catalogs_bundle if caller didn't provide.
+    if "catalogs" not in query_params or query_params["catalogs"] in (None, ""):
+        query_params["catalogs"] = scope.catalogs_bundle
+    else:
+        query_params["catalogs"] = _normalize_catalogs_param(query_params["catalogs"])
+
+    query_params.pop("cursor", None)
+    return tuple(query_params.items())
+
+
+def _with_cursor(
+    run_params: tuple[tuple[str, Any], ...], cursor: str | None
+) -> tuple[tuple[str, Any], ...]:
+    """
+    Query params for one page: run_params plus the cursor (first page: as-is).
+    """
+    return run_params if cursor is None else run_params + (("cursor", cursor),)
+
+
 @dataclass(frozen=True)
 class BackfillOptions:
     """
@@ -87,10 +177,82 @@ class BackfillOptions:
         This is a “pause” feature (run is not marked completed).
     chunk_size:
         Passed to SapiIndicesStore for batched upserts.
+    prefetch:
+        Fetch the next page on a background thread while the current one
+        persists.
+    raw_batch_size:
+        Pages buffered in memory and persisted per transaction (raw pages as
+        one multi-row INSERT, one checkpoint UPDATE). The last page and the
+        max_pages stop always flush. 1 persists every page on its own.
+    coalesce_pages:
+        Upsert the indices of a whole batch together (one statement per
+        chunk_size rows per table, instead of one per page), and flush a batch
+        early once it holds chunk_size shows. Duplicate shows resolve to the
+        later page.
+    checkpoint_log:
+        Append checkpoints to sapi_run_checkpoints instead of updating the
+        ledger row; the log is compacted into the row when the run ends.
+    raw_copy:
+        On PostgreSQL, let raw batches of at least the store's copy_threshold
+        pages (1000) go through COPY into a staging table merged in the same
+        transaction, instead of a multi-row INSERT. COPY's extra statements
+        only pay off for large batches (a raw_batch_size in the thousands);
+        smaller batches keep the INSERT. No effect on other dialects.
+    persist_empty_raw:
+        Store raw pages that carry no shows. False skips their raw row (they
+        still advance the checkpoint), so a batch of only empty pages costs
+        one ledger UPDATE. Keep True when every page must be auditable.
+    replay_raw:
+        When resuming a given run_id, serve pages from sapi_raw_pages while
+        the run already stored them (one lookup per page by the unique key)
+        instead of refetching; HTTP starts at the first cursor not stored.
+        Replayed pages are re-extracted and advance the cursor, but are
+        neither re-appended nor counted again in pages/items_processed.
+        Opt-in: a crash-resume rarely finds stored pages past its cursor, so
+        the lookup is usually an extra transaction per run. Runs that are
+        already COMPLETED are refused (ValueError) rather than replayed, since
+        replaying would count their pages twice.
     """
 
     max_pages: int | None = None
     chunk_size: int = 1000
+    prefetch: bool = True
+    raw_batch_size: int = 16
+    coalesce_pages: bool = True
+    checkpoint_log: bool = False
+    raw_copy: bool = True
+    persist_empty_raw: bool = True
+    replay_raw: bool = False
+
+
+@dataclass(frozen=True)
+class _BufferedPage:
+    """
+    A fetched page waiting for its batch to be persisted.
+    """
+
+    cursor_used: str | None
+    fetched_at: datetime
+    page: FetchedPage
+    shows: list[dict[str, Any]]
+    has_more: bool | None
+    next_cursor: str | None
+    fetch_ms: float
+    prefetched: bool
+    replayed: bool = False
+
+    def raw_page(self, run_id: str) -> dict[str, Any]:
+        """
+        append_page arguments for this page; the store turns them into its
+        row with _page_row.
+        """
+        return {
+            "run_id": run_id,
+            "cursor_used": self.cursor_used,
+            "fetched_at": self.fetched_at,
+            "response_json": self.page.payload,
+            "response_bytes": self.page.content,
+        }
 
 
 class SapiBackfillWorker:
@@ -101,14 +263,98 @@ class SapiBackfillWorker:
     It executes one run for one scope.
     """
 
-    def __init__(self, *, db_manager: DatabaseManager, sapi_client: SapiClient) -> None:
+    def __init__(
+        self,
+        *,
+        db_manager: DatabaseManager,
+        sapi_client: SapiClient,
+        prewarm_connections: int = 1,
+    ) -> None:
         """
         Args:
             db_manager: Provides SQLAlchemy Session context manager.
             sapi_client: Thin HTTP client for SAPI.
+            prewarm_connections: Pool connections to open up front (a run
+                holds one); 0 skips pre-warming.
         """
         self._db = db_manager
         self._client = sapi_client
+        if prewarm_connections > 0:
+            self._db.prewarm(prewarm_connections)
+
+    def _fetch(
+        self, query_params: tuple[tuple[str, Any], ...]
+    ) -> tuple[datetime, FetchedPage, float]:
+        """
+        GET one search page (no DB access; safe on the prefetch thread).
+
+        Returns:
+            (fetched_at, page, fetch_ms)
+        """
+        fetch_t0 = time.perf_counter()
+        fetched_at = _utcnow_naive()
+        page = self._client.fetch_page(SEARCH_ENDPOINT, query_params)
+        return fetched_at, page, (time.perf_counter() - fetch_t0) * 1000.0
+
+    @staticmethod
+    def _persist_batch(
+        *,
+        run_id: str,
+        batch: list[_BufferedPage],
+        coalesce: bool,
+        persist_empty_raw: bool,
+        idx_store: SapiIndicesStore,
+        raw_store: SapiRawPagesStore,
+        ledger: SapiRunLedgerStore,
+    ) -> None:
+        """
+        Write a batch's indices, raw pages and checkpoint. The caller owns the
+        transaction; the checkpoint moves cursor_next to the last page's cursor.
+        Pages without shows have no index rows, and without persist_empty_raw
+        no raw row either: only their checkpoint delta is written. Replayed
+        pages already have their raw row and counts: they only advance the
+        cursor.
+        """
+        # Extract per page, then bulk upsert per table (per batch, or per page).
+        page_groups = [batch] if coalesce else [[p] for p in batch]
+        for group in page_groups:
+            titles, offers, assets = [], [], []
+            for p in group:
+                page_titles, page_offers, page_assets = extract_shows_batch(
+                    p.shows, p.fetched_at, run_id
+                )
+                titles += page_titles
+                offers += page_offers
+                assets += page_assets
+            idx_store.upsert_records(titles, offers, assets)
+
+        raw_pages = [
+            p for p in batch if not p.replayed and (persist_empty_raw or p.shows)
+        ]
+
+        if len(batch) == 1 and raw_pages:
+            # Raw append + checkpoint (one round-trip on Postgres).
+            p = batch[0]
+            ledger.append_page_and_checkpoint(
+                **p.raw_page(run_id),
+                next_cursor=p.next_cursor,
+                has_more=p.has_more,
+                items_count=len(p.shows),
+            )
+            return
+
+        if raw_pages:
+            raw_store.append_pages_bulk([p.raw_page(run_id) for p in raw_pages])
+        for p in batch:
+            # Replayed pages were counted when first fetched; they only move the cursor.
+            ledger.checkpoint_many(
+                run_id=run_id,
+                delta_pages=0 if p.replayed else 1,
+                delta_items=0 if p.replayed else len(p.shows),
+                next_cursor=p.next_cursor,
+                has_more=p.has_more,
+            )
+        ledger.flush_checkpoint()
 
     def run_backfill(
         self,
@@ -132,147 +378,206 @@ class SapiBackfillWorker:
             The run_id used for this run (useful for resuming or diagnostics).
         """
         opt = options or BackfillOptions()
+        # Only a caller-supplied run_id can have stored pages to replay.
+        replaying = opt.replay_raw and run_id is not None
         run_id = run_id or str(uuid.uuid4())
 
-        # Handshake: ensure ledger row exists and load resume cursor.
-        with self._db.get_session() as session:
+        # One session (and one pooled connection) for the whole run, failure
+        # bookkeeping included; stores only hold the session, so they are
+        # built once. Transactions are opened per batch around the writes
+        # only, never across HTTP.
+        with self._db.get_session(pin_connection=True) as session:
+            ledger = SapiRunLedgerStore(session, checkpoint_log=opt.checkpoint_log)
+            idx_store = SapiIndicesStore(session, chunk_size=opt.chunk_size)
+            raw_store = (
+                SapiRawPagesStore(session)
+                if opt.raw_copy
+                else SapiRawPagesStore(session, copy_threshold=None)
+            )
+
+            # Handshake: ensure ledger row exists and load resume cursor.
             with session.begin():
-                ledger = SapiRunLedgerStore(session)
-                ledger.ensure_started(run_id=run_id, scope=scope)
-
-            # Resume cursor can be read outside a transaction.
-            ledger = SapiRunLedgerStore(session)
-            cursor_next = ledger.get_cursor_next(run_id)
-
-        logger.info(
-            "SAPI_BACKFILL_START run_id=%s country=%s catalogs=%s fingerprint=%s cursor_next=%s max_pages=%s",
-            run_id,
-            scope.country,
-            scope.catalogs_bundle,
-            scope.params_fingerprint,
-            cursor_next,
-            opt.max_pages,
-        )
-
-        pages_done = 0
+                resume = ledger.start_or_resume(run_id=run_id, scope=scope)
+            cursor_next = resume.cursor_next
+            if replaying and resume.status is STATUS_COMPLETED:
+                raise ValueError(f"run {run_id} is already completed; refusing to replay it")
+
+            logger.info(
+                "SAPI_BACKFILL_START run_id=%s country=%s catalogs=%s fingerprint=%s cursor_next=%s max_pages=%s",
+                run_id,
+                scope.country,
+                scope.catalogs_bundle,
+                scope.params_fingerprint,
+                cursor_next,
+                opt.max_pages,
+            )
+
+            run_params = _run_query_params(base_query_params, scope)
+            pages_done = 0  # fetched pages (persisted ones plus the buffer)
+            buffer: list[_BufferedPage] = []
+            buffered_shows = 0
+            # In-flight GET for cursor_next, started while the previous page persisted.
+            prefetch: Future | None = None
+
+            try:
+                while True:
+                    if opt.max_pages is not None and pages_done >= opt.max_pages:
+                        logger.info(
+                            "SAPI_BACKFILL_STOP_MAX_PAGES run_id=%s pages_done=%d",
+                            run_id,
+                            pages_done,
+                        )
+                        break
+
+                    cursor_used = cursor_next  # cursor used for this request (may be None)
+
+                    # HTTP outside DB tx.
+                    fetched = None
+                    prefetched = prefetch is not None
+                    if prefetch is not None:
+                        try:
+                            fetched = prefetch.result()
+                        except Exception as e:
+                            logger.warning(
+                                "SAPI_BACKFILL_PREFETCH_FAILED run_id=%s cursor_used=%r error=%s: %s",
+                                run_id,
+                                cursor_used,
+                                type(e).__name__,
+                                e,
+                            )
+                            prefetched = False
+                        prefetch = None
+                    replayed = False
+                    if fetched is None and replaying:
+                        # Short read-only transaction; no HTTP inside it.
+                        with session.begin():
+                            stored = raw_store.get_page(run_id=run_id, cursor_used=cursor_used)
+                        if stored is None:
+                            replaying = False
+                        else:
+                            replayed = True
+                            fetched = (stored[0], FetchedPage(payload=stored[1], content=None), 0.0)
+                    if fetched is None:
+                        fetched = self._fetch(
+                            _with_cursor(run_params, cursor_used)
+                        )
+                    fetched_at, page, fetch_ms = fetched
+                    resp = page.payload
 
-        try:
-            while True:
-                if opt.max_pages is not None and pages_done >= opt.max_pages:
-                    logger.info(
-                        "SAPI_BACKFILL_STOP_MAX_PAGES run_id=%s pages_done=%d",
-                        run_id,
-                        pages_done,
+                    has_more = resp.get("hasMore")
+                    next_cursor = resp.get("nextCursor")
+                    buffer.append(
+                        _BufferedPage(
+                            cursor_used=cursor_used,
+                            fetched_at=fetched_at,
+                            page=page,
+                            shows=resp.get("shows") or [],
+                            has_more=has_more,
+                            next_cursor=next_cursor,
+                            fetch_ms=fetch_ms,
+                            prefetched=prefetched,
+                            replayed=replayed,
+                        )
                     )
-                    break
-
-                cursor_used = cursor_next  # cursor used for this request (may be None)
-
-                # Build query params (HTTP outside DB tx).
-                query_params = dict(base_query_params)
-                query_params["country"] = scope.country
-
-                # Prefer explicit catalogs_bundle if caller didn't provide.
-                if "catalogs" not in query_params or query_params["catalogs"] in (
-                    None,
-                    "",
-                ):
-                    query_params["catalogs"] = scope.catalogs_bundle
-                else:
-                    query_params["catalogs"] = _normalize_catalogs_param(
-                        query_params["catalogs"]
+                    buffered_shows += len(buffer[-1].shows)
+                    pages_done += 1
+                    cursor_next = next_cursor
+                    stopping = has_more is False or (
+                        opt.max_pages is not None and pages_done >= opt.max_pages
                     )
 
-                if cursor_used is not None:
-                    query_params["cursor"] = cursor_used
-                else:
-                    query_params.pop("cursor", None)
-
-                fetch_t0 = time.perf_counter()
-                fetched_at = _utcnow_naive()
-                resp = self._client.fetch_data("/shows/search/filters", query_params)
-                fetch_ms = (time.perf_counter() - fetch_t0) * 1000.0
+                    # Start the next GET before this batch's transaction,
+                    # unless this is the last page or the max_pages stop (or
+                    # the next page may still be replayed from storage).
+                    if opt.prefetch and not stopping and not replaying:
+                        prefetch = _prefetch_pool().submit(
+                            self._fetch,
+                            _with_cursor(run_params, next_cursor),
+                        )
 
-                shows = resp.get("shows") or []
-                has_more = resp.get("hasMore")
-                next_cursor = resp.get("nextCursor")
+                    batch_full = len(buffer) >= opt.raw_batch_size or (
+                        opt.coalesce_pages and buffered_shows >= opt.chunk_size
+                    )
+                    if not batch_full and not stopping:
+                        continue
 
-                persist_t0 = time.perf_counter()
+                    persist_t0 = time.perf_counter()
 
-                # Persist raw + indices + checkpoint atomically (one DB transaction).
-                with self._db.get_session() as session:
+                    # Persist raw + indices + checkpoint atomically (one DB transaction).
                     with session.begin():
-                        raw_store = SapiRawPagesStore(session)
-                        idx_store = SapiIndicesStore(session, chunk_size=opt.chunk_size)
-                        ledger = SapiRunLedgerStore(session)
-
-                        raw_store.append_page(
+                        self._persist_batch(
                             run_id=run_id,
-                            cursor_used=cursor_used,
-                            fetched_at=fetched_at,
-                            response_json=resp,
+                            batch=buffer,
+                            coalesce=opt.coalesce_pages,
+                            persist_empty_raw=opt.persist_empty_raw,
+                            idx_store=idx_store,
+                            raw_store=raw_store,
+                            ledger=ledger,
                         )
 
-                        # Extract per show, then bulk upsert per table (per page).
-                        titles = []
-                        offers = []
-                        assets = []
-
-                        for raw_show in shows:
-                            title_rec, offer_recs, asset_recs = extract_show(
-                                raw_show, fetched_at=fetched_at, run_id=run_id
+                    persist_ms = (time.perf_counter() - persist_t0) * 1000.0
+
+                    # Per-page lines are only built when they will be
+                    # emitted; the cursor reprs are DEBUG detail.
+                    if logger.isEnabledFor(logging.INFO):
+                        detail = logger.isEnabledFor(logging.DEBUG)
+                        first_page = pages_done - len(buffer)
+                        for i, p in enumerate(buffer, start=1):
+                            logger.info(
+                                "SAPI_BACKFILL_PAGE_OK run_id=%s page=%d items=%d",
+                                run_id,
+                                first_page + i,
+                                len(p.shows),
                             )
-                            titles.append(title_rec)
-                            offers.extend(offer_recs)
-                            assets.extend(asset_recs)
-
-                        if titles:
-                            idx_store.upsert_titles(titles)
-                        if offers:
-                            idx_store.upsert_offers(offers)
-                        if assets:
-                            idx_store.upsert_assets(assets)
-
-                        ledger.checkpoint_after_page(
-                            run_id=run_id,
-                            next_cursor=next_cursor,
-                            has_more=has_more,
-                            items_count=len(shows),
+                            if detail:
+                                logger.debug(
+                                    "SAPI_BACKFILL_PAGE_DETAIL run_id=%s page=%d has_more=%s fetch_ms=%.2f persist_ms=%.2f batch_pages=%d prefetched=%s replayed=%s cursor_used=%s next_cursor=%s",
+                                    run_id,
+                                    first_page + i,
+                                    p.has_more,
+                                    p.fetch_ms,
+                                    persist_ms,
+                                    len(buffer),
+                                    p.prefetched,
+                                    p.replayed,
+                                    repr(p.cursor_used) if p.cursor_used else "START",
+                                    repr(p.next_cursor) if p.next_cursor else "NONE",
+                                )
+                    buffer = []
+                    buffered_shows = 0
+
+                    if has_more is False:
+                        logger.info(
+                            "SAPI_BACKFILL_DONE run_id=%s pages=%d",
+                            run_id,
+                            pages_done,
                         )
-
-                persist_ms = (time.perf_counter() - persist_t0) * 1000.0
-
-                pages_done += 1
-                cursor_next = next_cursor
-
-                logger.info(
-                    "SAPI_BACKFILL_PAGE_OK run_id=%s page=%d items=%d has_more=%s fetch_ms=%.2f persist_ms=%.2f cursor_used=%s next_cursor=%s",
-                    run_id,
-                    pages_done,
-                    len(shows),
-                    has_more,
-                    fetch_ms,
-                    persist_ms,
-                    (repr(cursor_used)) if cursor_used else "START",
-                    (repr(next_cursor)) if next_cursor else "NONE",
-                )
-
-                if has_more is False:
-                    logger.info(
-                        "SAPI_BACKFILL_DONE run_id=%s pages=%d",
-                        run_id,
-                        pages_done,
+                        break
+
+            except Exception as e:
+                # Mark failed in a small transaction on the run's own pinned
+                # connection, then re-raise. Checking out a second connection
+                # could wait out the pool timeout while other runs hold the
+                # rest (no overflow) and mask the original error. A fresh
+                # ledger store drops any checkpoint buffered by the failed
+                # batch. If the connection itself is what broke, the failure
+                # is logged and the original error still propagates.
+                err = f"{type(e).__name__}: {e}"
+                try:
+                    session.rollback()
+                    with session.begin():
+                        SapiRunLedgerStore(
+                            session, checkpoint_log=opt.checkpoint_log
+                        ).mark_failed(run_id=run_id, error=err)
+                except Exception:
+                    logger.exception(
+                        "SAPI_BACKFILL_MARK_FAILED_FAILED run_id=%s", run_id
                     )
-                    break
-
-        except Exception as e:
-            # Mark failed in a separate small transaction, then re-raise.
-            err = f"{type(e).__name__}: {e}"
-            with self._db.get_session() as session:
-                with session.begin():
-                    ledger = SapiRunLedgerStore(session)
-                    ledger.mark_failed(run_id=run_id, error=err)
-            logger.exception("SAPI_BACKFILL_FAILED run_id=%s error=%s", run_id, err)
-            raise
+                logger.error("SAPI_BACKFILL_FAILED run_id=%s error=%s", run_id, err, exc_info=e)
+                raise e
+            finally:
+                # The pool outlives the run: drop a GET nobody will read.
+                if prefetch is not None:
+                    prefetch.cancel()
 
         return run_id
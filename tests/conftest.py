@@ -0,0 +1,63 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from src.persistence.engine import DatabaseManager
+from src.persistence.tables import Base
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "postgres: needs a PostgreSQL database (SAPI_TEST_DATABASE_URL)")
+
+
+class SqliteDatabaseManager(DatabaseManager):
+    # Logic: Same get_session() contract as production, backed by a SQLite file.
+    def __init__(self, url: str, **engine_kwargs):
+        self.engine = create_engine(url, **engine_kwargs)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = SqliteDatabaseManager(f"sqlite:///{tmp_path / 'sapi.db'}")
+    Base.metadata.create_all(manager.engine)
+    return manager
+
+
+@pytest.fixture
+def listen():
+    # Logic: event.listen undone at teardown, so no listener outlives its test.
+    registered = []
+
+    def _listen(target, identifier, fn):
+        event.listen(target, identifier, fn)
+        registered.append((target, identifier, fn))
+
+    yield _listen
+    for args in reversed(registered):
+        event.remove(*args)
+
+
+@pytest.fixture
+def statements(db_manager, listen):
+    # Logic: SQL text of every statement db_manager's engine runs during the test, in order.
+    captured = []
+    listen(db_manager.engine, "before_cursor_execute", lambda conn, cur, sql, *a: captured.append(sql))
+    return captured
+
+
+@pytest.fixture
+def pg_session():
+    # Logic: Real PostgreSQL for COPY paths; schema and rows live in one transaction that is rolled back.
+    url = os.environ.get("SAPI_TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("SAPI_TEST_DATABASE_URL not set")
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        trans = conn.begin()
+        Base.metadata.create_all(conn)
+        with Session(bind=conn, join_transaction_mode="create_savepoint") as session:
+            yield session
+        trans.rollback()
+    engine.dispose()
@@ -1,7 +1,10 @@
+import asyncio
+
+import httpx
 import pytest
-import requests
-import responses
-from src.client.client import SapiClient
+import respx
+from src.client.cache import SapiResponseCache
+from src.client.client import AsyncSapiClient, SapiClient
 from src.config import SAPI_RETRY_POLICY
 
 # --- FIXTURES ---
@@ -15,78 +18,281 @@ def client():
     )
 
 # --- 1. POSITIVE TESTING (The Contract) ---
-@responses.activate
+@respx.mock
 def test_fetch_data_success(client):
     # Logic: Prove the client parses a standard successful JSON response.
     mock_json = {"items": [{"id": 1}], "next_cursor": "abc"}
-    responses.add(
-        responses.GET,
-        "https://api.test.com/endpoint", 
-        json=mock_json,
-        status=200
+    respx.get("https://api.test.com/endpoint").mock(
+        return_value=httpx.Response(200, json=mock_json)
     )
 
     result = client.fetch_data("endpoint", {"param": "val"})
 
     assert result == mock_json
-    assert responses.calls[0].request.headers["x-rapidapi-key"] == "test_key"
+    assert respx.calls[0].request.headers["x-rapidapi-key"] == "test_key"
+    assert respx.calls[0].request.headers["x-rapidapi-host"] == "test_host"
 
 # --- 2. NEGATIVE TESTING (The Fragility) ---
-@responses.activate
+@respx.mock
 def test_fetch_data_unauthorized(client):
     # Logic: Prove that 401 errors (which shouldn't be retried) fail immediately.
-    responses.add(
-        responses.GET,
-        "https://api.test.com/endpoint", 
-        status=401
-    )
+    respx.get("https://api.test.com/endpoint").mock(return_value=httpx.Response(401))
 
-    with pytest.raises(requests.exceptions.HTTPError):
+    with pytest.raises(httpx.HTTPStatusError):
         client.fetch_data("endpoint", {})
 
     # Assert it only tried once (no retry logic triggered for 401)
-    assert len(responses.calls) == 1
+    assert len(respx.calls) == 1
 
 # --- 3. CONSTRAINTS (The Limits) ---
-@responses.activate
+@respx.mock
 def test_fetch_data_empty_response(client):
     # Logic: Prove the client handles valid but empty/null payloads without crashing.
-    responses.add(
-        responses.GET,
-        "https://api.test.com/endpoint", 
-        json={},
-        status=200
+    respx.get("https://api.test.com/endpoint").mock(
+        return_value=httpx.Response(200, json={})
     )
 
     result = client.fetch_data("endpoint", {})
     assert result == {}
 
 # --- 4. THE BRANCHES (The Implicit Loop) ---
-@responses.activate
+@respx.mock
 def test_fetch_data_retry_until_success(client):
     # Logic: Force the execution path through the decorator's retry loop.
     url = "https://api.test.com/endpoint"
 
     # Branch Path: Failure -> Failure -> Success
-    responses.add(responses.GET, url, status=429)
-    responses.add(responses.GET, url, status=429)
-    responses.add(responses.GET, url, json={"status": "ok"}, status=200)
+    respx.get(url).mock(side_effect=[
+        httpx.Response(429),
+        httpx.Response(429),
+        httpx.Response(200, json={"status": "ok"}),
+    ])
 
     result = client.fetch_data("endpoint", {})
 
     assert result == {"status": "ok"}
-    assert len(responses.calls) == 3
+    assert len(respx.calls) == 3
 
-@responses.activate
+@respx.mock
 def test_fetch_data_max_retries_exhausted(client):
     # Logic: Prove the "Stop" branch of the decorator works.
     url = "https://api.test.com/endpoint"
 
     # Simulate infinite failures
-    responses.add(responses.GET, url, status=500)
+    respx.get(url).mock(return_value=httpx.Response(500))
 
-    with pytest.raises(requests.exceptions.HTTPError):
+    with pytest.raises(httpx.HTTPStatusError):
         client.fetch_data("endpoint", {})
 
     # If your config says stop_after_attempt(3), this should be 3
-    assert len(responses.calls) == 3
+    assert len(respx.calls) == 3
+
+
+@respx.mock
+def test_iter_shows_streams_items(client):
+    # Logic: Shows are yielded one by one from the body; sibling keys are skipped.
+    respx.get("https://api.test.com/shows/search/filters").mock(
+        return_value=httpx.Response(
+            200, json={"shows": [{"id": "1"}, {"id": "2", "rating": 7.5}], "hasMore": False}
+        )
+    )
+
+    shows = client.iter_shows("/shows/search/filters", {"country": "us"})
+
+    assert next(shows) == {"id": "1"}
+    assert list(shows) == [{"id": "2", "rating": 7.5}]
+
+# --- 5. ASYNC CLIENT (Concurrent Fan-Out) ---
+def _async_client(handler):
+    return AsyncSapiClient(
+        api_key="test_key",
+        api_host="test_host",
+        base_url="https://api.test.com",
+        transport=httpx.MockTransport(handler),
+    )
+
+def test_async_fetch_data_success():
+    # Logic: Prove the async client sends auth headers and parses JSON.
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"id": request.url.params["id"]})
+
+    async def run():
+        async with _async_client(handler) as client:
+            return await client.fetch_data("endpoint", {"id": "1"})
+
+    assert asyncio.run(run()) == {"id": "1"}
+    assert seen[0].headers["x-rapidapi-key"] == "test_key"
+    assert seen[0].url.path == "/endpoint"
+
+def test_async_fetch_many_keeps_order_and_returns_errors():
+    # Logic: Results align with job order; a 401 is returned, not raised.
+    def handler(request):
+        if request.url.params["id"] == "bad":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"id": request.url.params["id"]})
+
+    async def run():
+        async with _async_client(handler) as client:
+            return await client.fetch_many(
+                [("endpoint", {"id": "a"}), ("endpoint", {"id": "bad"}), ("endpoint", {"id": "b"})]
+            )
+
+    results = asyncio.run(run())
+
+    assert results[0] == {"id": "a"}
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    assert results[2] == {"id": "b"}
+
+def test_async_fetch_batch_aligns_and_raises_first_failure():
+    # Logic: A clean batch returns input-ordered results; any failure surfaces once all finish.
+    def handler(request):
+        if request.url.params["id"] == "bad":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"id": request.url.params["id"]})
+
+    async def run(ids):
+        async with _async_client(handler) as client:
+            return await client.fetch_batch("/shows", [{"id": i} for i in ids])
+
+    assert asyncio.run(run(["b", "a"])) == [{"id": "b"}, {"id": "a"}]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run(["a", "bad"]))
+
+
+# --- 6. TRANSPORT (Connection Reuse) ---
+def test_session_uses_http2_with_bounded_pool(client):
+    # Logic: One HTTP/2 client with a capped keep-alive pool carries the RapidAPI headers.
+    pool = client.session._transport._pool
+
+    assert pool._http2 is True
+    assert (pool._max_connections, pool._max_keepalive_connections) == (64, 64)
+    assert client.session.headers["x-rapidapi-host"] == "test_host"
+
+
+# --- 7. RESPONSE CACHE (Skip the Round Trip) ---
+@respx.mock
+def test_fetch_data_served_from_fresh_cache(tmp_path):
+    # Logic: A second identical call inside the freshness window never hits the network.
+    client = SapiClient("test_key", "test_host", "https://api.test.com",
+                        cache=SapiResponseCache(tmp_path))
+    respx.get("https://api.test.com/endpoint").mock(return_value=httpx.Response(200, json={"v": 1}))
+
+    assert client.fetch_data("endpoint", {"a": "1", "b": "2"}) == {"v": 1}
+    assert client.fetch_data("endpoint", {"b": "2", "a": "1"}) == {"v": 1}
+    assert len(respx.calls) == 1
+
+@respx.mock
+def test_pair_params_are_sent_and_share_the_dict_cache_key(tmp_path):
+    # Logic: (key, value) pairs go on the URL as-is and hit the same cache entry as the dict form.
+    client = SapiClient("test_key", "test_host", "https://api.test.com",
+                        cache=SapiResponseCache(tmp_path))
+    respx.get("https://api.test.com/endpoint").mock(return_value=httpx.Response(200, json={"v": 1}))
+
+    assert client.fetch_data("endpoint", (("country", "us"), ("cursor", "c1"))) == {"v": 1}
+    assert client.fetch_data("endpoint", {"cursor": "c1", "country": "us"}) == {"v": 1}
+    assert len(respx.calls) == 1
+    assert respx.calls[0].request.url.query == b"country=us&cursor=c1"
+
+@respx.mock
+def test_fetch_data_revalidates_stale_cache_with_etag(tmp_path):
+    # Logic: An expired entry is revalidated via If-None-Match; a 304 returns the cached body.
+    client = SapiClient("test_key", "test_host", "https://api.test.com",
+                        cache=SapiResponseCache(tmp_path, expire_after=0))
+    url = "https://api.test.com/endpoint"
+    respx.get(url).mock(side_effect=[
+        httpx.Response(200, json={"v": 1}, headers={"ETag": '"abc"'}),
+        httpx.Response(304),
+    ])
+
+    assert client.fetch_data("endpoint", {}) == {"v": 1}
+    assert client.fetch_data("endpoint", {}) == {"v": 1}
+    assert respx.calls[1].request.headers["If-None-Match"] == '"abc"'
+
+def test_cache_memo_keeps_only_recent_entries(tmp_path):
+    # Logic: The in-process memo is an LRU; an evicted entry is read back from disk, a recent one never is.
+    cache = SapiResponseCache(tmp_path, max_memo_entries=2)
+    for cursor in ("c1", "c2", "c3"):
+        cache.set("endpoint", {"cursor": cursor}, {"v": cursor})
+    cache.get("endpoint", {"cursor": "c2"})
+    cache.set("endpoint", {"cursor": "c4"}, {"v": "c4"})
+    for path in tmp_path.glob("*.json"):
+        path.unlink()
+
+    assert [cache.get("endpoint", {"cursor": c}) is not None for c in ("c1", "c2", "c3", "c4")] == [
+        False, True, False, True]
+
+# --- 8. PARSING (orjson) ---
+@respx.mock
+def test_fetch_data_invalid_json_is_not_retried(client):
+    # Logic: A malformed body is a permanent failure, surfaced after one call.
+    respx.get("https://api.test.com/endpoint").mock(
+        return_value=httpx.Response(200, content=b"{not json")
+    )
+
+    with pytest.raises(ValueError):
+        client.fetch_data("endpoint", {})
+
+    assert len(respx.calls) == 1
+
+# --- 9. SHARED CLIENT (One Session per Process) ---
+def test_get_client_is_a_singleton(monkeypatch):
+    # Logic: Settings are read once; later calls reuse the same session.
+    import src.client.client as client_module
+
+    monkeypatch.setattr(client_module, "_DEFAULT_CLIENT", None)
+    monkeypatch.setenv("RAPIDAPI_KEY", "env_key")
+    monkeypatch.setenv("RAPIDAPI_HOST", "env_host")
+    monkeypatch.setenv("SAPI_BASE_URL", "https://api.env.com/")
+
+    first = client_module.get_client()
+
+    assert first is client_module.get_client()
+    assert first.base_url == "https://api.env.com"
+    assert first.session.headers["x-rapidapi-key"] == "env_key"
+
+# --- 10. TELEMETRY (Aggregated Stats) ---
+def test_stats_aggregator_summarizes_per_endpoint(caplog):
+    # Logic: Successes and failures fold into one SAPI_REQUEST_STATS line per endpoint.
+    from src.client.stats import StatsAggregator
+
+    stats = StatsAggregator(interval_s=3600)
+    stats.record("/shows", 10.0)
+    stats.record("/shows", 30.0)
+    with pytest.raises(RuntimeError):
+        with stats.measure("/shows"):
+            raise RuntimeError("boom")
+
+    with caplog.at_level("INFO", logger="src.client.stats"):
+        stats.flush()
+        stats.flush()
+
+    lines = [r.getMessage() for r in caplog.records]
+    assert len(lines) == 1
+    assert "endpoint=/shows ok=2 failed=1 mean_ms=20.00" in lines[0]
+    assert "max_ms=30.00" in lines[0]
+
+@respx.mock
+def test_fetch_data_success_is_not_logged_per_call(client, caplog):
+    # Logic: The hot path records into the aggregate instead of writing an INFO line.
+    respx.get("https://api.test.com/endpoint").mock(return_value=httpx.Response(200, json={}))
+
+    with caplog.at_level("INFO", logger="src.client.client"):
+        client.fetch_data("endpoint", {})
+
+    assert caplog.records == []
+
+# --- 11. RAW BODY (Hash What Was Received) ---
+@respx.mock
+def test_fetch_page_keeps_raw_body(client):
+    # Logic: The exact wire bytes travel with the parse so the raw store can hash them.
+    body = b'{"shows": [], "hasMore": false}'
+    respx.get("https://api.test.com/endpoint").mock(return_value=httpx.Response(200, content=body))
+
+    page = client.fetch_page("endpoint", {})
+
+    assert page.payload == {"shows": [], "hasMore": False}
+    assert page.content == body
@@ -0,0 +1,101 @@
+from dataclasses import asdict
+from datetime import datetime
+
+import pytest
+from src.client.extract import extract_show, extract_shows_batch
+
+# --- FIXTURES ---
+# Logic: One show shaped like a /shows/search/filters item, covering nested offers and images.
+@pytest.fixture
+def raw_show():
+    return {
+        "id": "82",
+        "imdbId": "tt0903747",
+        "tmdbId": "tv/1396",
+        "title": "Breaking Bad",
+        "showType": "series",
+        "firstAirYear": 2008,
+        "streamingOptions": {
+            "us": [
+                {
+                    "service": {"id": "netflix", "name": "Netflix"},
+                    "type": "subscription",
+                    "link": "https://www.netflix.com/title/70143836/",
+                    "videoLink": "https://www.netflix.com/watch/70196252",
+                    "quality": "uhd",
+                    "audios": [{"language": "eng"}, {"language": "spa", "region": "MEX"}],
+                    "subtitles": [
+                        {"closedCaptions": True, "locale": {"language": "eng"}},
+                    ],
+                    "availableSince": 1672531200,
+                    "expiresSoon": False,
+                }
+            ],
+            "de": [
+                {
+                    "service": {"id": "prime", "name": "Prime Video"},
+                    "type": "buy",
+                    "link": "https://www.amazon.de/gp/video/detail/B00/",
+                    "availableSince": 1672531200,
+                    "expiresSoon": True,
+                    "expiresOn": 1700000000,
+                }
+            ],
+        },
+        "imageSet": {
+            "verticalPoster": {"w240": "https://cdn.test.com/p/240.jpg?x=1"},
+            "horizontalBackdrop": {"w1080": "https://cdn.test.com/b/1080.jpg"},
+            "verticalBackdrop": {},
+        },
+    }
+
+FETCHED_AT = datetime(2025, 2, 3, 12, 0, 0)
+
+# --- 1. SHAPE (Plain Records) ---
+def test_extract_show_builds_slotted_records(raw_show):
+    # Logic: Records are plain slotted dataclasses whose asdict() is already row-shaped.
+    title, offers, assets = extract_show(raw_show, fetched_at=FETCHED_AT, run_id="run-1")
+
+    assert not hasattr(title, "__dict__")
+    assert asdict(title) == {
+        "sapi_id": "82",
+        "imdb_id": "tt0903747",
+        "tmdb_id": "tv/1396",
+        "title": "Breaking Bad",
+        "original_title": None,
+        "show_type": "series",
+        "item_type": "show",
+        "release_year": "2008",
+        "fetched_at": FETCHED_AT,
+        "last_seen_run_id": "run-1",
+    }
+    assert asdict(offers[0])["audios"][0] == {"language": "eng", "region": None}
+    assert asdict(offers[0])["subtitles"][0] == {
+        "closed_captions": True,
+        "locale": {"language": "eng", "region": None},
+    }
+    assert assets[0].image_urls == {"w240": "https://cdn.test.com/p/240.jpg?x=1"}
+
+# --- 2. MAPPING (The Contract) ---
+def test_extract_show_flattens_offers_and_assets(raw_show):
+    # Logic: One offer per (country, option); empty image kinds are dropped.
+    title, offers, assets = extract_show(raw_show, fetched_at=FETCHED_AT, run_id="run-1")
+
+    assert title.sapi_id == "82"
+    assert title.release_year == "2008"
+    assert [(o.country, o.service_id) for o in offers] == [("us", "netflix"), ("de", "prime")]
+    assert offers[0].subtitles[0].closed_captions is True
+    assert offers[1].watch_link is None
+    assert sorted(a.asset_kind.value for a in assets) == ["horizontalBackdrop", "verticalPoster"]
+
+# --- 3. BATCH (One Pass Per Page) ---
+def test_extract_shows_batch_matches_per_show_extraction(raw_show):
+    # Logic: The batch path yields the same records, flattened in show order.
+    other = dict(raw_show, id="83", title="Better Call Saul")
+    titles, offers, assets = extract_shows_batch([raw_show, other], FETCHED_AT, "run-1")
+
+    per_show = [extract_show(s, fetched_at=FETCHED_AT, run_id="run-1") for s in (raw_show, other)]
+    assert titles == [t for t, _, _ in per_show]
+    assert offers == [o for _, show_offers, _ in per_show for o in show_offers]
+    assert assets == [a for _, _, show_assets in per_show for a in show_assets]
+    assert extract_shows_batch([], FETCHED_AT, "run-1") == ([], [], [])
@@ -0,0 +1,273 @@
+import asyncio
+from dataclasses import asdict
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from src.persistence.models import (
+    Locale,
+    SapiAssetIndexRecord,
+    SapiOfferIndexRecord,
+    SapiTitleIndexRecord,
+    Subtitle,
+)
+from src.persistence.stores.async_indices import AsyncSapiIndicesStore
+from src.persistence.stores.indices import (
+    SapiIndicesStore,
+    _copy_buffer,
+    _copy_text,
+    _dedupe_offers,
+)
+from src.persistence.tables import AssetKind, Base, SapiOfferIndex, SapiTitleIndex
+
+FETCHED_AT = datetime(2025, 2, 3, 12, 0, 0)
+
+# --- FIXTURES ---
+# Logic: An in-memory SQLite database exercises the same ON CONFLICT path as Postgres.
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+def _title(sapi_id, run_id="run-1", title="Title"):
+    return SapiTitleIndexRecord(
+        sapi_id=sapi_id, title=title, show_type="movie",
+        fetched_at=FETCHED_AT, last_seen_run_id=run_id,
+    )
+
+def _offer(sapi_id="1", service_id="netflix", quality=None, watch_link=None,
+           available_since=0, run_id="run-1"):
+    return SapiOfferIndexRecord(
+        sapi_id=sapi_id, country="us", service_id=service_id, offer_type="subscription",
+        title_page_link=f"https://{service_id}.test/{sapi_id}", watch_link=watch_link,
+        quality=quality, available_since=available_since, expires_soon=False,
+        fetched_at=FETCHED_AT, last_seen_run_id=run_id,
+    )
+
+# --- 1. DEDUPE (Best Offer Wins) ---
+def test_dedupe_prefers_quality_then_watch_link_then_recency():
+    # Logic: Each tie-breaker applies only when the previous one is equal.
+    hd = _offer(quality="hd")
+    uhd = _offer(quality="UHD")
+    assert _dedupe_offers([hd, uhd]) == [uhd]
+
+    linked = _offer(quality="hd", watch_link="https://w")
+    assert _dedupe_offers([hd, linked]) == [linked]
+
+    newer = _offer(quality="hd", available_since=10)
+    assert _dedupe_offers([newer, hd]) == [newer]
+
+    other = _offer(service_id="prime")
+    assert len(_dedupe_offers([hd, other])) == 2
+
+def test_dedupe_is_lexicographic_and_stable():
+    # Logic: A later tie-breaker never overrides an earlier one; full ties keep the first record.
+    uhd_no_link = _offer(quality="uhd")
+    sd_linked_newer = _offer(quality="sd", watch_link="https://w", available_since=99)
+    assert _dedupe_offers([uhd_no_link, sd_linked_newer]) == [uhd_no_link]
+    assert _dedupe_offers([sd_linked_newer, uhd_no_link]) == [uhd_no_link]
+
+    first, second = _offer(quality="hd"), _offer(quality="hd")
+    assert _dedupe_offers([first, second])[0] is first
+
+# --- 2. UPSERT (Idempotent Writes) ---
+def test_upsert_titles_updates_existing_rows(session):
+    # Logic: Re-upserting the same key overwrites non-key columns instead of duplicating.
+    store = SapiIndicesStore(session)
+    with session.begin():
+        store.upsert_titles([_title("1"), _title("2")])
+    with session.begin():
+        store.upsert_titles([_title("1", run_id="run-2", title="Renamed")])
+
+    rows = session.execute(select(SapiTitleIndex).order_by(SapiTitleIndex.sapi_id)).scalars().all()
+    assert [(r.sapi_id, r.title, r.last_seen_run_id) for r in rows] == [
+        ("1", "Renamed", "run-2"),
+        ("2", "Title", "run-1"),
+    ]
+
+def test_unchanged_rows_are_not_rewritten(session, listen):
+    # Logic: Same content in the same run skips the UPDATE (fetched_at kept); a new run or new content writes.
+    from dataclasses import replace
+
+    store = SapiIndicesStore(session)
+    later = datetime(2025, 2, 4)
+    updated = []
+    listen(session.get_bind(), "after_cursor_execute",
+                 lambda conn, cur, *a: updated.append(cur.rowcount))
+    with session.begin():
+        store.upsert_offers([_offer(quality="hd")])
+        store.upsert_offers([replace(_offer(quality="hd"), fetched_at=later)])
+        store.upsert_offers([replace(_offer(quality="uhd"), fetched_at=later)])
+        store.upsert_offers([_offer(quality="uhd", run_id="run-2")])
+
+    assert updated == [1, 0, 1, 1]
+    row = session.execute(select(SapiOfferIndex)).scalar_one()
+    assert (row.quality, row.last_seen_run_id, row.fetched_at) == ("uhd", "run-2", FETCHED_AT)
+
+def test_postgres_upsert_compares_columns_with_is_distinct_from():
+    # Logic: The DO UPDATE guard skips fetched_at and compares JSON columns as text.
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from src.persistence.stores.indices import _row_changed, _row_changed_sql
+
+    table = SapiOfferIndex.__table__
+    keys = ("sapi_id", "country", "service_id", "offer_type")
+    stmt = pg_insert(table).values(dict.fromkeys(keys, "k"))
+    stmt = stmt.on_conflict_do_update(index_elements=list(keys), set_={"quality": stmt.excluded.quality},
+                                      where=_row_changed(table, stmt.excluded, keys))
+    sql = str(stmt.compile(dialect=postgresql.psycopg2.dialect()))
+
+    assert "sapi_offers_index.quality IS DISTINCT FROM excluded.quality" in sql
+    assert "CAST(sapi_offers_index.audios AS TEXT) IS DISTINCT FROM CAST(excluded.audios AS TEXT)" in sql
+    assert "sapi_offers_index.fetched_at IS DISTINCT FROM" not in sql
+    assert "audios::text IS DISTINCT FROM EXCLUDED.audios::text" in _row_changed_sql(table, keys)
+
+def test_upsert_all_chunks_and_dedupes_offers(session):
+    # Logic: Duplicate offer keys collapse before insert, and chunking writes every row.
+    store = SapiIndicesStore(session, chunk_size=1)
+    offers = [_offer(quality="sd"), _offer(quality="hd"), _offer(service_id="prime")]
+    with session.begin():
+        counts = store.upsert_all(_title("1"), offers, [])
+
+    assert (counts.titles, counts.offers, counts.assets) == (1, 2, 0)
+    stored = session.execute(select(SapiOfferIndex.service_id, SapiOfferIndex.quality)).all()
+    assert sorted(stored) == [("netflix", "hd"), ("prime", None)]
+
+def test_upsert_all_skips_empty_offers_and_assets(session, monkeypatch):
+    # Logic: A title with no offers/assets issues exactly one statement (the title).
+    store = SapiIndicesStore(session)
+    tables = []
+    real = store._bulk_upsert
+    monkeypatch.setattr(
+        store, "_bulk_upsert",
+        lambda *, model, rows, conflict_cols: tables.append(model) or real(
+            model=model, rows=rows, conflict_cols=conflict_cols),
+    )
+    with session.begin():
+        counts = store.upsert_all(_title("1"), [], [])
+
+    assert (counts.titles, counts.offers, counts.assets) == (1, 0, 0)
+    assert tables == [SapiTitleIndex]
+    assert store.upsert_offers([]) == 0
+
+# --- 3. ROW MAPPING (No Intermediate Copies) ---
+def test_row_converters_match_asdict():
+    # Logic: Hand-written row dicts must stay in sync with the record fields.
+    offer = _offer(quality="hd")
+    offer.audios = [Locale(language="eng")]
+    offer.subtitles = [Subtitle(closed_captions=False, locale=Locale(language="deu", region="DE"))]
+    asset = SapiAssetIndexRecord(
+        sapi_id="1", asset_kind="verticalPoster", image_urls={"w240": "https://i/1.jpg"},
+        fetched_at=FETCHED_AT, last_seen_run_id="run-1",
+    )
+
+    assert SapiIndicesStore._row_offer(offer) == asdict(offer)
+    assert SapiIndicesStore._row_title(_title("1")) == asdict(_title("1"))
+    assert SapiIndicesStore._row_asset(asset)["asset_kind"].value == "verticalPoster"
+    assert SapiIndicesStore._row_asset(asset).keys() == asdict(asset).keys()
+
+def test_upsert_batch_flattens_shows(session):
+    # Logic: Many shows land in one pass per table, with dedupe across show boundaries.
+    store = SapiIndicesStore(session)
+    shows = [
+        (_title("1"), [_offer("1", quality="sd")], []),
+        (_title("2"), [_offer("2")], []),
+        (_title("1"), [_offer("1", quality="hd")], []),
+    ]
+    with session.begin():
+        counts = store.upsert_batch(shows)
+
+    assert (counts.titles, counts.offers, counts.assets) == (2, 2, 0)
+    stored = session.execute(select(SapiOfferIndex.sapi_id, SapiOfferIndex.quality)).all()
+    assert sorted(stored, key=lambda r: r[0]) == [("1", "hd"), ("2", None)]
+
+
+# --- 4. COPY ENCODING (Postgres Bulk Path) ---
+def test_copy_text_encodes_postgres_text_format():
+    # Logic: NULL, enums, booleans, JSON and control characters follow COPY text rules.
+    assert _copy_text(None) == "\\N"
+    assert _copy_text(AssetKind.VERTICAL_POSTER) == "VERTICAL_POSTER"
+    assert _copy_text(True) == "t"
+    assert _copy_text(FETCHED_AT) == "2025-02-03 12:00:00"
+    assert _copy_text([{"language": "eng", "region": None}]) == '[{"language":"eng","region":null}]'
+    assert _copy_text("a\tb\\c\nd") == "a\\tb\\\\c\\nd"
+    assert _copy_text(b"\x01\xff") == "\\\\x01ff"
+
+def test_copy_buffer_formats_each_timestamp_once(monkeypatch):
+    # Logic: Rows sharing a page's fetched_at reuse one encoding; missing keys become NULL.
+    import src.persistence.stores.indices as indices_module
+
+    calls = []
+    monkeypatch.setattr(indices_module, "_copy_text",
+                        lambda v: calls.append(v) or _copy_text(v))
+    rows = [{"sapi_id": "1", "fetched_at": FETCHED_AT}, {"sapi_id": "2", "fetched_at": FETCHED_AT}]
+
+    buf = _copy_buffer(rows, ["sapi_id", "fetched_at", "quality"])
+
+    assert buf.read() == "1\t2025-02-03 12:00:00\t\\N\n2\t2025-02-03 12:00:00\t\\N\n"
+    assert calls.count(FETCHED_AT) == 1
+
+# --- 5. LOCK ORDER (Sorted Writes) ---
+def test_bulk_upsert_sends_rows_in_conflict_key_order(session, monkeypatch):
+    # Logic: Every statement carries rows sorted by the upsert key, across chunk boundaries.
+    store = SapiIndicesStore(session, chunk_size=2)
+    sent = []
+    execute = session.execute
+
+    def spy(stmt, *args, **kwargs):
+        params = stmt.compile().params
+        sent.extend(params[k] for k in sorted(params) if k.startswith("sapi_id"))
+        return execute(stmt, *args, **kwargs)
+
+    monkeypatch.setattr(session, "execute", spy)
+    with session.begin():
+        store.upsert_titles([_title("3"), _title("1"), _title("2")])
+
+    assert sent == ["1", "2", "3"]
+
+# --- 6. ASYNCPG STORE (Raw Prepared Upserts) ---
+class _FakeConn:
+    def __init__(self):
+        self.calls = []
+
+    def transaction(self):
+        return _FakeCtx(None)
+
+    async def executemany(self, sql, args):
+        self.calls.append((sql, args))
+
+class _FakeCtx:
+    def __init__(self, value):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+class _FakePool:
+    def __init__(self):
+        self.conn = _FakeConn()
+
+    def acquire(self):
+        return _FakeCtx(self.conn)
+
+def test_async_store_sends_one_executemany_per_table():
+    # Logic: Titles go first, rows are positional in column order, JSON is encoded text.
+    pool = _FakePool()
+    store = AsyncSapiIndicesStore(pool)
+    offer = _offer("1", quality="hd")
+    offer.audios = [Locale(language="eng")]
+
+    counts = asyncio.run(store.upsert_batch([(_title("1"), [offer], [])]))
+
+    assert (counts.titles, counts.offers, counts.assets) == (1, 1, 0)
+    (title_sql, title_args), (offer_sql, offer_args) = pool.conn.calls
+    assert title_sql.startswith("INSERT INTO sapi_titles_index (sapi_id,")
+    assert "ON CONFLICT (sapi_id) DO UPDATE SET imdb_id = EXCLUDED.imdb_id" in title_sql
+    assert title_args[0][:2] == ("1", None) and "MOVIE" in title_args[0]
+    assert '[{"language":"eng","region":null}]' in offer_args[0]
@@ -0,0 +1,213 @@
+import logging
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from src.pipeline.ledger import (
+    STATUS_COMPLETED,
+    CheckpointCounts,
+    RunResume,
+    SapiRunLedgerStore,
+    SapiRunScope,
+    _append_and_checkpoint_stmt,
+)
+from src.persistence.tables import SapiRawPage, SapiRunStatus
+
+FETCHED_AT = datetime(2025, 2, 3, 12, 0, 0)
+SCOPE = SapiRunScope(country="us", catalogs_bundle="netflix", params_fingerprint="fp")
+
+# --- FIXTURES ---
+def _verbs(statements):
+    return [sql.split()[0] for sql in statements]
+
+# --- 1. HANDSHAKE (Create Or Resume Run) ---
+def test_ensure_started_is_one_statement_and_keeps_existing_rows(db_manager, statements):
+    # Logic: New and resumed runs both cost one INSERT ... ON CONFLICT DO UPDATE RETURNING; the old row is kept.
+    with db_manager.get_session() as session, session.begin():
+        row = SapiRunLedgerStore(session).ensure_started(run_id="run-1", scope=SCOPE,
+                                                         started_at=FETCHED_AT)
+        assert (row.status, row.started_at) == (SapiRunStatus.STARTED, FETCHED_AT)
+    assert _verbs(statements) == ["INSERT"]
+
+    statements.clear()
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session)
+        ledger.checkpoint_after_page(run_id="run-1", next_cursor="c1", has_more=True, items_count=1)
+        statements.clear()
+        again = ledger.ensure_started(run_id="run-1", scope=SCOPE)
+        assert (again.started_at, again.status, again.pages_processed) == (FETCHED_AT, SapiRunStatus.RUNNING, 1)
+    assert _verbs(statements) == ["INSERT"]
+
+def test_start_or_resume_returns_the_cursor(db_manager):
+    # Logic: The handshake hands back cursor_next and status from RETURNING; log mode also reads the newest log row.
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session)
+        assert ledger.start_or_resume(run_id="run-1", scope=SCOPE) == RunResume(None, SapiRunStatus.STARTED)
+        ledger.checkpoint_after_page(run_id="run-1", next_cursor="c1", has_more=True, items_count=1)
+        assert ledger.start_or_resume(run_id="run-1", scope=SCOPE) == RunResume("c1", SapiRunStatus.RUNNING)
+
+        logged = SapiRunLedgerStore(session, checkpoint_log=True)
+        logged.checkpoint_after_page(run_id="run-1", next_cursor="c2", has_more=True, items_count=1)
+        assert logged.start_or_resume(run_id="run-1", scope=SCOPE).cursor_next == "c2"
+
+def test_handshake_logs_started_or_resumed(db_manager, caplog):
+    # Logic: Only a fresh row logs run_started; a row with progress (pages or status) logs run_resumed.
+    caplog.set_level(logging.INFO, logger="src.pipeline.ledger")
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session)
+        ledger.ensure_started(run_id="run-1", scope=SCOPE)
+        ledger.ensure_started(run_id="run-1", scope=SCOPE)
+        ledger.checkpoint_after_page(run_id="run-1", next_cursor="c1", has_more=True, items_count=1)
+        ledger.ensure_started(run_id="run-1", scope=SCOPE)
+
+    events = [r.getMessage().split()[0] for r in caplog.records if r.getMessage().startswith("sapi_ledger_run_")]
+    assert events == ["sapi_ledger_run_started", "sapi_ledger_run_started", "sapi_ledger_run_resumed"]
+
+# --- 2. CHECKPOINT (Raw Append + Cursor Advance) ---
+def test_append_page_and_checkpoint_falls_back_on_sqlite(db_manager):
+    # Logic: Without writable CTEs the fused call still appends once and advances the ledger.
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session)
+        ledger.ensure_started(run_id="run-1", scope=SCOPE)
+        page = {"shows": [{"id": "1"}], "hasMore": False}
+        first = ledger.append_page_and_checkpoint(
+            run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT, response_json=page,
+            next_cursor=None, has_more=False, items_count=1,
+        )
+        again = ledger.append_page_and_checkpoint(
+            run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT, response_json=page,
+            next_cursor=None, has_more=False, items_count=1,
+        )
+
+    assert (first, again) == (True, False)
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.status, row.pages_processed, row.items_processed) == (STATUS_COMPLETED, 2, 2)
+        assert len(session.execute(select(SapiRawPage.id)).all()) == 1
+
+def test_checkpoint_returns_updated_counters(db_manager):
+    # Logic: RETURNING hands back the server-side totals; an unknown run yields None.
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session)
+        ledger.ensure_started(run_id="run-1", scope=SCOPE)
+        ledger.checkpoint_after_page(run_id="run-1", next_cursor="c1", has_more=True, items_count=3)
+        counts = ledger.checkpoint_after_page(run_id="run-1", next_cursor="c2", has_more=True, items_count=4)
+        missing = ledger.checkpoint_after_page(run_id="nope", next_cursor=None, has_more=True, items_count=1)
+
+    assert counts == CheckpointCounts(pages_processed=2, items_processed=7)
+    assert missing is None
+
+def test_buffered_checkpoints_flush_as_one_update(db_manager, statements):
+    # Logic: Deltas sum, the latest cursor/has_more win, and the flush is a single UPDATE.
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session)
+        ledger.ensure_started(run_id="run-1", scope=SCOPE)
+
+        statements.clear()
+        ledger.checkpoint_many(run_id="run-1", delta_pages=1, delta_items=3, next_cursor="c1", has_more=True)
+        ledger.checkpoint_many(run_id="run-1", delta_pages=1, delta_items=4, next_cursor="c2", has_more=False)
+        assert statements == []
+        counts = ledger.flush_checkpoint()
+        assert _verbs(statements) == ["UPDATE"]
+        assert ledger.flush_checkpoint() is None
+
+    assert counts == CheckpointCounts(pages_processed=2, items_processed=7)
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.cursor_next, row.status) == ("c2", STATUS_COMPLETED)
+
+def test_get_cursor_next_reads_only_the_cursor(db_manager):
+    # Logic: The resume cursor is read without loading the ledger row into the session.
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session)
+        ledger.ensure_started(run_id="run-1", scope=SCOPE)
+        ledger.checkpoint_after_page(run_id="run-1", next_cursor="c1", has_more=True, items_count=1)
+
+    with db_manager.get_session() as session:
+        ledger = SapiRunLedgerStore(session)
+        assert ledger.get_cursor_next("run-1") == "c1"
+        assert ledger.get_cursor_next("nope") is None
+        assert len(session.identity_map) == 0
+
+def test_fused_statement_is_one_postgres_round_trip():
+    # Logic: Both writes are data-modifying CTEs of a single SELECT sharing :run_id.
+    sql = str(_append_and_checkpoint_stmt().compile(dialect=postgresql.psycopg2.dialect()))
+
+    assert sql.startswith("WITH ins AS")
+    assert "ON CONFLICT (run_id, cursor_used) DO NOTHING RETURNING" in sql
+    assert "upd AS \n(UPDATE sapi_run_ledger" in sql
+    assert sql.count("%(run_id)s") == 2
+
+def test_checkpoint_log_appends_and_compacts(db_manager, statements):
+    # Logic: Log mode never UPDATEs the run row per checkpoint; resume reads the newest log row; compact folds it.
+    from src.persistence.tables import SapiRunCheckpoint
+
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session, checkpoint_log=True)
+        ledger.ensure_started(run_id="run-1", scope=SCOPE)
+
+        statements.clear()
+        ledger.checkpoint_after_page(run_id="run-1", next_cursor="c1", has_more=True, items_count=3)
+        ledger.checkpoint_after_page(run_id="run-1", next_cursor="c2", has_more=True, items_count=4)
+        assert _verbs(statements) == ["INSERT", "INSERT"]
+        assert ledger.get_cursor_next("run-1") == "c2"
+
+        counts = ledger.compact("run-1")
+        assert counts == CheckpointCounts(pages_processed=2, items_processed=7)
+        assert session.execute(select(SapiRunCheckpoint.seq)).all() == []
+        assert ledger.get_cursor_next("run-1") == "c2"
+
+        ledger.checkpoint_after_page(run_id="run-1", next_cursor=None, has_more=False, items_count=1)
+
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.status, row.pages_processed, row.items_processed) == (STATUS_COMPLETED, 3, 8)
+        assert session.execute(select(SapiRunCheckpoint.seq)).all() == []
+
+# --- 3. SCOPE QUERIES (Latest Completed Run) ---
+def test_latest_completed_run_id_uses_partial_index(db_manager):
+    # Logic: The newest completed run wins, and the lookup is served by the partial index.
+    from sqlalchemy import text
+    from sqlalchemy.schema import CreateIndex
+    from src.persistence.tables import SapiRunLedger
+
+    with db_manager.get_session() as session, session.begin():
+        ledger = SapiRunLedgerStore(session)
+        for run_id, has_more in (("run-1", False), ("run-2", False), ("run-3", True)):
+            ledger.ensure_started(run_id=run_id, scope=SCOPE)
+            ledger.checkpoint_after_page(run_id=run_id, next_cursor=None, has_more=has_more, items_count=0)
+        session.execute(text("UPDATE sapi_run_ledger SET ended_at = '2025-01-01' WHERE run_id = 'run-1'"))
+
+    with db_manager.get_session() as session:
+        assert SapiRunLedgerStore(session).latest_completed_run_id(SCOPE) == "run-2"
+        plan = session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT run_id FROM sapi_run_ledger WHERE country='us' "
+            "AND catalogs_bundle='netflix' AND params_fingerprint='fp' AND status='completed' "
+            "ORDER BY ended_at DESC, started_at DESC LIMIT 1"
+        )).all()
+    assert "ix_sapi_run_ledger_latest_completed" in str(plan)
+
+    index = next(i for i in SapiRunLedger.__table__.indexes if i.name == "ix_sapi_run_ledger_latest_completed")
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.psycopg2.dialect()))
+    assert "INCLUDE (run_id) WHERE status = 'completed'" in ddl
+
+def test_status_is_stored_by_value(db_manager):
+    # Logic: Enum-typed status keeps the lowercase labels existing rows and the partial index use.
+    from sqlalchemy import text
+
+    with db_manager.get_session() as session, session.begin():
+        SapiRunLedgerStore(session).ensure_started(run_id="run-1", scope=SCOPE)
+
+    with db_manager.get_session() as session:
+        assert session.execute(text("SELECT status FROM sapi_run_ledger")).scalar_one() == "started"
+        assert SapiRunLedgerStore(session).get("run-1").status is SapiRunStatus.STARTED
+
+# --- 4. CLOCK (Naive UTC Timestamps) ---
+def test_utcnow_naive_is_naive_utc():
+    # Logic: The epoch-based fast path matches the aware clock with tzinfo stripped.
+    from datetime import timedelta, timezone
+    from src.pipeline.ledger import _utcnow_naive
+
+    now = _utcnow_naive()
+    assert now.tzinfo is None
+    assert abs(now - datetime.now(timezone.utc).replace(tzinfo=None)) < timedelta(seconds=1)
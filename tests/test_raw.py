@@ -0,0 +1,202 @@
+import json
+from datetime import datetime
+
+import pytest
+import blake3
+from sqlalchemy import String, create_engine, select, type_coerce
+from sqlalchemy.orm import Session
+from src.persistence.stores import raw
+from src.persistence.stores.raw import SapiRawPagesStore, _stable_json_bytes
+from src.persistence.tables import Base, SapiRawPage
+
+FETCHED_AT = datetime(2025, 2, 3, 12, 0, 0)
+
+# --- FIXTURES ---
+# Logic: In-memory SQLite exercises the same ON CONFLICT DO NOTHING path as Postgres.
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+@pytest.fixture(autouse=True)
+def hash_every_page(monkeypatch):
+    # Logic: Hashing tests need every page sampled; the production default is 0.
+    monkeypatch.setattr(raw, "_HASH_SAMPLE_RATE", 1.0)
+
+def _page(next_cursor=None):
+    return {"shows": [{"id": "1"}, {"id": "2"}], "hasMore": next_cursor is not None,
+            "nextCursor": next_cursor}
+
+# --- 1. APPEND (Idempotent Raw Pages) ---
+def test_append_page_is_idempotent_per_cursor(session):
+    # Logic: The same (run_id, cursor) is stored once; the hash covers the stable bytes.
+    store = SapiRawPagesStore(session)
+    with session.begin():
+        first = store.append_page(run_id="run-1", cursor_used=None,
+                                  fetched_at=FETCHED_AT, response_json=_page("c1"))
+        again = store.append_page(run_id="run-1", cursor_used="",
+                                  fetched_at=FETCHED_AT, response_json=_page("c1"))
+
+    assert (first, again) == (True, False)
+    row = session.execute(select(SapiRawPage)).scalar_one()
+    assert (row.cursor_used, row.items_count, row.next_cursor) == ("", 2, "c1")
+    assert row.response_hash == blake3.blake3(_stable_json_bytes(_page("c1"))).digest()
+
+# --- 2. SERIALIZATION (Stable Bytes) ---
+def test_orjson_bytes_match_legacy_json_for_ascii(monkeypatch):
+    # Logic: Hashes of ASCII pages survive the json -> orjson switch unchanged.
+    payload = {"b": [1, {"z": True, "a": None}], "a": "x"}
+    legacy = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    assert _stable_json_bytes(payload) == legacy
+    monkeypatch.setattr(raw, "_USE_ORJSON", False)
+    assert _stable_json_bytes(payload) == legacy
+
+# --- 3. HASHING (Drift Detection) ---
+def test_hash_bytes_is_tagged_blake3(session):
+    # Logic: Stored digests are 32-byte BLAKE3, and each row records the algorithm.
+    blob = b'{"shows":[]}'
+    assert raw._hash_bytes(blob) == blake3.blake3(blob).digest()
+
+    with session.begin():
+        SapiRawPagesStore(session).append_page(run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT,
+                                               response_json={"shows": []}, response_bytes=blob)
+    row = session.execute(select(SapiRawPage)).scalar_one()
+    assert (len(row.response_hash), row.hash_algo) == (32, "blake3")
+
+def test_hash_is_skipped_when_not_sampled(session, monkeypatch):
+    # Logic: At sample rate 0 the page is stored with no digest and no algorithm tag.
+    monkeypatch.setattr(raw, "_HASH_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(raw, "_hash_bytes", lambda b: pytest.fail("hashed an unsampled page"))
+    store = SapiRawPagesStore(session)
+    with session.begin():
+        store.append_page(run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT,
+                          response_json=_page())
+        store.append_pages_bulk([{"run_id": "run-1", "cursor_used": "c1",
+                                  "fetched_at": FETCHED_AT, "response_json": _page()}])
+
+    rows = session.execute(select(SapiRawPage.response_hash, SapiRawPage.hash_algo)).all()
+    assert [tuple(r) for r in rows] == [(None, None), (None, None)]
+
+def test_append_page_hashes_wire_bytes_when_given(session):
+    # Logic: The body as received is hashed directly; no re-serialization.
+    body = b'{"shows": [], "hasMore": false}'
+    store = SapiRawPagesStore(session)
+    with session.begin():
+        store.append_page(run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT,
+                          response_json={"shows": [], "hasMore": False}, response_bytes=body)
+
+    row = session.execute(select(SapiRawPage)).scalar_one()
+    assert row.response_hash == blake3.blake3(body).digest()
+
+# --- 4. STORAGE (Serialize Once) ---
+def test_append_page_stores_hashed_bytes_verbatim(session):
+    # Logic: The column receives the same text that was hashed; reads still return a dict.
+    body = b'{"shows": [{"id": "1"}], "hasMore": false}'
+    store = SapiRawPagesStore(session)
+    with session.begin():
+        store.append_page(run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT,
+                          response_json={"shows": [{"id": "1"}], "hasMore": False},
+                          response_bytes=body)
+
+    stored_text = session.execute(select(type_coerce(SapiRawPage.response_json, String))).scalar_one()
+    assert stored_text == body.decode("utf-8")
+    assert session.execute(select(SapiRawPage.response_json)).scalar_one()["shows"] == [{"id": "1"}]
+
+# --- 5. BULK APPEND (Fewer Round-Trips) ---
+def test_append_pages_bulk_chunks_and_skips_existing(session):
+    # Logic: Multi-row inserts across chunks keep (run_id, cursor) idempotency.
+    store = SapiRawPagesStore(session, chunk_size=2)
+    with session.begin():
+        store.append_page(run_id="run-1", cursor_used="c1", fetched_at=FETCHED_AT,
+                          response_json=_page("c2"))
+        inserted = store.append_pages_bulk([
+            {"run_id": "run-1", "cursor_used": None, "fetched_at": FETCHED_AT,
+             "response_json": _page("c1")},
+            {"run_id": "run-1", "cursor_used": "c1", "fetched_at": FETCHED_AT,
+             "response_json": _page("c2")},
+            {"run_id": "run-1", "cursor_used": "c2", "fetched_at": FETCHED_AT,
+             "response_json": _page(), "response_bytes": b'{"shows":[]}'},
+        ])
+
+    assert inserted == 2
+    rows = session.execute(select(SapiRawPage).order_by(SapiRawPage.cursor_used)).scalars().all()
+    assert [r.cursor_used for r in rows] == ["", "c1", "c2"]
+    assert rows[2].response_hash == blake3.blake3(b'{"shows":[]}').digest()
+    assert rows[0].response_json == _page("c1")
+    assert store.append_pages_bulk([]) == 0
+
+def test_hash_many_matches_serial_hashing(monkeypatch):
+    # Logic: The thread-pool path returns the same digests, in input order.
+    monkeypatch.setattr(raw, "_PARALLEL_HASH_MIN_BYTES", 0)
+    monkeypatch.setattr(raw, "_HASH_WORKERS", 4)
+    blobs = [bytes([i]) * 5000 for i in range(10)]
+
+    assert raw._hash_many(blobs) == [blake3.blake3(b).digest() for b in blobs]
+
+# --- 6. INSTRUMENTATION (Timing Only When Logged) ---
+def test_append_page_skips_clock_when_info_disabled(session, monkeypatch, caplog):
+    # Logic: With INFO filtered out, no perf_counter_ns calls are made on the success path.
+    calls = []
+    monkeypatch.setattr(raw.time, "perf_counter_ns", lambda: calls.append(1) or 0)
+    store = SapiRawPagesStore(session)
+
+    with caplog.at_level("WARNING", logger="src.persistence.stores.raw"), session.begin():
+        store.append_page(run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT,
+                          response_json=_page())
+    assert calls == []
+
+    with caplog.at_level("INFO", logger="src.persistence.stores.raw"), session.begin():
+        store.append_page(run_id="run-1", cursor_used="c1", fetched_at=FETCHED_AT,
+                          response_json=_page())
+    assert len(calls) == 4
+    assert "SAPI_DB_RAW_APPEND_SUCCESS" in caplog.text
+
+def test_append_page_start_log_only_at_debug(session, monkeypatch, caplog):
+    # Logic: The START log helper is not called at INFO, and logs the page metadata at DEBUG.
+    calls = []
+    monkeypatch.setattr(raw, "_emit_start", lambda *a: calls.append(a))
+    store = SapiRawPagesStore(session)
+
+    with caplog.at_level("INFO", logger="src.persistence.stores.raw"), session.begin():
+        store.append_page(run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT,
+                          response_json=_page("c1"))
+    assert calls == []
+
+    monkeypatch.undo()
+    with caplog.at_level("DEBUG", logger="src.persistence.stores.raw"), session.begin():
+        store.append_page(run_id="run-1", cursor_used="c1", fetched_at=FETCHED_AT,
+                          response_json=_page())
+    assert "SAPI_DB_RAW_APPEND_START run_id=run-1 cursor_used=c1" in caplog.text
+
+# --- 7. LOOKUP (Replay Stored Pages) ---
+def test_get_page_reads_by_run_and_cursor(session):
+    # Logic: The first-page cursor (None) matches its normalized "" key; unknown cursors miss.
+    store = SapiRawPagesStore(session)
+    with session.begin():
+        store.append_page(run_id="run-1", cursor_used=None, fetched_at=FETCHED_AT, response_json=_page("c1"))
+
+    assert store.get_page(run_id="run-1", cursor_used=None) == (FETCHED_AT, _page("c1"))
+    assert store.get_page(run_id="run-1", cursor_used="c1") is None
+    assert store.get_page(run_id="run-2", cursor_used=None) is None
+
+# --- 8. COPY (PostgreSQL Bulk Path) ---
+@pytest.mark.postgres
+def test_copy_append_merges_and_skips_existing(pg_session):
+    # Logic: Batches at copy_threshold go through the staging table and keep (run_id, cursor) idempotency.
+    store = SapiRawPagesStore(pg_session, copy_threshold=2)
+    pages = [
+        {"run_id": "run-1", "cursor_used": None, "fetched_at": FETCHED_AT, "response_json": _page("c1")},
+        {"run_id": "run-1", "cursor_used": "c1", "fetched_at": FETCHED_AT, "response_json": _page("c2"),
+         "response_bytes": b'{"shows":[{"id":"1"}],"hasMore":true,"nextCursor":"c2"}'},
+    ]
+    with pg_session.begin():
+        assert store.append_pages_bulk(pages) == 2
+        assert store.append_pages_bulk(pages) == 0
+
+    rows = pg_session.execute(select(SapiRawPage).order_by(SapiRawPage.cursor_used)).scalars().all()
+    assert [(r.cursor_used, r.items_count, r.next_cursor) for r in rows] == [("", 2, "c1"), ("c1", 2, "c2")]
+    assert rows[0].response_json == _page("c1")
+    assert rows[1].response_hash == blake3.blake3(pages[1]["response_bytes"]).digest()
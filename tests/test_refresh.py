@@ -0,0 +1,46 @@
+import httpx
+import pytest
+import respx
+from sqlalchemy import select
+from src.client.client import SapiClient
+from src.persistence.tables import SapiFetchLedger, SapiRawPage, SapiTitleIndex
+from src.pipeline.refresh import SapiShowRefresher
+
+SHOW_URL = "https://api.test.com/shows/82"
+
+# --- FIXTURES ---
+@pytest.fixture
+def refresher(db_manager):
+    client = SapiClient("test_key", "test_host", "https://api.test.com")
+    return SapiShowRefresher(db_manager=db_manager, sapi_client=client)
+
+def _show(title):
+    return {"id": "82", "title": title, "showType": "series", "imageSet": {}, "streamingOptions": {}}
+
+# --- 1. CONDITIONAL GET (Skip Unchanged Shows) ---
+@respx.mock
+def test_refresh_sends_validators_and_skips_unchanged(refresher, db_manager):
+    # Logic: First pass stores the ETag; second pass sends it back and a 304 skips extraction.
+    respx.get(SHOW_URL).mock(side_effect=[
+        httpx.Response(200, json=_show("Breaking Bad"),
+                       headers={"ETag": '"v1"', "Last-Modified": "Mon, 03 Feb 2025 12:00:00 GMT"}),
+        httpx.Response(304),
+    ])
+
+    first = refresher.refresh_shows(sapi_ids=["82"], run_id="run-1")
+    second = refresher.refresh_shows(sapi_ids=["82"], run_id="run-2")
+
+    assert (first.changed, first.not_modified) == (1, 0)
+    assert (second.changed, second.not_modified) == (0, 1)
+    assert "If-None-Match" not in respx.calls[0].request.headers
+    assert respx.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert respx.calls[1].request.headers["If-Modified-Since"] == "Mon, 03 Feb 2025 12:00:00 GMT"
+
+    with db_manager.get_session() as session:
+        title = session.get(SapiTitleIndex, "82")
+        ledger = session.get(SapiFetchLedger, "82")
+        raw_pages = session.execute(select(SapiRawPage.cursor_used)).scalars().all()
+
+    assert title.last_seen_run_id == "run-1"
+    assert ledger.etag == '"v1"' and ledger.checked_at >= ledger.changed_at
+    assert raw_pages == ["/shows/82"]
@@ -0,0 +1,398 @@
+import json
+import threading
+
+import pytest
+from sqlalchemy import select, text
+from src.client.client import FetchedPage
+from src.persistence.tables import SapiRawPage
+from src.pipeline.ledger import STATUS_COMPLETED, SapiRunLedgerStore, SapiRunScope
+from src.pipeline.worker import BackfillOptions, SapiBackfillWorker
+
+SCOPE = SapiRunScope(country="us", catalogs_bundle="netflix", params_fingerprint="fp")
+
+# --- FIXTURES ---
+class FakeClient:
+    # Logic: Serves a fixed cursor chain and records which thread asked for which cursor.
+    def __init__(self, pages, fail_once=(), wire=False):
+        self.pages = pages
+        self.fail_once = set(fail_once)
+        self.wire = wire
+        self.calls = []
+
+    def fetch_page(self, endpoint, query_params):
+        cursor = dict(query_params).get("cursor")
+        self.calls.append((cursor, threading.current_thread().name))
+        if cursor in self.fail_once:
+            self.fail_once.discard(cursor)
+            raise ConnectionError("boom")
+        payload = self.pages[cursor]
+        return FetchedPage(payload=payload, content=json.dumps(payload).encode() if self.wire else None)
+
+def _chain(n, shows=None):
+    pages = {}
+    for i in range(n):
+        cursor = None if i == 0 else f"c{i}"
+        last = i == n - 1
+        pages[cursor] = {"shows": shows(i) if shows else [], "hasMore": not last,
+                         "nextCursor": None if last else f"c{i + 1}"}
+    return pages
+
+def _show(sapi_id, title):
+    return {"id": sapi_id, "title": title, "showType": "series", "imageSet": {}, "streamingOptions": {}}
+
+@pytest.fixture
+def make_worker(db_manager):
+    def _make(client):
+        return SapiBackfillWorker(db_manager=db_manager, sapi_client=client)
+    return _make
+
+# --- 1. PREFETCH (Fetch Overlaps Persist) ---
+def test_next_page_is_fetched_on_the_prefetch_thread(make_worker, db_manager):
+    # Logic: Every page after the first comes from the background thread; each cursor is fetched once.
+    client = FakeClient(_chain(3))
+    run_id = make_worker(client).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1")
+
+    assert [c for c, _ in client.calls] == [None, "c1", "c2"]
+    assert [t.startswith("sapi-prefetch") for _, t in client.calls] == [False, True, True]
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get(run_id)
+        assert (row.status, row.pages_processed) == (STATUS_COMPLETED, 3)
+        assert len(session.execute(select(SapiRawPage.id)).all()) == 3
+
+def test_failed_prefetch_is_retried_inline(make_worker):
+    # Logic: A prefetch error is not fatal; the same cursor is fetched again on the caller's thread.
+    client = FakeClient(_chain(2), fail_once={"c1"})
+    make_worker(client).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1")
+
+    assert [c for c, _ in client.calls] == [None, "c1", "c1"]
+    assert not client.calls[2][1].startswith("sapi-prefetch")
+
+def test_no_prefetch_past_max_pages(make_worker, db_manager):
+    # Logic: The page after the max_pages stop is not requested, and the cursor stays resumable.
+    client = FakeClient(_chain(5))
+    make_worker(client).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                                     options=BackfillOptions(max_pages=2))
+
+    assert [c for c, _ in client.calls] == [None, "c1"]
+    with db_manager.get_session() as session:
+        assert SapiRunLedgerStore(session).get_cursor_next("run-1") == "c2"
+
+# --- 2. SESSION REUSE (One Connection Per Run) ---
+def test_run_checks_out_one_connection(make_worker, db_manager, listen):
+    # Logic: Handshake and every page transaction share one pinned connection.
+    worker = make_worker(FakeClient(_chain(4)))
+    checkouts = []
+    listen(db_manager.engine, "checkout", lambda *a: checkouts.append(1))
+    worker.run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1")
+
+    assert len(checkouts) == 1
+
+def test_failure_is_marked_on_the_pinned_connection(tmp_path):
+    # Logic: With a one-connection pool held by the run, mark_failed still lands and the original error surfaces.
+    from src.persistence.tables import Base, SapiRunStatus
+    from tests.conftest import SqliteDatabaseManager
+
+    manager = SqliteDatabaseManager(f"sqlite:///{tmp_path / 'one.db'}", pool_size=1,
+                                    max_overflow=0, pool_timeout=0.2)
+    Base.metadata.create_all(manager.engine)
+    pages = _chain(3)
+    del pages["c1"]
+
+    with pytest.raises(KeyError):
+        SapiBackfillWorker(db_manager=manager, sapi_client=FakeClient(pages)).run_backfill(
+            scope=SCOPE, base_query_params={}, run_id="run-1", options=BackfillOptions(raw_batch_size=1))
+
+    with manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.status, row.pages_processed) == (SapiRunStatus.FAILED, 1)
+        assert "KeyError" in row.last_error
+
+# --- 3. BATCHING (Pages Per Transaction) ---
+def test_pages_are_persisted_in_batches(make_worker, db_manager, statements):
+    # Logic: Five pages at batch size 2 commit as 2 + 2 + 1 with one raw INSERT per batch.
+    worker = make_worker(FakeClient(_chain(5)))
+    worker.run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                        options=BackfillOptions(raw_batch_size=2))
+
+    assert len([sql for sql in statements if sql.startswith("INSERT INTO sapi_raw_pages")]) == 3
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.status, row.pages_processed, row.cursor_next) == (STATUS_COMPLETED, 5, None)
+        assert len(session.execute(select(SapiRawPage.id)).all()) == 5
+
+def test_unflushed_pages_are_not_checkpointed(make_worker, db_manager):
+    # Logic: A failure mid-batch leaves cursor_next at the last committed batch, so resume re-fetches.
+    client = FakeClient(_chain(5), fail_once={"c3"})
+    with pytest.raises(ConnectionError):
+        make_worker(client).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                                         options=BackfillOptions(raw_batch_size=2, prefetch=False))
+
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.pages_processed, row.cursor_next, row.status.value) == (2, "c2", "failed")
+        assert len(session.execute(select(SapiRawPage.id)).all()) == 2
+
+def test_index_upserts_are_coalesced_across_pages(make_worker, db_manager, statements):
+    # Logic: A batch's titles go out in one upsert; a show repeated on a later page keeps the later title.
+    from src.persistence.tables import SapiTitleIndex
+
+    pages = _chain(3, shows=lambda i: [_show("1", f"v{i}"), _show(f"x{i}", "other")])
+    worker = make_worker(FakeClient(pages))
+    worker.run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1")
+
+    assert len([sql for sql in statements if sql.startswith("INSERT INTO sapi_titles")]) == 1
+    with db_manager.get_session() as session:
+        assert session.get(SapiTitleIndex, "1").title == "v2"
+        assert len(session.execute(select(SapiTitleIndex.sapi_id)).all()) == 4
+
+def test_batch_flushes_early_at_chunk_size_shows(make_worker, statements):
+    # Logic: Once a batch holds chunk_size shows it is persisted even below raw_batch_size pages.
+    pages = _chain(3, shows=lambda i: [_show(f"{i}a", "a"), _show(f"{i}b", "b")])
+    worker = make_worker(FakeClient(pages))
+    worker.run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                        options=BackfillOptions(chunk_size=3))
+
+    assert len([sql for sql in statements if sql.startswith("INSERT INTO sapi_raw_pages")]) == 2
+
+def test_checkpoint_log_run_resumes_and_compacts(make_worker, db_manager):
+    # Logic: A paused log-mode run resumes from the log; completion folds the log into the ledger row.
+    from src.persistence.tables import SapiRunCheckpoint
+
+    client = FakeClient(_chain(5))
+    worker = make_worker(client)
+    for _ in range(2):
+        worker.run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                            options=BackfillOptions(max_pages=3, raw_batch_size=2, checkpoint_log=True))
+
+    assert [c for c, _ in client.calls] == [None, "c1", "c2", "c3", "c4"]
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.status, row.pages_processed) == (STATUS_COMPLETED, 5)
+        assert session.execute(select(SapiRunCheckpoint.seq)).all() == []
+
+# --- 4. POOL (Sizing And Pre-Warm) ---
+def test_default_pool_size_follows_cores_plus_spindles(monkeypatch):
+    # Logic: (2 * cores) + effective spindles, with spindles overridable from the environment.
+    from src.persistence import engine
+
+    monkeypatch.setattr(engine.os, "cpu_count", lambda: 4)
+    assert engine.default_pool_size() == 10
+    monkeypatch.setenv("SAPI_EFFECTIVE_SPINDLES", "1")
+    assert engine.default_pool_size() == 9
+
+def test_worker_prewarms_pool_connections(db_manager):
+    # Logic: Construction leaves the requested connections open and idle in the pool, capped at its size.
+    SapiBackfillWorker(db_manager=db_manager, sapi_client=FakeClient({}), prewarm_connections=3)
+    assert db_manager.engine.pool.checkedin() == 3
+
+    db_manager.prewarm(100)
+    assert db_manager.engine.pool.checkedin() == db_manager.engine.pool.size()
+
+# --- 5. QUERY PARAMS (Built Once Per Run) ---
+def test_query_params_are_normalized_once_per_run(make_worker, monkeypatch):
+    # Logic: Catalogs are normalized once; each page only adds its cursor to the shared params.
+    from src.pipeline import worker as worker_mod
+
+    calls = []
+    normalize = worker_mod._normalize_catalogs_param
+    monkeypatch.setattr(worker_mod, "_normalize_catalogs_param", lambda c: calls.append(c) or normalize(c))
+    client = FakeClient(_chain(3))
+    client_params = []
+    fetch = client.fetch_page
+    client.fetch_page = lambda endpoint, params: client_params.append(params) or fetch(endpoint, params)
+
+    make_worker(client).run_backfill(scope=SCOPE, base_query_params={"catalogs": ["prime", " netflix "],
+                                                                     "cursor": "stale"}, run_id="run-1")
+
+    assert len(calls) == 1
+    assert client_params[0] == (("catalogs", "prime,netflix"), ("country", "us"))
+    assert client_params[2] == (("catalogs", "prime,netflix"), ("country", "us"), ("cursor", "c2"))
+
+@pytest.mark.parametrize("catalogs, expected", [
+    (["netflix", "prime.addon.hbo"], "netflix,prime.addon.hbo"),
+    (("netflix",), "netflix"),
+    ([" netflix", "", "prime "], "netflix,prime"),
+    (["a,", "b"], "a,,b"),
+    (["netflix", 7], "netflix,7"),
+    ([], ""),
+])
+def test_catalogs_fast_path_matches_general_normalization(catalogs, expected):
+    # Logic: Clean str lists are joined directly; anything else falls back to strip-and-filter.
+    from src.pipeline.worker import _normalize_catalogs_param
+
+    assert _normalize_catalogs_param(catalogs) == expected
+
+# --- 6. RAW BODY (Store The Bytes As Received) ---
+@pytest.mark.parametrize("raw_batch_size", [1, 16])
+def test_raw_pages_store_the_wire_body(make_worker, db_manager, raw_batch_size):
+    # Logic: Both the fused single-page path and the bulk path store the fetched bytes, not a re-encode.
+    pages = _chain(2, shows=lambda i: [_show(str(i), "T")])
+    make_worker(FakeClient(pages, wire=True)).run_backfill(
+        scope=SCOPE, base_query_params={}, run_id="run-1",
+        options=BackfillOptions(raw_batch_size=raw_batch_size))
+
+    with db_manager.get_session() as session:
+        stored = session.execute(text("SELECT response_json FROM sapi_raw_pages ORDER BY id")).scalars().all()
+    assert stored == [json.dumps(pages[c]) for c in (None, "c1")]
+
+@pytest.mark.parametrize("raw_copy, threshold", [(True, 1000), (False, None)])
+def test_raw_batches_use_copy_when_enabled(make_worker, monkeypatch, raw_copy, threshold):
+    # Logic: Only batches at the store's default threshold qualify for COPY; raw_copy=False keeps plain INSERTs.
+    import src.pipeline.worker as worker_module
+
+    seen = []
+    real = worker_module.SapiRawPagesStore
+
+    def spy(session, **kwargs):
+        store = real(session, **kwargs)
+        seen.append(store._copy_threshold)
+        return store
+
+    monkeypatch.setattr(worker_module, "SapiRawPagesStore", spy)
+    make_worker(FakeClient(_chain(3))).run_backfill(
+        scope=SCOPE, base_query_params={}, run_id="run-1", options=BackfillOptions(raw_copy=raw_copy))
+
+    assert seen == [threshold]
+
+# --- 7. LOGGING (Per-Page Lines) ---
+def test_page_log_is_short_at_info_and_detailed_at_debug(make_worker, caplog):
+    # Logic: INFO carries page/items only; cursor and timing detail is a separate DEBUG line.
+    with caplog.at_level("INFO", logger="src.pipeline.worker"):
+        make_worker(FakeClient(_chain(2))).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1")
+    info = [r.getMessage() for r in caplog.records if "SAPI_BACKFILL_PAGE" in r.getMessage()]
+    assert info == ["SAPI_BACKFILL_PAGE_OK run_id=run-1 page=1 items=0",
+                    "SAPI_BACKFILL_PAGE_OK run_id=run-1 page=2 items=0"]
+
+    caplog.clear()
+    with caplog.at_level("DEBUG", logger="src.pipeline.worker"):
+        make_worker(FakeClient(_chain(2))).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-2")
+    detail = [r.getMessage() for r in caplog.records if "SAPI_BACKFILL_PAGE_DETAIL" in r.getMessage()]
+    assert len(detail) == 2
+    assert "cursor_used=START next_cursor='c1'" in detail[0]
+
+def test_page_log_is_not_built_above_info(make_worker, caplog, monkeypatch):
+    # Logic: With INFO off, no per-page record is created at all.
+    import src.pipeline.worker as worker_module
+
+    built = []
+    monkeypatch.setattr(worker_module.logger, "info", lambda *a, **k: built.append(a[0]))
+    with caplog.at_level("WARNING", logger="src.pipeline.worker"):
+        make_worker(FakeClient(_chain(2))).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1")
+
+    assert not any(m.startswith("SAPI_BACKFILL_PAGE") for m in built)
+
+# --- 8. PREFETCH POOL (Shared Across Runs) ---
+@pytest.mark.parametrize("value, expected", [("3", 3), ("0", 1), ("-2", 1), ("two", None), (None, None)])
+def test_prefetch_pool_size_is_parsed_defensively(monkeypatch, value, expected):
+    # Logic: SAPI_PREFETCH is floored at 1; unset or unparsable values fall back to the DB pool size.
+    from src.persistence.engine import default_pool_size
+    from src.pipeline.worker import _prefetch_workers
+
+    if value is None:
+        monkeypatch.delenv("SAPI_PREFETCH", raising=False)
+    else:
+        monkeypatch.setenv("SAPI_PREFETCH", value)
+    assert _prefetch_workers() == (expected if expected is not None else default_pool_size())
+
+def test_slow_prefetch_does_not_stall_a_concurrent_run(make_worker, db_manager):
+    # Logic: Concurrent runs share the pool but each gets a thread; one run's stuck fetch leaves the other free.
+    blocked, release = threading.Event(), threading.Event()
+
+    class SlowClient(FakeClient):
+        timed_out = False
+
+        def fetch_page(self, endpoint, query_params):
+            if dict(query_params).get("cursor") == "c1":
+                blocked.set()
+                self.timed_out = not release.wait(timeout=5)
+            return super().fetch_page(endpoint, query_params)
+
+    slow, fast = SlowClient(_chain(3)), FakeClient(_chain(3))
+    stuck = threading.Thread(target=make_worker(slow).run_backfill,
+                             kwargs={"scope": SCOPE, "base_query_params": {}, "run_id": "run-1"})
+    stuck.start()
+    try:
+        assert blocked.wait(timeout=5)
+        make_worker(fast).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-2")
+        assert [t.startswith("sapi-prefetch") for _, t in fast.calls] == [False, True, True]
+    finally:
+        release.set()
+        stuck.join()
+    assert not slow.timed_out
+    with db_manager.get_session() as session:
+        assert SapiRunLedgerStore(session).get("run-1").status == STATUS_COMPLETED
+
+# --- 9. EMPTY PAGES (Checkpoint Only) ---
+def test_empty_pages_skip_raw_rows_when_disabled(make_worker, db_manager):
+    # Logic: Shows-less pages still advance the ledger; only pages with shows get a raw row.
+    pages = _chain(4, shows=lambda i: [_show(str(i), "T")] if i % 2 else [])
+    make_worker(FakeClient(pages)).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                                                options=BackfillOptions(persist_empty_raw=False))
+
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.status, row.pages_processed, row.items_processed) == (STATUS_COMPLETED, 4, 2)
+        cursors = session.execute(select(SapiRawPage.cursor_used).order_by(SapiRawPage.id)).scalars().all()
+        assert cursors == ["c1", "c3"]
+
+def test_empty_single_page_batch_is_one_update(make_worker, statements):
+    # Logic: With raw_batch_size=1 an empty page costs exactly the checkpoint UPDATE.
+    worker = make_worker(FakeClient(_chain(1)))
+    statements.clear()  # the constructor's prewarm SELECT 1
+    worker.run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                        options=BackfillOptions(raw_batch_size=1, persist_empty_raw=False))
+
+    # The handshake INSERT ... RETURNING (no replay lookup by default), then the page's lone UPDATE.
+    assert [sql.split()[0] for sql in statements] == ["INSERT", "UPDATE"]
+
+# --- 10. REPLAY (Resume From Stored Pages) ---
+def test_rewound_run_replays_stored_pages_without_http(make_worker, db_manager):
+    # Logic: Stored cursors are served from sapi_raw_pages without being re-counted; HTTP (and prefetch) start at the first miss.
+    from sqlalchemy import update
+    from src.persistence.tables import SapiRunLedger
+
+    pages = _chain(4, shows=lambda i: [_show(str(i), f"T{i}")])
+    make_worker(FakeClient(pages)).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                                                options=BackfillOptions(max_pages=2))
+    with db_manager.get_session() as session, session.begin():
+        session.execute(update(SapiRunLedger).values(cursor_next=None))
+
+    client = FakeClient(pages)
+    make_worker(client).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                                     options=BackfillOptions(replay_raw=True))
+
+    assert [c for c, _ in client.calls] == ["c2", "c3"]
+    assert not client.calls[0][1].startswith("sapi-prefetch")
+    with db_manager.get_session() as session:
+        row = SapiRunLedgerStore(session).get("run-1")
+        assert (row.status, row.pages_processed, row.items_processed) == (STATUS_COMPLETED, 4, 4)
+        assert len(session.execute(select(SapiRawPage.id)).all()) == 4
+
+def test_new_runs_never_look_up_stored_pages(make_worker, monkeypatch):
+    # Logic: Without a caller-supplied run_id (or without opting into replay_raw) there is nothing to replay.
+    from src.persistence.stores.raw import SapiRawPagesStore
+
+    lookups = []
+    monkeypatch.setattr(SapiRawPagesStore, "get_page", lambda self, **kw: lookups.append(kw))
+    make_worker(FakeClient(_chain(2))).run_backfill(scope=SCOPE, base_query_params={},
+                                                    options=BackfillOptions(replay_raw=True))
+    make_worker(FakeClient(_chain(2))).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1")
+
+    assert lookups == []
+
+def test_completed_run_is_not_replayed(make_worker, db_manager):
+    # Logic: Replaying a COMPLETED run would double-count its pages, so it is refused and the row is left as is.
+    make_worker(FakeClient(_chain(2))).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1")
+    with db_manager.get_session() as session:
+        before = SapiRunLedgerStore(session).get("run-1")
+
+    client = FakeClient(_chain(2))
+    with pytest.raises(ValueError, match="already completed"):
+        make_worker(client).run_backfill(scope=SCOPE, base_query_params={}, run_id="run-1",
+                                         options=BackfillOptions(replay_raw=True))
+
+    assert client.calls == []
+    with db_manager.get_session() as session:
+        after = SapiRunLedgerStore(session).get("run-1")
+        assert (after.status, after.pages_processed, after.ended_at) == (
+            STATUS_COMPLETED, before.pages_processed, before.ended_at)